@@ -2,12 +2,23 @@ import os
 from datetime import datetime
 from pydantic_settings import BaseSettings
 
+
+class _Dynamic:
+    """ 접근할 때마다 값을 계산하는 클래스 속성 (import 시점에 날짜가 고정되지 않도록) """
+
+    def __init__(self, func):
+        self.func = func
+
+    def __get__(self, obj, owner):
+        return self.func(owner)
+
+
 class PathConfig:
     # ---------------------------
-    # 📅 날짜 및 결과 디렉토리 설정
+    # 📅 날짜 및 결과 디렉토리 설정 (접근 시점의 날짜 기준)
     # ---------------------------
-    TODAY = datetime.now().strftime("%Y%m%d")
-    RESULT_DIR = os.path.join("results", f"result_{TODAY}")
+    TODAY = _Dynamic(lambda cls: datetime.now().strftime("%Y%m%d"))
+    RESULT_DIR = _Dynamic(lambda cls: os.path.join("results", f"result_{cls.TODAY}"))
 
     # ---------------------------
     # 📄 로그 파일명 정의
@@ -23,9 +34,29 @@ class PathConfig:
     # ---------------------------
     # 📁 전체 경로 (선택)
     # ---------------------------
-    PATH_SCORE_LOG = os.path.join(RESULT_DIR, TXT_SCORE_LOG)
-    PATH_TRADING_LOG = os.path.join(RESULT_DIR, TXT_TRADING_LOG)
-    PATH_BACKTEST_LOG = os.path.join(RESULT_DIR, TXT_BACKTEST_LOG)
+    PATH_SCORE_LOG = _Dynamic(lambda cls: os.path.join(cls.RESULT_DIR, cls.TXT_SCORE_LOG))
+    PATH_TRADING_LOG = _Dynamic(lambda cls: os.path.join(cls.RESULT_DIR, cls.TXT_TRADING_LOG))
+    PATH_BACKTEST_LOG = _Dynamic(lambda cls: os.path.join(cls.RESULT_DIR, cls.TXT_BACKTEST_LOG))
+
+    # ---------------------------
+    # 💾 OHLCV 데이터 캐시 디렉토리
+    # ---------------------------
+    CACHE_DIR = os.path.join("data_cache", "ohlcv")
+
+    # ---------------------------
+    # 🗃️ 유니버스 바 저장소 (공통 캘린더 × 종목 메모리 맵)
+    # ---------------------------
+    BAR_STORE_DIR = os.path.join("data_cache", "bars")
+
+    # ---------------------------
+    # 🗄️ 실행 결과 저장소 (Parquet, 날짜/실행과 무관하게 누적)
+    # ---------------------------
+    RESULT_STORE_DIR = os.path.join("results", "store")
+
+    # ---------------------------
+    # 🧾 실행 레지스트리 (run_id별 파라미터/데이터 지문/소요 시간, 모든 실행 공유)
+    # ---------------------------
+    RUN_REGISTRY_PATH = os.path.join("results", "runs.sqlite")
 
 
 
@@ -45,9 +76,37 @@ class BacktestConfig(BaseSettings):
     # yfinance 데이터 fetch용 (이건 SMA 등 계산 고려한 기간 포함)
     FETCH_START: str = "2019-06-01"
 
+    # 유니버스(다종목) 백테스트
+    UNIVERSE: str = ""          # 콤마로 구분한 종목 코드 (예: "AAPL,MSFT,ORCL")
+    UNIVERSE_FILE: str = ""     # 종목 코드 파일 경로 (한 줄에 하나, 또는 symbol 컬럼이 있는 CSV)
+    UNIVERSE_WORKERS: int = 0   # 병렬 워커 수 (0이면 CPU 코어 수)
+    UNIVERSE_PREFETCH: int = 8  # 동시에 로드할 종목 데이터 수
+
     class Config:
         env_file = ".env"
         env_file_encoding = "utf-8"
 
 
-backtesting_config = BacktestConfig()
\ No newline at end of file
+class _LazySettings:
+    """ 첫 속성 접근 시 설정 객체를 생성 (.env 읽기를 import 시점이 아닌 사용 시점으로 미룸) """
+
+    def __init__(self, factory):
+        object.__setattr__(self, "_factory", factory)
+        object.__setattr__(self, "_settings", None)
+
+    def _get(self):
+        if self._settings is None:
+            object.__setattr__(self, "_settings", self._factory())
+        return self._settings
+
+    def __getattr__(self, name):
+        return getattr(self._get(), name)
+
+    def __setattr__(self, name, value):
+        setattr(self._get(), name, value)
+
+    def __delattr__(self, name):
+        delattr(self._get(), name)
+
+
+backtesting_config = _LazySettings(BacktestConfig)
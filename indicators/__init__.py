@@ -20,6 +20,11 @@ from .advanced.rsi import RSI
 디렉토리 구조:
 - base/      → 단순 지표 (SMA, EMA 등)
 - advanced/  → 고급 지표 (MACD, RSI, ADX, BollingerBands 등)
+- incremental/ → 위 지표들의 증분(스트리밍) 계산 클래스 (update(bar)마다 O(1) 갱신)
+- cache.py   → 지표 계산 결과 공유 캐시 (지표, 파라미터, 데이터 지문 기준 LRU)
+- kernels.py → EMA/ATR/ADX/RSI, rolling 평균/표준편차 단일 루프 커널 (numba 설치 시 컴파일)
+- arrays.py  → pandas 없이 ndarray 입력/출력하는 지표 API (out= 버퍼, float32/float64)
+- panel.py   → 2차원(시간 × 종목) 입력 지원 (wide DataFrame으로 전 종목 한 번에 계산)
 
 각 지표는 전략에서 독립적으로 호출 가능하며,
 보조 해석/판단 로직은 별도의 signals/ 모듈에서 관리됩니다.
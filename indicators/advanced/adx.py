@@ -1,6 +1,11 @@
 import pandas as pd
+from indicators import kernels
 from indicators.base import ATR
+from indicators.cache import cached_indicator
+from indicators.panel import panel_indicator, to_pandas
 
+@cached_indicator("ADX")
+@panel_indicator
 def ADX(high, low, close, period=14):
     """
     ADX (Average Directional Index) 계산 함수
@@ -27,9 +32,13 @@ def ADX(high, low, close, period=14):
         Series: ADX 값 (pandas.Series)
     """
 
-    high = pd.Series(high)
-    low = pd.Series(low)
-    close = pd.Series(close)
+    high = to_pandas(high)
+    low = to_pandas(low)
+    close = to_pandas(close)
+
+    if kernels.USE_KERNELS:
+        # DM -> ATR -> DI -> DX -> ADX를 한 번의 루프로 계산 (indicators/kernels.py)
+        return kernels.run(kernels.adx_kernel, high, low, close, params=(period,))
 
     # 1. DM+ / DM- 계산 (Directional Movement)
     up_move = high.diff()
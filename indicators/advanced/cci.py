@@ -1,5 +1,9 @@
 import pandas as pd
+from indicators.cache import cached_indicator
+from indicators.panel import panel_indicator, to_pandas
 
+@cached_indicator("CCI")
+@panel_indicator
 def CCI(high, low, close, window=14):
     """
     CCI (Commodity Channel Index) 계산
@@ -12,8 +16,8 @@ def CCI(high, low, close, window=14):
     :return: CCI 시리즈
     """
     tp = (high + low + close) / 3
-    sma = pd.Series(tp).rolling(window=window).mean()
-    mean_dev = (pd.Series(tp) - sma).abs().rolling(window=window).mean()
+    sma = to_pandas(tp).rolling(window=window).mean()
+    mean_dev = (to_pandas(tp) - sma).abs().rolling(window=window).mean()
     cci = (tp - sma) / (0.015 * mean_dev)
     
     return cci
@@ -1,11 +1,17 @@
 from indicators.base.ema import EMA
 import pandas as pd
+from indicators.cache import cached_indicator
+from indicators.panel import is_panel, panel_indicator, to_pandas
 
+@cached_indicator("MACD")
+@panel_indicator
 def MACD(close, fast=12, slow=26):
     """MACD 본체 계산"""
     return EMA(close, fast) - EMA(close, slow)
 
 
+@cached_indicator("MACD_and_signal")
+@panel_indicator
 def MACD_and_signal(close, fast=12, slow=26, signal_period=9):
     """MACD + Signal line 반환"""
     macd = MACD(close, fast, slow)
@@ -13,11 +19,15 @@ def MACD_and_signal(close, fast=12, slow=26, signal_period=9):
     return macd, signal
 
 
+@cached_indicator("MACD_histogram")
+@panel_indicator
 def MACD_histogram(close, fast=12, slow=26, signal_period=9):
     """MACD 히스토그램 반환"""
     macd, signal = MACD_and_signal(close, fast, slow, signal_period)
     return macd - signal
 
+@cached_indicator("MACD_signal_crossover")
+@panel_indicator
 def MACD_signal_crossover(close, fast=12, slow=26, signal_period=9):
     """
     MACD와 Signal line의 크로스오버 포인트 반환
@@ -26,7 +36,11 @@ def MACD_signal_crossover(close, fast=12, slow=26, signal_period=9):
     -1 : 데드 크로스 (Signal line을 위에서 아래로 하향 돌파)
     """
     macd, signal = MACD_and_signal(close, fast, slow, signal_period)
-    crossover = pd.Series(0, index=close.index)
+    close = to_pandas(close)
+    if is_panel(close):
+        crossover = pd.DataFrame(0, index=close.index, columns=close.columns)
+    else:
+        crossover = pd.Series(0, index=close.index)
     crossover[(macd.shift(1) < signal.shift(1)) & (macd > signal)] = 1  # Bullish crossover
     crossover[(macd.shift(1) > signal.shift(1)) & (macd < signal)] = -1 # Bearish crossover
     
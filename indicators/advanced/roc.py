@@ -1,5 +1,9 @@
 import pandas as pd
+from indicators.cache import cached_indicator
+from indicators.panel import panel_indicator, to_pandas
 
+@cached_indicator("ROC")
+@panel_indicator
 def ROC(close, window=14):
     """
     ROC (Rate of Change) 계산
@@ -8,7 +12,7 @@ def ROC(close, window=14):
     현재 가격과 n일 전 가격의 비율을 계산하여 주가의 변동성을 나타냄(모멘텀 기반 방향성 지표)
     :return: ROC 시리즈
     """
-    close = pd.Series(close)
+    close = to_pandas(close)
     # 현재 가격과 n일 전 가격의 비율 계산
     roc = (close - close.shift(window)) / close.shift(window) * 100
     
@@ -1,10 +1,19 @@
 import pandas as pd
+from indicators import kernels
+from indicators.cache import cached_indicator
+from indicators.panel import panel_indicator, to_pandas
 
+@cached_indicator("RSI")
+@panel_indicator
 def RSI(values, window=14):
     """RSI 계산"""
     """ values: 종가 시계열 데이터 """
     """ window: RSI 계산 기간(일반적으로 14일 사용) """
-    delta = pd.Series(values).diff()    # 종가 차이 계산
+    values = to_pandas(values)
+    if kernels.USE_KERNELS:
+        return kernels.run(kernels.rsi_kernel, values, params=(window,), name=getattr(values, "name", None))
+
+    delta = values.diff()    # 종가 차이 계산
     gain = (delta.where(delta > 0, 0))
     loss = (-delta.where(delta < 0, 0))
     avg_gain = gain.rolling(window=window).mean()   # 직전 window일간의 평균 상승폭
@@ -0,0 +1,296 @@
+import numpy as np
+
+from indicators import kernels
+from indicators.advanced.adx import ADX
+from indicators.advanced.bollinger import BollingerBands
+from indicators.advanced.cci import CCI
+from indicators.advanced.macd import MACD, MACD_and_signal, MACD_histogram, MACD_signal_crossover
+from indicators.advanced.roc import ROC
+from indicators.advanced.rsi import RSI
+from indicators.base.atr import ATR
+from indicators.base.ema import EMA
+from indicators.base.sma import SMA
+from indicators.cache import cached_indicator
+from indicators.panel import to_pandas
+
+
+"""
+🧮 arrays
+
+pandas를 거치지 않는 ndarray 입력 / ndarray 출력 지표 API
+- 입력: 1차원 배열(시간) 또는 2차원 배열(시간 × 종목). Series/DataFrame/_Array도 np.asarray로 복사 없이 받습니다.
+- out=: 미리 할당한 결과 배열 (입력과 같은 shape). 지정하면 결과를 그 배열에 기록하고 out을 그대로 반환합니다.
+  (out을 지정한 호출은 지표 캐시를 거치지 않음)
+- dtype=: 결과 dtype (float64 또는 float32). 기본값은 out의 dtype, out이 없으면 입력이 모두 float32일 때 float32, 그 외 float64
+  float32 결과는 메모리를 절반만 사용하며, 중간 계산은 float64로 하고 기록할 때만 변환합니다.
+
+계산 규칙은 같은 이름의 pandas 함수(EMA, SMA, ATR, ...)와 같고, float64 결과는 상대오차 kernels.KERNEL_RTOL(1e-9) 이내로 일치합니다.
+(연산 순서가 다를 수 있으므로 비트 단위 동일은 보장하지 않음. float32 결과는 float32 반올림 오차만큼 추가로 차이남)
+2차원 입력은 panel_indicator와 같이 종목별 첫 유효 바부터 계산합니다. (상장 이전 구간은 NaN)
+numba가 없으면(kernels.USE_KERNELS=False) pandas 함수로 계산한 뒤 결과를 out에 복사합니다.
+"""
+
+FLOAT_DTYPES = (np.dtype(np.float64), np.dtype(np.float32))
+
+
+def _as_input(values) -> np.ndarray:
+    """ 입력을 복사 없이 ndarray로 변환 (float32/float64가 아니면 float64로 변환) """
+    arr = np.asarray(values)
+    if arr.dtype not in FLOAT_DTYPES:
+        arr = arr.astype(np.float64)
+    if arr.ndim not in (1, 2):
+        raise ValueError(f"1차원 또는 2차원 배열만 지원합니다: ndim={arr.ndim}")
+    return arr
+
+
+def _result_dtype(inputs, out, dtype) -> np.dtype:
+    if dtype is not None:
+        dtype = np.dtype(dtype)
+    elif out is not None:
+        dtype = np.asarray(out[0] if isinstance(out, tuple) else out).dtype
+    elif all(x.dtype == np.float32 for x in inputs):
+        dtype = np.dtype(np.float32)
+    else:
+        dtype = np.dtype(np.float64)
+
+    if dtype not in FLOAT_DTYPES:
+        raise ValueError(f"dtype은 float64 또는 float32여야 합니다: {dtype}")
+    return dtype
+
+
+def _outputs(like: np.ndarray, out, count: int, dtype: np.dtype) -> tuple:
+    """ 결과 배열 count개 (out이 없으면 like와 같은 shape/메모리 순서로 할당, 있으면 shape/dtype 확인) """
+    if out is None:
+        return tuple(np.empty_like(like, dtype=dtype) for _ in range(count))
+
+    outs = out if isinstance(out, tuple) else (out,)
+    if len(outs) != count:
+        raise ValueError(f"out은 결과 배열 {count}개여야 합니다: {len(outs)}개")
+    for o in outs:
+        if not isinstance(o, np.ndarray) or o.shape != like.shape or o.dtype != dtype:
+            raise ValueError(
+                f"out은 shape {like.shape}, dtype {dtype}의 ndarray여야 합니다: "
+                f"{type(o).__name__} {getattr(o, 'shape', None)} {getattr(o, 'dtype', None)}"
+            )
+    return outs
+
+
+def _first_valid(columns) -> int:
+    """ 모든 입력이 유효(NaN 아님)한 첫 위치 (없으면 길이) """
+    valid = ~np.isnan(columns[0])
+    for col in columns[1:]:
+        valid &= ~np.isnan(col)
+    return int(valid.argmax()) if valid.any() else valid.shape[0]
+
+
+def _apply(compute, inputs, params, outs, fill=np.nan):
+    """
+    compute(*inputs, *params, *outs)를 1차원 배열 단위로 실행
+    - 2차원 입력은 컬럼(종목)별로, 첫 유효 바 이후 구간의 뷰에 대해 실행하고 앞 구간은 fill로 채움
+    """
+    kernels._enable_cache()
+    if inputs[0].ndim == 1:
+        compute(*inputs, *params, *outs)
+        return
+
+    for j in range(inputs[0].shape[1]):
+        columns = [x[:, j] for x in inputs]
+        f = _first_valid(columns)
+        compute(*(col[f:] for col in columns), *params, *(o[f:, j] for o in outs))
+        for o in outs:
+            o[:f, j] = fill
+
+
+def _via_pandas(func, inputs, params, outs):
+    """ numba가 없을 때: pandas 함수(캐시 미사용)로 계산하여 outs에 복사 """
+    result = func.uncached(*(to_pandas(x) for x in inputs), *params)
+    results = result if isinstance(result, tuple) else (result,)
+    for o, r in zip(outs, results):
+        r = r.to_numpy(dtype=np.float64)
+        if o.dtype.kind != "f":
+            r = np.nan_to_num(r)
+        np.copyto(o, r, casting="unsafe")
+
+
+def _indicator(pandas_func, compute, inputs, params, out, dtype, count=1):
+    """ 공통 처리: 입력 변환 -> 결과 배열 준비 -> 커널(또는 pandas) 계산 """
+    inputs = [_as_input(x) for x in inputs]
+    if any(x.shape != inputs[0].shape for x in inputs[1:]):
+        raise ValueError(f"입력 배열의 shape이 서로 다릅니다: {[x.shape for x in inputs]}")
+
+    outs = _outputs(inputs[0], out, count, _result_dtype(inputs, out, dtype))
+    if kernels.USE_KERNELS:
+        _apply(compute, inputs, params, outs)
+    else:
+        _via_pandas(pandas_func, inputs, params, outs)
+    return outs if count > 1 else outs[0]
+
+
+# 📌 1차원 계산 함수 (중간 결과는 float64 임시 배열)
+def _sma_1d(values, window, out):
+    kernels.rolling_mean_into(values, window, window, out)
+
+
+def _roc_1d(close, window, out):
+    n = close.shape[0]
+    shift = min(window, n)
+    out[:shift] = np.nan
+    prev = close[:n - shift]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        out[shift:] = np.subtract(close[shift:], prev, dtype=np.float64) / prev * 100
+
+
+def _cci_1d(high, low, close, window, out):
+    tp = np.add(high, low, dtype=np.float64)
+    tp += close
+    tp /= 3
+    sma = np.empty_like(tp)
+    kernels.rolling_mean_into(tp, window, window, sma)
+    deviation = tp - sma
+    mean_dev = np.empty_like(tp)
+    kernels.rolling_mean_into(np.abs(deviation), window, window, mean_dev)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        out[:] = deviation / (0.015 * mean_dev)
+
+
+def _bollinger_1d(values, window, num_std, middle, upper, lower):
+    sma = np.empty(values.shape[0])
+    std = np.empty(values.shape[0])
+    kernels.rolling_mean_into(values, window, window, sma)
+    kernels.rolling_std_into(values, window, window, 1, std)
+    std *= num_std
+    middle[:] = sma
+    upper[:] = sma + std
+    lower[:] = sma - std
+
+
+def _macd_1d(close, fast, slow):
+    fast_ema = np.empty(close.shape[0])
+    slow_ema = np.empty(close.shape[0])
+    kernels.ema_into(close, fast, fast_ema)
+    kernels.ema_into(close, slow, slow_ema)
+    fast_ema -= slow_ema
+    return fast_ema
+
+
+def _macd_and_signal_1d(close, fast, slow, signal_period):
+    macd = _macd_1d(close, fast, slow)
+    signal = np.empty_like(macd)
+    kernels.ema_into(macd, signal_period, signal)
+    return macd, signal
+
+
+def _macd_into(close, fast, slow, out):
+    out[:] = _macd_1d(close, fast, slow)
+
+
+def _macd_and_signal_into(close, fast, slow, signal_period, macd_out, signal_out):
+    macd, signal = _macd_and_signal_1d(close, fast, slow, signal_period)
+    macd_out[:] = macd
+    signal_out[:] = signal
+
+
+def _macd_histogram_into(close, fast, slow, signal_period, out):
+    macd, signal = _macd_and_signal_1d(close, fast, slow, signal_period)
+    out[:] = macd - signal
+
+
+def _macd_crossover_into(close, fast, slow, signal_period, out):
+    macd, signal = _macd_and_signal_1d(close, fast, slow, signal_period)
+    out[:] = 0
+    if macd.shape[0] > 1:
+        prev_macd, prev_signal, cur_macd, cur_signal = macd[:-1], signal[:-1], macd[1:], signal[1:]
+        out[1:][(prev_macd < prev_signal) & (cur_macd > cur_signal)] = 1      # 골든 크로스
+        out[1:][(prev_macd > prev_signal) & (cur_macd < cur_signal)] = -1     # 데드 크로스
+
+
+# 📌 공개 API
+@cached_indicator("arrays.sma")
+def sma(values, window, out=None, dtype=None):
+    """ 단순 이동평균 (SMA와 동일) """
+    return _indicator(SMA, _sma_1d, [values], (window,), out, dtype)
+
+
+@cached_indicator("arrays.ema")
+def ema(values, window, out=None, dtype=None):
+    """ 지수 이동평균 (EMA와 동일) """
+    return _indicator(EMA, kernels.ema_into, [values], (window,), out, dtype)
+
+
+@cached_indicator("arrays.atr")
+def atr(high, low, close, window=14, out=None, dtype=None):
+    """ ATR (ATR과 동일) """
+    return _indicator(ATR, kernels.atr_into, [high, low, close], (window,), out, dtype)
+
+
+@cached_indicator("arrays.adx")
+def adx(high, low, close, period=14, out=None, dtype=None):
+    """ ADX (ADX와 동일) """
+    return _indicator(ADX, kernels.adx_into, [high, low, close], (period,), out, dtype)
+
+
+@cached_indicator("arrays.rsi")
+def rsi(values, window=14, out=None, dtype=None):
+    """ RSI (RSI와 동일) """
+    return _indicator(RSI, kernels.rsi_into, [values], (window,), out, dtype)
+
+
+@cached_indicator("arrays.roc")
+def roc(close, window=14, out=None, dtype=None):
+    """ ROC (ROC와 동일) """
+    return _indicator(ROC, _roc_1d, [close], (window,), out, dtype)
+
+
+@cached_indicator("arrays.cci")
+def cci(high, low, close, window=14, out=None, dtype=None):
+    """ CCI (CCI와 동일) """
+    return _indicator(CCI, _cci_1d, [high, low, close], (window,), out, dtype)
+
+
+@cached_indicator("arrays.bollinger_bands")
+def bollinger_bands(values, window=20, num_std=2, out=None, dtype=None):
+    """
+    볼린저밴드 (BollingerBands와 동일)
+    :param out: (middle, upper, lower) 결과 배열 튜플
+    :return: (middle, upper, lower)
+    """
+    return _indicator(BollingerBands, _bollinger_1d, [values], (window, num_std), out, dtype, count=3)
+
+
+@cached_indicator("arrays.macd")
+def macd(close, fast=12, slow=26, out=None, dtype=None):
+    """ MACD 본체 (MACD와 동일) """
+    return _indicator(MACD, _macd_into, [close], (fast, slow), out, dtype)
+
+
+@cached_indicator("arrays.macd_and_signal")
+def macd_and_signal(close, fast=12, slow=26, signal_period=9, out=None, dtype=None):
+    """
+    MACD + Signal line (MACD_and_signal과 동일)
+    :param out: (macd, signal) 결과 배열 튜플
+    """
+    return _indicator(MACD_and_signal, _macd_and_signal_into, [close], (fast, slow, signal_period), out, dtype, count=2)
+
+
+@cached_indicator("arrays.macd_histogram")
+def macd_histogram(close, fast=12, slow=26, signal_period=9, out=None, dtype=None):
+    """ MACD 히스토그램 (MACD_histogram과 동일) """
+    return _indicator(MACD_histogram, _macd_histogram_into, [close], (fast, slow, signal_period), out, dtype)
+
+
+@cached_indicator("arrays.macd_signal_crossover")
+def macd_signal_crossover(close, fast=12, slow=26, signal_period=9, out=None):
+    """
+    MACD와 Signal line의 크로스오버 (MACD_signal_crossover와 동일, int64 결과)
+    0: 없음 / 1: 골든 크로스 / -1: 데드 크로스 (2차원 입력의 상장 이전 구간은 0)
+    """
+    close = _as_input(close)
+    outs = out if out is not None else np.zeros(close.shape, dtype=np.int64)
+    if not isinstance(outs, np.ndarray) or outs.shape != close.shape or outs.dtype.kind != "i":
+        raise ValueError(f"out은 shape {close.shape}의 정수 ndarray여야 합니다")
+
+    if kernels.USE_KERNELS:
+        _apply(_macd_crossover_into, [close], (fast, slow, signal_period), (outs,), fill=0)
+    else:
+        _via_pandas(MACD_signal_crossover, [close], (fast, slow, signal_period), (outs,))
+    return outs
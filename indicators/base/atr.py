@@ -1,5 +1,11 @@
+import numpy as np
 import pandas as pd
+from indicators import kernels
+from indicators.cache import cached_indicator
+from indicators.panel import panel_indicator
 
+@cached_indicator("ATR")
+@panel_indicator
 def ATR(high: pd.Series, low: pd.Series, close: pd.Series, window: int = 14) -> pd.Series:
     """
     ATR (Average True Range) 계산
@@ -9,6 +15,9 @@ def ATR(high: pd.Series, low: pd.Series, close: pd.Series, window: int = 14) ->
     :param window: ATR 계산 윈도우 (기본값 14)
     :return: ATR 값 시리즈
     """
+    if kernels.USE_KERNELS:
+        return kernels.run(kernels.atr_kernel, high, low, close, params=(window,))
+
     # 이전 종가
     prev_close = close.shift(1)
 
@@ -17,7 +26,8 @@ def ATR(high: pd.Series, low: pd.Series, close: pd.Series, window: int = 14) ->
     tr2 = (high - prev_close).abs()
     tr3 = (low - prev_close).abs()
 
-    tr = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
+    # 세 값 중 최대값 (NaN 제외, 2차원 입력은 종목별로 계산)
+    tr = np.fmax(np.fmax(tr1, tr2), tr3)
 
     # ATR = TR의 이동 평균
     atr = tr.rolling(window=window, min_periods=1).mean()
@@ -1,5 +1,13 @@
 import pandas as pd
+from indicators import kernels
+from indicators.cache import cached_indicator
+from indicators.panel import panel_indicator, to_pandas
 
+@cached_indicator("EMA")
+@panel_indicator
 def EMA(values, window):
     """지수 이동평균 계산"""
-    return pd.Series(values).ewm(span=window, adjust=False).mean()
\ No newline at end of file
+    values = to_pandas(values)
+    if kernels.USE_KERNELS:
+        return kernels.run(kernels.ema_kernel, values, params=(window,), name=getattr(values, "name", None))
+    return values.ewm(span=window, adjust=False).mean()
\ No newline at end of file
@@ -1,5 +1,9 @@
 import pandas as pd
+from indicators.cache import cached_indicator
+from indicators.panel import panel_indicator, to_pandas
 
+@cached_indicator("SMA")
+@panel_indicator
 def SMA(values, window):
     """단순 이동평균 계산"""
-    return pd.Series(values).rolling(window=window).mean()
\ No newline at end of file
+    return to_pandas(values).rolling(window=window).mean()
\ No newline at end of file
@@ -0,0 +1,237 @@
+import functools
+import hashlib
+import inspect
+import threading
+import weakref
+from collections import Counter, OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from indicators import kernels
+
+
+class IndicatorCache:
+    """
+    지표 계산 결과 메모이제이션 레지스트리 (LRU)
+
+    - 키: (지표 이름, 계산 백엔드(kernels.USE_KERNELS), 파라미터, 입력 데이터 지문)
+      입력 데이터 지문은 값/dtype/shape와 (Series인 경우) 이름/인덱스의 해시이므로
+      같은 데이터셋에 같은 지표를 다시 요청하면 재계산 없이 결과를 돌려줍니다.
+    - 반환값은 캐시된 결과의 복사본이므로 호출 측에서 수정해도 캐시가 오염되지 않습니다.
+    - 항목 수(maxsize) 또는 결과 크기 합계(max_bytes)를 넘으면 가장 오래 사용되지 않은 결과부터 제거합니다.
+      (max_bytes보다 큰 결과는 저장하지 않음. 워커 프로세스마다 별도 인스턴스이므로 작게 유지)
+
+    제약: 인덱스가 지문에 포함되므로 같은 값이라도 Series(MarketRegimeEvaluator)와
+    ndarray/_Array(전략의 self.I) 입력은 서로 다른 항목입니다. (결과의 인덱스/이름이 입력을 따르기 때문)
+    공유는 같은 형태의 입력끼리만 일어납니다.
+    바마다 길이가 늘어나는 입력으로 호출하는 곳은 캐시를 채우기만 하므로 지표의 .uncached를 사용합니다.
+    """
+
+    def __init__(self, maxsize: int = 128, max_bytes: int = 64 * 2 ** 20, enabled: bool = True):
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.nbytes = 0                     # 저장된 결과 크기 합계
+        self.misses_by_name = Counter()     # 지표별 실제 계산 횟수
+        self._entries = OrderedDict()       # key -> (결과, 크기)
+        self._lock = threading.Lock()
+
+
+    def get_or_compute(self, key, compute):
+        """ key에 해당하는 결과를 반환하고, 없으면 compute()로 계산하여 저장합니다. """
+        if not self.enabled or key is None:
+            return compute()
+
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return _copy_result(self._entries[key][0])
+
+        result = compute()
+        nbytes = _result_nbytes(result)
+
+        with self._lock:
+            self.misses += 1
+            self.misses_by_name[key[0]] += 1
+            if nbytes > self.max_bytes:
+                return _copy_result(result)     # 너무 큰 결과는 저장하지 않음
+
+            if key in self._entries:            # 다른 스레드가 먼저 저장한 경우
+                self.nbytes -= self._entries[key][1]
+            self._entries[key] = (result, nbytes)
+            self._entries.move_to_end(key)
+            self.nbytes += nbytes
+            while len(self._entries) > self.maxsize or self.nbytes > self.max_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self.nbytes -= evicted
+                self.evictions += 1
+
+        return _copy_result(result)
+
+
+    def clear(self):
+        """ 저장된 결과와 통계를 모두 초기화합니다. """
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = self.nbytes = 0
+            self.misses_by_name.clear()
+
+
+    def stats(self) -> dict:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": len(self._entries),
+            "bytes": self.nbytes,
+            "hit_rate": self.hits / (self.hits + self.misses) if self.hits + self.misses else 0.0,
+        }
+
+
+def _copy_result(result):
+    if isinstance(result, tuple):
+        return tuple(_copy_result(r) for r in result)
+    if isinstance(result, (pd.Series, pd.DataFrame, np.ndarray)):
+        return result.copy()
+    return result
+
+
+def _result_nbytes(result) -> int:
+    """ 결과(배열/Series/DataFrame 또는 그 튜플)가 차지하는 메모리 (인덱스 포함, 얕은 크기) """
+    if isinstance(result, tuple):
+        return sum(_result_nbytes(r) for r in result)
+    if isinstance(result, np.ndarray):
+        return result.nbytes
+    if isinstance(result, pd.Series):
+        return int(result.memory_usage(index=True, deep=False))
+    if isinstance(result, pd.DataFrame):
+        return int(result.memory_usage(index=True, deep=False).sum())
+    return 0
+
+
+def _key_array(values) -> tuple:
+    """ 값/dtype/shape 캐시 키 (프로세스별 키가 있는 SipHash, blake2b보다 수 배 빠름. 프로세스 안에서만 유효) """
+    values = np.ascontiguousarray(values)
+    if values.dtype == object:
+        raise TypeError("object dtype은 지문을 만들 수 없습니다")
+    return values.dtype.str, values.shape, hash(values.tobytes())
+
+
+# 인덱스 캐시 키 메모 (pd.Index는 불변이므로 객체가 살아 있는 동안 키도 같음) id -> (weakref, 키)
+_index_keys = {}
+
+
+def _key_index(index: pd.Index) -> tuple:
+    if isinstance(index, pd.RangeIndex):
+        return "range", index.start, index.stop, index.step
+
+    entry = _index_keys.get(id(index))
+    if entry is not None and entry[0]() is index:
+        return entry[1]
+
+    if isinstance(index, pd.DatetimeIndex):
+        result = ("datetime", str(index.tz), _key_array(index.asi8))
+    else:
+        result = ("index", _key_array(pd.util.hash_pandas_object(index, index=False).to_numpy()))
+    key = id(index)
+    _index_keys[key] = (weakref.ref(index, lambda _: _index_keys.pop(key, None)), result)
+    return result
+
+
+def _cache_key(data) -> tuple:
+    """
+    입력 데이터의 캐시 키 (fingerprint와 같은 항목, 같은 프로세스 안에서만 유효)
+    - ndarray/list: 값, dtype, shape
+    - Series/DataFrame: 위 항목 + 인덱스 (+ Series 이름 / DataFrame 컬럼)
+    """
+    if isinstance(data, pd.DataFrame):
+        return "frame", tuple(data.columns), _key_array(data.to_numpy()), _key_index(data.index)
+    if isinstance(data, pd.Series):
+        return "series", data.name, _key_array(data.to_numpy()), _key_index(data.index)
+    return "array", _key_array(np.asarray(data))
+
+
+def _hash_array(h, values):
+    values = np.ascontiguousarray(values)
+    if values.dtype == object:
+        raise TypeError("object dtype은 지문을 만들 수 없습니다")
+    h.update(f"{values.dtype}{values.shape}".encode())
+    h.update(values.view(np.uint8).reshape(-1) if values.size else b"")
+
+
+def _hash_index(h, index: pd.Index):
+    if isinstance(index, pd.RangeIndex):
+        h.update(f"range{index.start},{index.stop},{index.step}".encode())
+    elif isinstance(index, pd.DatetimeIndex):
+        h.update(str(index.tz).encode())
+        _hash_array(h, index.asi8)
+    else:
+        _hash_array(h, pd.util.hash_pandas_object(index, index=False).to_numpy())
+
+
+def fingerprint(data) -> str:
+    """
+    입력 데이터의 지문(해시)을 계산합니다. (프로세스/실행 간에 같은 값, 실행 레지스트리 기록용)
+    - ndarray/list: 값, dtype, shape
+    - Series/DataFrame: 위 항목 + 인덱스 (+ DataFrame 컬럼)
+    """
+    h = hashlib.blake2b(digest_size=16)
+    if isinstance(data, pd.DataFrame):
+        h.update(repr(list(data.columns)).encode())
+        _hash_array(h, data.to_numpy())
+        _hash_index(h, data.index)
+    elif isinstance(data, pd.Series):
+        _hash_array(h, data.to_numpy())
+        _hash_index(h, data.index)
+    else:
+        _hash_array(h, np.asarray(data))
+    return h.hexdigest()
+
+
+def _is_data(value) -> bool:
+    return isinstance(value, (np.ndarray, pd.Series, pd.DataFrame, list))
+
+
+# 전역 인스턴스 (모든 지표 함수가 공유)
+indicator_cache = IndicatorCache()
+
+
+def cached_indicator(name: str):
+    """
+    지표 함수를 indicator_cache를 거치도록 감싸는 데코레이터
+    - 배열형 인자(ndarray, Series, DataFrame, list)는 데이터 지문으로, 나머지는 파라미터 값으로 키를 구성
+    - 해시할 수 없는 인자가 있거나 결과 배열(out=)을 지정한 호출은 캐시를 거치지 않고 바로 계산
+    """
+    def decorator(func):
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not indicator_cache.enabled:
+                return func(*args, **kwargs)
+
+            try:
+                bound = signature.bind(*args, **kwargs)
+                bound.apply_defaults()
+                if bound.arguments.get("out") is not None:
+                    key = None      # 결과를 out 배열에 직접 기록하는 호출
+                else:
+                    key = [name, kernels.USE_KERNELS]
+                    for arg_name, value in bound.arguments.items():
+                        key.append((arg_name, _cache_key(value) if _is_data(value) else value))
+                    key = tuple(key)
+                    hash(key)
+            except TypeError:
+                key = None
+
+            return indicator_cache.get_or_compute(key, lambda: func(*args, **kwargs))
+
+        wrapper.uncached = func
+        return wrapper
+
+    return decorator
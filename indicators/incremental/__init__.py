@@ -0,0 +1,32 @@
+from .sma import IncrementalSMA
+from .ema import IncrementalEMA
+from .atr import IncrementalATR
+from .rsi import IncrementalRSI
+from .macd import IncrementalMACD
+from .adx import IncrementalADX
+from .cci import IncrementalCCI
+from .roc import IncrementalROC
+from .bollinger import IncrementalBollingerBands
+
+"""
+📦 incremental
+
+base/, advanced/ 지표의 증분(스트리밍) 계산 버전을 정의합니다.
+배치 함수는 새 값이 들어올 때마다 전체 히스토리를 다시 계산하지만,
+여기의 클래스들은 필요한 상태(누적합, 링 버퍼, EMA 상태)만 유지하며
+update(bar) 호출마다 O(1)로 최신 값을 갱신합니다. (페이퍼/라이브 트레이딩용)
+
+각 클래스의 출력은 같은 이름의 배치 함수와 바 단위로 일치합니다.
+"""
+
+__all__ = [
+    "IncrementalSMA",
+    "IncrementalEMA",
+    "IncrementalATR",
+    "IncrementalRSI",
+    "IncrementalMACD",
+    "IncrementalADX",
+    "IncrementalCCI",
+    "IncrementalROC",
+    "IncrementalBollingerBands",
+]
@@ -0,0 +1,109 @@
+from collections import deque
+
+from indicators.kernels import (
+    _div, _ewm_step, _mean_add, _mean_remove, _rolling_mean_value,
+    _var_add, _var_remove, _rolling_std_value, python_kernel,
+)
+
+
+"""
+증분 지표의 공통 상태 클래스
+
+갱신 규칙은 indicators.kernels의 스텝 함수(_mean_add/_mean_remove, _var_add/_var_remove, _ewm_step, _div)를 그대로 사용합니다.
+배열 커널과 같은 코드이므로 결과도 pandas rolling/ewm과 같습니다.
+바마다 한 번씩 호출되므로 numba 디스패치 비용이 없는 순수 Python 버전(python_kernel)을 호출합니다.
+"""
+
+_div = python_kernel(_div)
+_ewm_step = python_kernel(_ewm_step)
+_mean_add = python_kernel(_mean_add)
+_mean_remove = python_kernel(_mean_remove)
+_rolling_mean_value = python_kernel(_rolling_mean_value)
+_var_add = python_kernel(_var_add)
+_var_remove = python_kernel(_var_remove)
+_rolling_std_value = python_kernel(_rolling_std_value)
+
+# NumPy/pandas와 동일한 0 나눗셈 처리 (x/0 -> ±inf, 0/0 -> NaN)
+safe_div = _div
+
+
+class RollingMean:
+    """
+    고정 길이 윈도우의 이동평균 (pandas rolling(window, min_periods).mean()과 동일)
+    - 링 버퍼 + kernels.rolling_mean_into와 같은 추가/제거 스텝으로 갱신 비용 O(1)
+    """
+
+    def __init__(self, window: int, min_periods: int = None):
+        self.window = window
+        self.min_periods = window if min_periods is None else min_periods
+        self._values = deque(maxlen=window)
+        self._reset(float("nan"))
+
+    def _reset(self, prev_value: float):
+        self._nobs = self._neg_ct = self._same_ct = 0
+        self._total = self._comp_add = self._comp_remove = 0.0
+        self._prev_value = prev_value
+
+    def update(self, x: float) -> float:
+        if not self._values or self.window <= 1:
+            # 첫 값(또는 윈도우 1)은 처음부터 다시 계산
+            self._reset(x)
+        elif len(self._values) == self.window:
+            self._nobs, self._total, self._comp_remove, self._neg_ct = _mean_remove(
+                self._values[0], self._nobs, self._total, self._comp_remove, self._neg_ct
+            )
+        self._values.append(x)
+        self._nobs, self._total, self._comp_add, self._neg_ct, self._same_ct, self._prev_value = _mean_add(
+            x, self._nobs, self._total, self._comp_add, self._neg_ct, self._same_ct, self._prev_value
+        )
+        return _rolling_mean_value(
+            self._total, self._nobs, self._neg_ct, self._same_ct, self._prev_value, self.min_periods
+        )
+
+
+class RollingStd:
+    """
+    고정 길이 윈도우의 표준편차 (pandas rolling(window, min_periods).std(ddof)와 동일)
+    - 링 버퍼 + kernels.rolling_std_into와 같은 Welford 추가/제거 스텝으로 갱신 비용 O(1)
+    """
+
+    def __init__(self, window: int, ddof: int = 1, min_periods: int = None):
+        self.window = window
+        self.ddof = ddof
+        self.min_periods = window if min_periods is None else min_periods
+        self._values = deque(maxlen=window)
+        self._reset(float("nan"))
+
+    def _reset(self, prev_value: float):
+        self._nobs = self._same_ct = 0
+        self._mean = self._ssqdm = self._comp_add = self._comp_remove = 0.0
+        self._prev_value = prev_value
+
+    def update(self, x: float) -> float:
+        if not self._values or self.window <= 1:
+            self._reset(x)
+        elif len(self._values) == self.window:
+            self._nobs, self._mean, self._ssqdm, self._comp_remove = _var_remove(
+                self._values[0], self._nobs, self._mean, self._ssqdm, self._comp_remove
+            )
+        self._values.append(x)
+        self._nobs, self._mean, self._ssqdm, self._comp_add, self._same_ct, self._prev_value = _var_add(
+            x, self._nobs, self._mean, self._ssqdm, self._comp_add, self._same_ct, self._prev_value
+        )
+        return _rolling_std_value(self._ssqdm, self._nobs, self._same_ct, self.min_periods, self.ddof)
+
+
+class ExponentialMean:
+    """
+    지수 가중 평균 (pandas ewm(span, adjust=False).mean()과 동일, kernels.ema_into와 같은 스텝)
+    - 첫 유효값부터 시작, 중간 NaN은 직전 값을 유지하되 가중치는 감쇠 (ignore_na=False)
+    """
+
+    def __init__(self, span: float):
+        self.alpha = 2.0 / (span + 1.0)
+        self._weighted = float("nan")
+        self._old_wt = 1.0
+
+    def update(self, x: float) -> float:
+        self._weighted, self._old_wt = _ewm_step(self._weighted, self._old_wt, x, self.alpha)
+        return self._weighted
@@ -0,0 +1,41 @@
+import math
+
+from ._rolling import ExponentialMean, safe_div
+from .atr import IncrementalATR
+
+
+class IncrementalADX:
+    """
+    ADX 증분 계산 (indicators.advanced.ADX와 바 단위 동일)
+    - 상태: 직전 고가/저가, ATR, DM+/DM-/DX 지수 평균
+    """
+
+    def __init__(self, period: int = 14):
+        self._atr = IncrementalATR(period)
+        self._plus_dm = ExponentialMean(period)
+        self._minus_dm = ExponentialMean(period)
+        self._adx = ExponentialMean(period)
+        self._prev_high = math.nan
+        self._prev_low = math.nan
+        self.plus_di = self.minus_di = self.value = math.nan
+
+    def update(self, high: float, low: float, close: float) -> float:
+        # 1. DM+ / DM- (Directional Movement)
+        up_move = high - self._prev_high
+        down_move = low - self._prev_low
+        self._prev_high, self._prev_low = high, low
+
+        plus_dm = up_move * ((up_move > down_move) and (up_move > 0))
+        minus_dm = down_move * ((down_move > up_move) and (down_move > 0))
+
+        # 2. ATR
+        atr = self._atr.update(high, low, close)
+
+        # 3. DI+ / DI-
+        self.plus_di = safe_div(100 * self._plus_dm.update(plus_dm), atr)
+        self.minus_di = safe_div(100 * self._minus_dm.update(minus_dm), atr)
+
+        # 4. DX -> ADX
+        dx = safe_div(abs(self.plus_di - self.minus_di), self.plus_di + self.minus_di) * 100
+        self.value = self._adx.update(dx)
+        return self.value
@@ -0,0 +1,26 @@
+import math
+
+from ._rolling import RollingMean
+
+
+class IncrementalATR:
+    """
+    ATR 증분 계산 (indicators.base.ATR와 바 단위 동일)
+    - 상태: 직전 종가 + True Range 이동평균 링 버퍼
+    """
+
+    def __init__(self, window: int = 14):
+        self._mean = RollingMean(window, min_periods=1)
+        self._prev_close = math.nan
+        self.value = math.nan
+
+    def true_range(self, high: float, low: float, close: float) -> float:
+        """ True Range (NaN 제외 최댓값, 모두 NaN이면 NaN) """
+        candidates = [v for v in (high - low, abs(high - self._prev_close), abs(low - self._prev_close)) if v == v]
+        return max(candidates) if candidates else math.nan
+
+    def update(self, high: float, low: float, close: float) -> float:
+        tr = self.true_range(high, low, close)
+        self._prev_close = close
+        self.value = self._mean.update(tr)
+        return self.value
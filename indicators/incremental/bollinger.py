@@ -0,0 +1,21 @@
+from ._rolling import RollingMean, RollingStd
+
+
+class IncrementalBollingerBands:
+    """
+    볼린저밴드 증분 계산 (indicators.advanced.BollingerBands와 바 단위 동일)
+    - update()는 (sma, upper_band, lower_band)를 반환
+    """
+
+    def __init__(self, window: int = 20, num_std: float = 2):
+        self.num_std = num_std
+        self._sma = RollingMean(window)
+        self._std = RollingStd(window)
+        self.sma = self.upper_band = self.lower_band = float("nan")
+
+    def update(self, value: float):
+        self.sma = self._sma.update(value)
+        std = self._std.update(value)
+        self.upper_band = self.sma + (std * self.num_std)
+        self.lower_band = self.sma - (std * self.num_std)
+        return self.sma, self.upper_band, self.lower_band
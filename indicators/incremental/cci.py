@@ -0,0 +1,20 @@
+from ._rolling import RollingMean, safe_div
+
+
+class IncrementalCCI:
+    """
+    CCI 증분 계산 (indicators.advanced.CCI와 바 단위 동일)
+    - 상태: Typical Price 이동평균 + 평균 편차 이동평균 링 버퍼
+    """
+
+    def __init__(self, window: int = 14):
+        self._sma = RollingMean(window)
+        self._mean_dev = RollingMean(window)
+        self.value = float("nan")
+
+    def update(self, high: float, low: float, close: float) -> float:
+        tp = (high + low + close) / 3
+        sma = self._sma.update(tp)
+        mean_dev = self._mean_dev.update(abs(tp - sma))
+        self.value = safe_div(tp - sma, 0.015 * mean_dev)
+        return self.value
@@ -0,0 +1,13 @@
+from ._rolling import ExponentialMean
+
+
+class IncrementalEMA:
+    """ 지수 이동평균 증분 계산 (indicators.base.EMA와 바 단위 동일) """
+
+    def __init__(self, window: int):
+        self._ema = ExponentialMean(window)
+        self.value = float("nan")
+
+    def update(self, value: float) -> float:
+        self.value = self._ema.update(value)
+        return self.value
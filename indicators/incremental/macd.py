@@ -0,0 +1,20 @@
+from ._rolling import ExponentialMean
+
+
+class IncrementalMACD:
+    """
+    MACD 증분 계산 (indicators.advanced.MACD_and_signal과 바 단위 동일)
+    - update()는 (macd, signal)을 반환, histogram 속성에 MACD - Signal 보관
+    """
+
+    def __init__(self, fast: int = 12, slow: int = 26, signal_period: int = 9):
+        self._fast = ExponentialMean(fast)
+        self._slow = ExponentialMean(slow)
+        self._signal = ExponentialMean(signal_period)
+        self.macd = self.signal = self.histogram = float("nan")
+
+    def update(self, close: float):
+        self.macd = self._fast.update(close) - self._slow.update(close)
+        self.signal = self._signal.update(self.macd)
+        self.histogram = self.macd - self.signal
+        return self.macd, self.signal
@@ -0,0 +1,22 @@
+import math
+from collections import deque
+
+from ._rolling import safe_div
+
+
+class IncrementalROC:
+    """
+    ROC 증분 계산 (indicators.advanced.ROC와 바 단위 동일)
+    - 상태: 최근 window개 종가 링 버퍼
+    """
+
+    def __init__(self, window: int = 14):
+        self.window = window
+        self._history = deque(maxlen=window)
+        self.value = math.nan
+
+    def update(self, close: float) -> float:
+        past = self._history[0] if len(self._history) == self.window else math.nan
+        self._history.append(close)
+        self.value = safe_div(close - past, past) * 100
+        return self.value
@@ -0,0 +1,30 @@
+import math
+
+from ._rolling import RollingMean, safe_div
+
+
+class IncrementalRSI:
+    """
+    RSI 증분 계산 (indicators.advanced.RSI와 바 단위 동일)
+    - 상태: 직전 종가 + 상승폭/하락폭 이동평균 링 버퍼
+    """
+
+    def __init__(self, window: int = 14):
+        self._avg_gain = RollingMean(window)
+        self._avg_loss = RollingMean(window)
+        self._prev = math.nan
+        self.value = math.nan
+
+    def update(self, value: float) -> float:
+        delta = value - self._prev
+        self._prev = value
+
+        # NaN 변화량은 0으로 처리 (pandas where와 동일)
+        gain = delta if delta > 0 else 0.0
+        loss = -delta if delta < 0 else 0.0
+        avg_gain = self._avg_gain.update(gain)
+        avg_loss = self._avg_loss.update(loss)
+
+        rs = safe_div(avg_gain, avg_loss)
+        self.value = 100 - safe_div(100, 1 + rs)
+        return self.value
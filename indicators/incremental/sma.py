@@ -0,0 +1,13 @@
+from ._rolling import RollingMean
+
+
+class IncrementalSMA:
+    """ 단순 이동평균 증분 계산 (indicators.base.SMA와 바 단위 동일) """
+
+    def __init__(self, window: int):
+        self._mean = RollingMean(window)
+        self.value = float("nan")
+
+    def update(self, value: float) -> float:
+        self.value = self._mean.update(value)
+        return self.value
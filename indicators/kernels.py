@@ -0,0 +1,415 @@
+import math
+
+import numpy as np
+import pandas as pd
+
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:     # numba 미설치 -> 순수 Python/NumPy 커널 사용
+    njit = None
+    HAS_NUMBA = False
+
+
+"""
+⚙️ kernels
+
+재귀형 지표(EMA, ATR, ADX/DI, RSI)와 rolling 평균/표준편차를 배열 위에서 한 번의 루프로 계산하는 커널 모음입니다.
+- numba가 설치되어 있으면 @njit으로 컴파일되고, 없으면 동일한 코드가 순수 Python 함수로 동작합니다.
+- 중간 Series를 만들지 않고, 고정 크기 링 버퍼(window)만 사용합니다.
+- 계산 규칙은 pandas(ewm(adjust=False), rolling().mean())와 동일합니다.
+  (누적 합의 보정 순서까지 맞췄으므로 결과 차이는 부동소수점 오차 수준, 상대오차 1e-9 이내)
+- X_into(..., out)는 미리 할당한 out(float64 또는 float32)에 결과를 기록하고, X_kernel(...)은 새 float64 배열을 반환합니다.
+  (중간 계산은 항상 float64 스칼라로 하고 기록할 때만 out의 dtype으로 변환)
+
+indicators의 공개 함수(EMA, ATR, ADX, RSI)는 USE_KERNELS가 True이면 자동으로 이 커널을 사용합니다.
+스텝 함수(_mean_add/_mean_remove, _var_add/_var_remove, _ewm_step, _div)는 증분 지표(indicators.incremental)와 공유합니다.
+numba가 없을 때 순수 Python 루프는 pandas보다 느리므로 기본값은 HAS_NUMBA를 따릅니다.
+
+컴파일 결과의 디스크 캐시(__pycache__)는 import 시점이 아니라 run()의 첫 호출 시 활성화합니다.
+(njit(cache=True)는 데코레이터 적용 시점에 캐시 디렉토리를 만들고 쓰기 가능 여부를 확인하므로)
+"""
+
+USE_KERNELS = HAS_NUMBA
+
+# 커널과 pandas 구현의 허용 오차 (상대오차)
+KERNEL_RTOL = 1e-9
+
+
+_jitted = []            # 디스크 캐시를 활성화할 컴파일 함수 목록
+_cache_enabled = False
+
+
+def _jit(func):
+    """ numba가 있으면 njit으로 컴파일 (0으로 나누기는 NumPy처럼 inf/NaN 반환) """
+    if HAS_NUMBA:
+        dispatcher = njit(nogil=True, error_model="numpy")(func)
+        _jitted.append(dispatcher)
+        return dispatcher
+    return func
+
+
+def _enable_cache():
+    """ 첫 커널 실행 전에 컴파일 결과 디스크 캐시 활성화 (cache=True와 동일) """
+    global _cache_enabled
+    if _cache_enabled:
+        return
+    for dispatcher in _jitted:
+        try:
+            dispatcher.enable_caching()
+        except Exception:       # 캐시 디렉토리를 만들 수 없는 환경 -> 매번 컴파일
+            pass
+    _cache_enabled = True
+
+
+def python_kernel(kernel):
+    """ 컴파일 전 순수 Python 버전의 커널 반환 (numba 미설치 시 그대로 반환) """
+    return getattr(kernel, "py_func", kernel)
+
+
+# 📌 NumPy와 같은 규칙의 나눗셈 (순수 Python float는 0으로 나누면 예외가 발생하므로)
+@_jit
+def _div(a, b):
+    if b == 0:
+        if a != a or a == 0:
+            return np.nan
+        return math.copysign(math.inf, a) * math.copysign(1.0, b)
+    return a / b
+
+
+# 📌 pandas ewm(adjust=False, ignore_na=False) 한 스텝
+@_jit
+def _ewm_step(weighted, old_wt, x, alpha):
+    if weighted == weighted:
+        old_wt *= 1.0 - alpha
+        if x == x:
+            if weighted != x:
+                weighted = (old_wt * weighted + alpha * x) / (old_wt + alpha)
+            old_wt = 1.0
+    elif x == x:
+        weighted = x
+    return weighted, old_wt
+
+
+# 📌 pandas rolling().mean()의 값 추가/제거 (Kahan 보정은 추가/제거 각각 별도로 유지)
+@_jit
+def _mean_add(val, nobs, total, comp, neg_ct, same_ct, prev_value):
+    if val == val:
+        nobs += 1
+        y = val - comp
+        t = total + y
+        comp = t - total - y
+        total = t
+        if math.copysign(1.0, val) < 0:
+            neg_ct += 1
+        if val == prev_value:
+            same_ct += 1
+        else:
+            same_ct = 1
+        prev_value = val
+    return nobs, total, comp, neg_ct, same_ct, prev_value
+
+
+@_jit
+def _mean_remove(val, nobs, total, comp, neg_ct):
+    if val == val:
+        nobs -= 1
+        y = -val - comp
+        t = total + y
+        comp = t - total - y
+        total = t
+        if math.copysign(1.0, val) < 0:
+            neg_ct -= 1
+    return nobs, total, comp, neg_ct
+
+
+# 📌 pandas rolling().mean()의 결과 규칙 (동일값 연속 구간, 부호 보정)
+@_jit
+def _rolling_mean_value(total, nobs, neg_ct, same_ct, prev_value, min_periods):
+    if nobs >= min_periods and nobs > 0:
+        result = total / nobs
+        if same_ct >= nobs:
+            result = prev_value
+        elif neg_ct == 0 and result < 0:
+            result = 0.0
+        elif neg_ct == nobs and result > 0:
+            result = 0.0
+        return result
+    return np.nan
+
+
+@_jit
+def rolling_mean_into(values, window, min_periods, out):
+    """ rolling(window, min_periods).mean() 결과를 out에 기록 """
+    nobs, neg_ct, same_ct = 0, 0, 0
+    total, comp_add, comp_remove, prev_value = 0.0, 0.0, 0.0, np.nan
+    for i in range(values.shape[0]):
+        if i == 0 or window <= 1:
+            # 첫 윈도우(또는 윈도우 1)는 처음부터 다시 계산
+            nobs, neg_ct, same_ct = 0, 0, 0
+            total, comp_add, comp_remove, prev_value = 0.0, 0.0, 0.0, values[i]
+        elif i >= window:
+            nobs, total, comp_remove, neg_ct = _mean_remove(values[i - window], nobs, total, comp_remove, neg_ct)
+        nobs, total, comp_add, neg_ct, same_ct, prev_value = _mean_add(
+            values[i], nobs, total, comp_add, neg_ct, same_ct, prev_value
+        )
+        out[i] = _rolling_mean_value(total, nobs, neg_ct, same_ct, prev_value, min_periods)
+
+
+# 📌 pandas rolling().std()의 값 추가/제거 (Welford + Kahan 보정, 보정은 추가/제거 각각 별도로 유지)
+@_jit
+def _var_add(val, nobs, mean_x, ssqdm_x, comp, same_ct, prev_value):
+    if val == val:
+        nobs += 1
+        if val == prev_value:
+            same_ct += 1
+        else:
+            same_ct = 1
+        prev_value = val
+        prev_mean = mean_x - comp
+        y = val - comp
+        t = y - mean_x
+        comp = t + mean_x - y
+        mean_x += t / nobs
+        ssqdm_x += (val - prev_mean) * (val - mean_x)
+    return nobs, mean_x, ssqdm_x, comp, same_ct, prev_value
+
+
+@_jit
+def _var_remove(val, nobs, mean_x, ssqdm_x, comp):
+    if val == val:
+        nobs -= 1
+        if nobs:
+            prev_mean = mean_x - comp
+            y = val - comp
+            t = y - mean_x
+            comp = t + mean_x - y
+            mean_x -= t / nobs
+            ssqdm_x -= (val - prev_mean) * (val - mean_x)
+        else:
+            mean_x = 0.0
+            ssqdm_x = 0.0
+    return nobs, mean_x, ssqdm_x, comp
+
+
+# 📌 pandas rolling().std()의 결과 규칙 (동일값 연속 구간은 0)
+@_jit
+def _rolling_std_value(ssqdm_x, nobs, same_ct, min_periods, ddof):
+    if nobs >= min_periods and nobs > ddof:
+        if nobs == 1 or same_ct >= nobs:
+            var = 0.0
+        else:
+            var = ssqdm_x / (nobs - ddof)
+        return math.sqrt(var) if var > 0 else 0.0
+    return np.nan
+
+
+@_jit
+def rolling_std_into(values, window, min_periods, ddof, out):
+    """ rolling(window, min_periods).std(ddof) 결과를 out에 기록 (pandas roll_var의 Welford + Kahan 보정) """
+    nobs, same_ct = 0, 0
+    mean_x, ssqdm_x, comp_add, comp_remove, prev_value = 0.0, 0.0, 0.0, 0.0, np.nan
+    for i in range(values.shape[0]):
+        if i == 0 or window <= 1:
+            nobs, same_ct = 0, 0
+            mean_x, ssqdm_x, comp_add, comp_remove, prev_value = 0.0, 0.0, 0.0, 0.0, values[i]
+        elif i >= window:
+            nobs, mean_x, ssqdm_x, comp_remove = _var_remove(values[i - window], nobs, mean_x, ssqdm_x, comp_remove)
+        nobs, mean_x, ssqdm_x, comp_add, same_ct, prev_value = _var_add(
+            values[i], nobs, mean_x, ssqdm_x, comp_add, same_ct, prev_value
+        )
+        out[i] = _rolling_std_value(ssqdm_x, nobs, same_ct, min_periods, ddof)
+
+
+@_jit
+def _true_range(high, low, prev_close):
+    """ max(고가-저가, |고가-전일종가|, |저가-전일종가|) (NaN은 제외) """
+    tr = high - low
+    candidate = abs(high - prev_close)
+    if candidate == candidate and (tr != tr or candidate > tr):
+        tr = candidate
+    candidate = abs(low - prev_close)
+    if candidate == candidate and (tr != tr or candidate > tr):
+        tr = candidate
+    return tr
+
+
+@_jit
+def ema_into(values, span, out):
+    """ EMA: pd.Series(values).ewm(span=span, adjust=False).mean() 결과를 out에 기록 """
+    alpha = 2.0 / (span + 1.0)
+    weighted = np.nan
+    old_wt = 1.0
+    for i in range(values.shape[0]):
+        weighted, old_wt = _ewm_step(weighted, old_wt, values[i], alpha)
+        out[i] = weighted
+
+
+@_jit
+def atr_into(high, low, close, window, out):
+    """ ATR: True Range의 rolling(window, min_periods=1).mean() 결과를 out에 기록 """
+    buf = np.empty(window)      # 최근 window개의 TR (링 버퍼)
+    nobs, neg_ct, same_ct = 0, 0, 0
+    total, comp_add, comp_remove, prev_value = 0.0, 0.0, 0.0, np.nan
+    prev_close = np.nan
+    for i in range(close.shape[0]):
+        tr = _true_range(high[i], low[i], prev_close)
+        prev_close = close[i]
+
+        # 윈도우에서 빠지는 값 제거 후 추가 (pandas와 같은 순서)
+        if i == 0 or window <= 1:
+            nobs, neg_ct, same_ct = 0, 0, 0
+            total, comp_add, comp_remove, prev_value = 0.0, 0.0, 0.0, tr
+        elif i >= window:
+            nobs, total, comp_remove, neg_ct = _mean_remove(buf[i % window], nobs, total, comp_remove, neg_ct)
+        buf[i % window] = tr
+        nobs, total, comp_add, neg_ct, same_ct, prev_value = _mean_add(
+            tr, nobs, total, comp_add, neg_ct, same_ct, prev_value
+        )
+        out[i] = _rolling_mean_value(total, nobs, neg_ct, same_ct, prev_value, 1)
+
+
+@_jit
+def adx_into(high, low, close, period, out):
+    """
+    ADX: DM+/DM- -> ATR -> DI+/DI- -> DX -> ADX를 한 번의 루프로 계산하여 out에 기록
+    indicators.advanced.adx.ADX와 같은 순서/규칙(ewm(adjust=False), ATR rolling 평균)을 따름
+    """
+    alpha = 2.0 / (period + 1.0)
+
+    buf = np.empty(period)      # ATR용 TR 링 버퍼
+    nobs, neg_ct, same_ct = 0, 0, 0
+    total, comp_add, comp_remove, prev_value = 0.0, 0.0, 0.0, np.nan
+
+    plus_w, plus_old = np.nan, 1.0      # DM+ ewm 상태
+    minus_w, minus_old = np.nan, 1.0    # DM- ewm 상태
+    adx_w, adx_old = np.nan, 1.0        # DX ewm 상태
+
+    prev_high = np.nan
+    prev_low = np.nan
+    prev_close = np.nan
+    for i in range(close.shape[0]):
+        # 1. DM+ / DM-
+        up_move = high[i] - prev_high
+        down_move = low[i] - prev_low
+        plus_dm = up_move if (up_move > down_move and up_move > 0) else 0.0 * up_move
+        minus_dm = down_move if (down_move > up_move and down_move > 0) else 0.0 * down_move
+
+        # 2. ATR
+        tr = _true_range(high[i], low[i], prev_close)
+        if i == 0 or period <= 1:
+            nobs, neg_ct, same_ct = 0, 0, 0
+            total, comp_add, comp_remove, prev_value = 0.0, 0.0, 0.0, tr
+        elif i >= period:
+            nobs, total, comp_remove, neg_ct = _mean_remove(buf[i % period], nobs, total, comp_remove, neg_ct)
+        buf[i % period] = tr
+        nobs, total, comp_add, neg_ct, same_ct, prev_value = _mean_add(
+            tr, nobs, total, comp_add, neg_ct, same_ct, prev_value
+        )
+        atr = _rolling_mean_value(total, nobs, neg_ct, same_ct, prev_value, 1)
+
+        # 3. DI+ / DI-
+        plus_w, plus_old = _ewm_step(plus_w, plus_old, plus_dm, alpha)
+        minus_w, minus_old = _ewm_step(minus_w, minus_old, minus_dm, alpha)
+        plus_di = _div(100 * plus_w, atr)
+        minus_di = _div(100 * minus_w, atr)
+
+        # 4. DX -> ADX
+        dx = _div(abs(plus_di - minus_di), plus_di + minus_di) * 100
+        adx_w, adx_old = _ewm_step(adx_w, adx_old, dx, alpha)
+        out[i] = adx_w
+
+        prev_high = high[i]
+        prev_low = low[i]
+        prev_close = close[i]
+
+
+@_jit
+def rsi_into(values, window, out):
+    """ RSI: 상승폭/하락폭의 rolling(window).mean() 비율 (indicators.advanced.rsi.RSI와 동일)을 out에 기록 """
+    gains = np.empty(window)    # 링 버퍼
+    losses = np.empty(window)
+    g_nobs, g_neg, g_same, g_total, g_add, g_remove, g_prev = 0, 0, 0, 0.0, 0.0, 0.0, np.nan
+    l_nobs, l_neg, l_same, l_total, l_add, l_remove, l_prev = 0, 0, 0, 0.0, 0.0, 0.0, np.nan
+    prev = np.nan
+    for i in range(values.shape[0]):
+        delta = values[i] - prev
+        prev = values[i]
+        # delta.where(delta > 0, 0) / -delta.where(delta < 0, 0) -> NaN은 0으로 처리됨
+        gain = delta if delta > 0 else 0.0
+        loss = -delta if delta < 0 else -0.0
+
+        if i == 0 or window <= 1:
+            g_nobs, g_neg, g_same, g_total, g_add, g_remove, g_prev = 0, 0, 0, 0.0, 0.0, 0.0, gain
+            l_nobs, l_neg, l_same, l_total, l_add, l_remove, l_prev = 0, 0, 0, 0.0, 0.0, 0.0, loss
+        elif i >= window:
+            g_nobs, g_total, g_remove, g_neg = _mean_remove(gains[i % window], g_nobs, g_total, g_remove, g_neg)
+            l_nobs, l_total, l_remove, l_neg = _mean_remove(losses[i % window], l_nobs, l_total, l_remove, l_neg)
+
+        gains[i % window] = gain
+        losses[i % window] = loss
+        g_nobs, g_total, g_add, g_neg, g_same, g_prev = _mean_add(gain, g_nobs, g_total, g_add, g_neg, g_same, g_prev)
+        l_nobs, l_total, l_add, l_neg, l_same, l_prev = _mean_add(loss, l_nobs, l_total, l_add, l_neg, l_same, l_prev)
+
+        avg_gain = _rolling_mean_value(g_total, g_nobs, g_neg, g_same, g_prev, window)
+        avg_loss = _rolling_mean_value(l_total, l_nobs, l_neg, l_same, l_prev, window)
+        rs = _div(avg_gain, avg_loss)
+        out[i] = 100 - (100 / (1 + rs))
+
+
+# 📌 결과 배열을 새로 만들어 반환하는 버전 (float64)
+@_jit
+def ema_kernel(values, span):
+    """ EMA: pd.Series(values).ewm(span=span, adjust=False).mean() """
+    out = np.empty(values.shape[0])
+    ema_into(values, span, out)
+    return out
+
+
+@_jit
+def atr_kernel(high, low, close, window):
+    """ ATR: True Range의 rolling(window, min_periods=1).mean() """
+    out = np.empty(close.shape[0])
+    atr_into(high, low, close, window, out)
+    return out
+
+
+@_jit
+def adx_kernel(high, low, close, period):
+    """ ADX (adx_into 참고) """
+    out = np.empty(close.shape[0])
+    adx_into(high, low, close, period, out)
+    return out
+
+
+@_jit
+def rsi_kernel(values, window):
+    """ RSI (rsi_into 참고) """
+    out = np.empty(values.shape[0])
+    rsi_into(values, window, out)
+    return out
+
+
+def as_float_array(values) -> np.ndarray:
+    """ 커널 입력용 연속(contiguous) float64 배열로 변환 """
+    if hasattr(values, "to_numpy"):
+        values = values.to_numpy(dtype=np.float64)
+    return np.ascontiguousarray(values, dtype=np.float64)
+
+
+def run(kernel, *inputs, params=(), name=None):
+    """
+    pandas 입력(Series 또는 wide DataFrame)에 커널을 적용하고 마지막 입력과 같은 index(/columns)로 반환
+    - DataFrame 입력은 Fortran 순서(컬럼 연속) 배열로 한 번 변환한 뒤 컬럼별로 커널 실행
+    """
+    _enable_cache()
+    like = inputs[-1]
+    if isinstance(like, pd.DataFrame):
+        arrays = [np.asfortranarray(x.to_numpy(dtype=np.float64)) for x in inputs]
+        out = np.empty(arrays[0].shape, order="F")
+        for j in range(out.shape[1]):
+            out[:, j] = kernel(*(arr[:, j] for arr in arrays), *params)
+        return pd.DataFrame(out, index=like.index, columns=like.columns)
+
+    out = kernel(*(as_float_array(x) for x in inputs), *params)
+    return pd.Series(out, index=like.index, name=name)
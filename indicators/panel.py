@@ -0,0 +1,112 @@
+import functools
+import inspect
+
+import numpy as np
+import pandas as pd
+
+
+"""
+📊 panel
+
+여러 종목을 한 번에 계산하기 위한 2차원(시간 × 종목) 입력 지원
+- 지표 함수는 1차원(Series/배열) 외에 2차원 배열 또는 wide DataFrame(컬럼 = 종목)을 받을 수 있습니다.
+- 2차원 입력은 axis 0(시간) 방향으로 모든 컬럼을 한 번에 계산합니다.
+- 상장일이 다른 종목(앞쪽 NaN)은 각 컬럼을 첫 유효 바 기준으로 앞당겨 정렬한 뒤 계산하고 다시 제자리로 돌려놓으므로,
+  각 컬럼의 결과는 해당 종목을 상장 이후 데이터만으로 단독 계산한 결과와 같습니다. (상장 이전 구간은 NaN)
+"""
+
+
+def is_panel(values) -> bool:
+    """ 2차원(시간 × 종목) 입력 여부 """
+    return isinstance(values, pd.DataFrame) or (isinstance(values, np.ndarray) and values.ndim == 2)
+
+
+def to_pandas(values):
+    """ pd.Series(values) 대신 사용: 2차원 입력은 DataFrame, 그 외는 Series로 변환 """
+    if isinstance(values, (pd.Series, pd.DataFrame)):
+        return values
+    if isinstance(values, np.ndarray) and values.ndim == 2:
+        return pd.DataFrame(values)
+    return pd.Series(values)
+
+
+def first_valid_rows(*arrays: np.ndarray) -> np.ndarray:
+    """ 컬럼별로 모든 입력이 유효(NaN 아님)한 첫 행 번호 (유효한 행이 없으면 행 개수) """
+    valid = np.ones(arrays[0].shape, dtype=bool)
+    for arr in arrays:
+        valid &= ~np.isnan(arr)
+    return np.where(valid.any(axis=0), valid.argmax(axis=0), valid.shape[0])
+
+
+def _shift_up(arr: np.ndarray, first: np.ndarray) -> np.ndarray:
+    """ 각 컬럼을 first[j]행만큼 위로 당김 (뒤쪽은 NaN) """
+    n = arr.shape[0]
+    out = np.array(arr, dtype=np.float64, order="F")
+    for j in np.flatnonzero(first):
+        f = first[j]
+        out[:n - f, j] = arr[f:, j]
+        out[n - f:, j] = np.nan
+    return out
+
+
+def _shift_down(arr: np.ndarray, first: np.ndarray) -> np.ndarray:
+    """ _shift_up의 역변환 (앞쪽은 NaN) """
+    n = arr.shape[0]
+    out = np.array(arr, dtype=np.float64, order="F")
+    for j in np.flatnonzero(first):
+        f = first[j]
+        out[f:, j] = arr[:n - f, j]
+        out[:f, j] = np.nan
+    return out
+
+
+def panel_indicator(func):
+    """
+    지표 함수가 2차원 입력을 받을 수 있도록 감싸는 데코레이터
+    - 1차원 입력은 그대로 func에 전달
+    - 2차원 입력은 float64 DataFrame으로 변환하고, 종목별 첫 유효 바 기준으로 정렬한 뒤 func을 호출
+      (func 본문은 Series/DataFrame 모두에서 동작하는 pandas 연산으로 작성되어 있어야 함)
+    - 결과(DataFrame 또는 DataFrame 튜플)는 원래 index/columns로 복원
+    """
+    signature = inspect.signature(func)
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        bound = signature.bind(*args, **kwargs)
+        data_names = [
+            name for name, value in bound.arguments.items()
+            if isinstance(value, (np.ndarray, pd.Series, pd.DataFrame, list))
+        ]
+        if not any(is_panel(bound.arguments[name]) for name in data_names):
+            return func(*args, **kwargs)
+
+        like = next(
+            (bound.arguments[name] for name in data_names if isinstance(bound.arguments[name], pd.DataFrame)),
+            None,
+        )
+        arrays = [np.asarray(bound.arguments[name], dtype=np.float64) for name in data_names]
+        index = like.index if like is not None else pd.RangeIndex(arrays[0].shape[0])
+        columns = like.columns if like is not None else pd.RangeIndex(arrays[0].shape[1])
+
+        # 종목별 첫 유효 바 기준 정렬 (이미 정렬되어 있으면 생략)
+        first = first_valid_rows(*arrays)
+        shifted = first.any()
+        if shifted:
+            arrays = [_shift_up(arr, first) for arr in arrays]
+
+        for name, arr in zip(data_names, arrays):
+            bound.arguments[name] = pd.DataFrame(arr, columns=columns)
+
+        result = func(*bound.args, **bound.kwargs)
+
+        def restore(frame):
+            values = frame.to_numpy(dtype=np.float64)
+            if shifted:
+                values = _shift_down(values, first)
+            return pd.DataFrame(values, index=index, columns=columns)
+
+        if isinstance(result, tuple):
+            return tuple(restore(r) for r in result)
+        return restore(result)
+
+    return wrapper
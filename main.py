@@ -1,19 +1,15 @@
-from backtesting import Backtest
-from utils.data_loader import get_stock_data
+from utils.data_loader import get_stock_data, get_default_cache
 from strategies.smart_score import SmartScore
 from utils.logger_xl import write_log
+from runner.backtest import LoggedBacktest
+from utils.stats import convert_stats_to_vertical_dict
+from utils.result_store import ParquetResultStore
+from utils.run_registry import RunRegistry
 from config.config import PathConfig, backtesting_config
 import os
-import pandas as pd
 import pprint
 
 
-def convert_stats_to_vertical_dict(stats_obj):
-    """ stats 객체를 {항목명: 값} 형태의 딕셔너리로 변환 """
-    series = pd.Series(stats_obj)
-    return {k: str(v) if not isinstance(v, (str, int, float)) else v for k, v in series.items()}
-
-
 def run_backtest():
     symbol = backtesting_config.SYMBOL
     start_date = backtesting_config.BACKTEST_START
@@ -22,31 +18,28 @@ def run_backtest():
     fetch_start_date = backtesting_config.FETCH_START
 
 
-    # 🔥 로그 초기화: 기존 로그 파일 삭제
-    os.makedirs(PathConfig.RESULT_DIR, exist_ok=True)
-
-    for log_file in [f"{symbol}_{PathConfig.TODAY}_{PathConfig.XLSX_SCORE_LOG}", f"{symbol}_{PathConfig.TODAY}_{PathConfig.XLSX_TRADING_LOG}", f"{symbol}_{PathConfig.TODAY}_{PathConfig.TXT_BACKTEST_LOG}"]:
-        path = os.path.join(PathConfig.RESULT_DIR, log_file)
-        if os.path.exists(path):
-            os.remove(path)
-            print(f"🧹 기존 로그 파일 삭제됨: {path}")
-
-
     # 데이터 로드
     data = get_stock_data(symbol=symbol, start=fetch_start_date, end=end_date)
+    print(get_default_cache().stats)
     # SMA 등 프리롤이 계산된 이후부터 필터
     filter_data = data[data.index >= start_date]
 
     # 백테스트 실행
-    bt = Backtest(filter_data, SmartScore, cash=10000, commission=.002)
+    # (실행 종료 시 백그라운드 로그 기록기의 남은 레코드를 모두 기록, 로그/stats는 Parquet 결과 저장소에도 누적)
+    # (실행마다 run_id 발급 -> 로그 행에 run_id 태그, 실행 정보는 레지스트리에 기록)
+    bt = LoggedBacktest(
+        filter_data, SmartScore, cash=10000, commission=.002,
+        symbol=symbol, result_store=ParquetResultStore(), registry=RunRegistry(),
+    )
     stats = bt.run()
+    print(f"🧾 run_id: {bt.run_id}")
 
-    # 백테스트 결과 기록(text 파일)
-    write_log(pprint.pformat(stats), f"{backtesting_config.SYMBOL}_{PathConfig.TODAY}_{PathConfig.TXT_BACKTEST_LOG}")
+    # 백테스트 결과 기록(text 파일, 실행별 파일이므로 반복/동시 실행 결과를 덮어쓰지 않음)
+    write_log(pprint.pformat(stats), f"{symbol}_{bt.run_id}_{PathConfig.TXT_BACKTEST_LOG}")
 
     
     os.makedirs(PathConfig.RESULT_DIR, exist_ok=True)
-    html_path = os.path.join(PathConfig.RESULT_DIR, f"{symbol}_backtest_{PathConfig.TODAY}.html")
+    html_path = os.path.join(PathConfig.RESULT_DIR, f"{symbol}_backtest_{bt.run_id}.html")
 
     bt.plot(filename=html_path)
 
@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 from regime.market_regime import MarketRegime
 from indicators.base import EMA, ATR
@@ -28,6 +29,8 @@ class MarketRegimeEvaluator:
         self.macd_signal_period = macd_signal_period
 
         self.indicators = self._calculate_indicators()
+        self._noise_cache = {}     # (window, std_threshold, z_score_threshold) -> score_noise_series 결과
+        self._regime_cache = {}    # classify 파라미터 -> classify 결과
     
 
     def _calculate_indicators(self):
@@ -92,38 +95,149 @@ class MarketRegimeEvaluator:
     # Noise란 뭘까...?? 뭘로 정의할까...??
     # 예측할 수 없는 변동성인데... 이걸 어떤 지표로 잡아낼 수 있을까...??
     # ATR? ATR 표준편차? z-score?
+    def score_noise_series(self, window=14, std_threshold=1.5, z_score_threshold=1.5) -> pd.DataFrame:
+        """
+        전체 날짜에 대한 노이즈 판단 결과를 한 번에(벡터화) 계산합니다.
+        각 날짜마다 최근 window 기간의 ATR 평균/표준편차/z-score를 rolling으로 구하고,
+        ATR의 절대값 및 z-score를 기준으로 노이즈 여부를 판단합니다.
+        결과는 파라미터별로 캐시되어 score_noise(date)는 조회만 수행합니다.
+
+        Returns:
+            DataFrame (index: self.df.index)
+            - atr: ATR 값
+            - atr_mean: 최근 window 기간 ATR 평균
+            - atr_std: 최근 window 기간 ATR 표준편차
+            - z_score: (ATR - 평균) / 표준편차 (표준편차가 0이면 0)
+            - noise: 1(노이즈 감지) / 0(노이즈 없음 또는 판단 불가)
+        """
+        key = (window, std_threshold, z_score_threshold)
+        if key in self._noise_cache:
+            return self._noise_cache[key]
+
+        atr_series = ATR(self.df["High"], self.df["Low"], self.df["Close"], window)
+
+        # 최근 window 기간의 ATR 평균/표준편차 (슬라이스 기반 mean()/std()와 동일하게 NaN은 건너뜀)
+        rolling = atr_series.rolling(window=window, min_periods=1)
+        mean = rolling.mean()
+        std = rolling.std()
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            z_score = pd.Series(np.where(std != 0, (atr_series - mean) / std, 0.0), index=atr_series.index)
+
+        # 노이즈 판단
+        noise = (atr_series >= std_threshold) | (z_score.abs() >= z_score_threshold)
+
+        # 데이터 부족 구간(앞쪽 window개) -> 판단 불가 -> 일단 안정으로 간주
+        noise[np.arange(len(atr_series)) < window] = False
+
+        result = pd.DataFrame({
+            "atr": atr_series,
+            "atr_mean": mean,
+            "atr_std": std,
+            "z_score": z_score,
+            "noise": noise.astype(int),
+        })
+        self._noise_cache[key] = result
+        return result
+
+
     def score_noise(self, date, window=14, std_threshold=1.5, z_score_threshold=1.5) -> int:
         """
-        주어진 날짜에 대한 노이즈 점수를 계산합니다.
-        노이즈 점수는 ATR 기반 표준편차 + z-score를 사용하여 계산됩니다.
-        특정 시점에서 ATR의 절대값 및 z-score를 기준으로 노이즈를 판단합니다.
+        주어진 날짜에 대한 노이즈 점수를 반환합니다.
+        노이즈 점수는 ATR 기반 표준편차 + z-score를 사용하여 계산됩니다. (score_noise_series 참고)
 
         Returns:
             1: 노이즈가 감지된 경우(VOLATILE 가능성)
             0: 노이즈가 감지되지 않은 경우(안정적 판단 가능)
         """
-        high = self.df["High"]
-        low = self.df["Low"]
-        close = self.df["Close"]
-
-        atr_series = ATR(high, low, close, window)
+        noise = self.score_noise_series(window, std_threshold, z_score_threshold)["noise"]
 
-        if len(atr_series) < window or date not in atr_series.index:
+        if date not in noise.index:
             return 0    # 판단 불가 -> 일단 안정으로 간주
-        
-        idx = atr_series.index.get_loc(date)
-        if idx < window:
-            return 0    # 데이터 부족 -> 판단 불가
-        
-        # 최근 window 기간의 ATR 슬라이스
-        atr_window = atr_series.iloc[idx - window + 1 : idx + 1]
-        latest_atr = atr_window.iloc[-1]
-        mean = atr_window.mean()
 
-        std = atr_window.std()
-        z_score = (latest_atr - mean) / std if std != 0 else 0
+        return int(noise.loc[date])
 
-        # 노이즈 판단
-        if latest_atr >= std_threshold or abs(z_score) >= z_score_threshold:
-            return 1 # 노이즈 감지
-        return 0    # 노이즈 없음
\ No newline at end of file
+
+    # Regime Classification
+    def classify(
+        self,
+        adx_threshold: float = 20,
+        cci_threshold: float = 100,
+        direction_threshold: int = 2,
+        noise_window: int = 14,
+        noise_std_threshold: float = 1.5,
+        noise_z_score_threshold: float = 1.5,
+    ) -> pd.Series:
+        """
+        전체 DataFrame에 대한 시장 레짐을 한 번에(벡터화) 분류합니다.
+        모든 지표가 과거 데이터만 사용하므로, 결과 배열을 전략의 next()에서 인덱싱해도 미래 정보가 섞이지 않습니다.
+
+        [📈 방향성 점수] (-4 ~ +4)
+        - EMA 단기/장기 위치        : ema_fast > ema_slow → +1, 반대 → -1
+        - MACD 히스토그램 부호       : 양 → +1, 음 → -1
+        - CCI ±cci_threshold 이탈    : +cci_threshold 이상 → +1, -cci_threshold 이하 → -1
+        - ROC 부호                  : 양 → +1, 음 → -1
+
+        [📉 추세 강도]
+        - ADX >= adx_threshold 이면 추세 존재
+
+        [⚠️ 노이즈]
+        - score_noise_series()의 noise 플래그
+
+        분류 규칙 (위에서부터 우선 적용)
+        - 지표 계산 불가(워밍업)              → NONE
+        - 추세 없음 + 노이즈                 → VOLATILE
+        - 추세 존재 + 방향성 >= +direction_threshold → BULL
+        - 추세 존재 + 방향성 <= -direction_threshold → BEAR
+        - 추세 없음                          → SIDEWAYS
+        - 추세는 있으나 방향이 엇갈림          → NONE
+
+        Returns:
+            pd.Series (category dtype, 값: MarketRegime, index: self.df.index)
+        """
+        key = (adx_threshold, cci_threshold, direction_threshold, noise_window, noise_std_threshold, noise_z_score_threshold)
+        if key in self._regime_cache:
+            return self._regime_cache[key]
+
+        ind = self.indicators
+        ema_fast = ind["ema_fast"].to_numpy(dtype=float)
+        ema_slow = ind["ema_slow"].to_numpy(dtype=float)
+        histogram = ind["macd_histogram"].to_numpy(dtype=float)
+        cci = ind["cci"].to_numpy(dtype=float)
+        roc = ind["roc"].to_numpy(dtype=float)
+        adx = ind["adx"].to_numpy(dtype=float)
+        noise = self.score_noise_series(noise_window, noise_std_threshold, noise_z_score_threshold)["noise"].to_numpy() == 1
+
+        # 방향성 점수
+        direction = (
+            np.sign(ema_fast - ema_slow)
+            + np.sign(histogram)
+            + (cci >= cci_threshold).astype(int) - (cci <= -cci_threshold).astype(int)
+            + np.sign(roc)
+        )
+
+        # 추세 강도
+        trending = adx >= adx_threshold
+
+        # 워밍업 구간 (지표 중 하나라도 NaN)
+        warmup = np.isnan(ema_fast) | np.isnan(ema_slow) | np.isnan(histogram) | np.isnan(cci) | np.isnan(roc) | np.isnan(adx)
+
+        regimes = np.select(
+            [
+                warmup,
+                ~trending & noise,
+                trending & (direction >= direction_threshold),
+                trending & (direction <= -direction_threshold),
+                ~trending,
+            ],
+            [MarketRegime.NONE, MarketRegime.VOLATILE, MarketRegime.BULL, MarketRegime.BEAR, MarketRegime.SIDEWAYS],
+            default=MarketRegime.NONE,
+        )
+
+        result = pd.Series(
+            pd.Categorical(regimes, categories=list(MarketRegime)),
+            index=self.df.index,
+            name="market_regime",
+        )
+        self._regime_cache[key] = result
+        return result
@@ -0,0 +1,6 @@
+"""
+📦 runner
+
+백테스트 실행 관련 모듈을 관리합니다.
+전략(strategies/) 자체가 아닌, 전략을 어떻게 실행하고 결과/로그를 어떻게 수집할지를 정의합니다.
+"""
@@ -0,0 +1,76 @@
+import time
+from typing import Optional
+
+from backtesting import Backtest
+
+from utils.log_writer import TeeSink, log_writer
+from utils.result_store import new_run_id
+from utils.run_registry import strategy_params
+
+
+class LoggedBacktest(Backtest):
+    """
+    실행이 끝나면(예외 발생 시 포함) 백그라운드 로그 기록기의 남은 레코드를 모두 기록하는 Backtest
+    - run() 반환 시점에는 이번 실행의 스코어/매매 로그가 모두 저장되어 있음을 보장합니다.
+    - 실행마다 run_id를 발급하고, 실행 중 기록되는 모든 로그 레코드에 run_id/symbol 컬럼을 붙입니다.
+    - result_store(ParquetResultStore)를 지정하면 이번 실행의 로그를 기존 sink와 함께 저장소에도 전달하고,
+      실행이 끝나면 로그와 stats를 symbol 파티션으로 기록합니다. (실행 실패 시 해당 로그는 버림)
+    - registry(RunRegistry)를 지정하면 실행별 파라미터, 데이터 지문, 소요 시간, 상태를 기록합니다.
+    - sink를 지정하면 이번 실행의 로그를 기본 SQLiteLogger 대신 해당 sink로 기록합니다. (실행별 로그 DB 분리)
+    - 전략이 단계별 실행 시간을 측정한 경우(SmartScore profile=True) stats["_profile"]에 phase별 통계를 추가합니다.
+    """
+
+    def __init__(
+        self, data, strategy, *,
+        symbol: Optional[str] = None, result_store=None, registry=None, sink=None, **kwargs,
+    ):
+        super().__init__(data, strategy, **kwargs)
+        self.symbol = symbol
+        self.result_store = result_store
+        self.registry = registry
+        self.sink = sink
+        self.run_id = None
+
+
+    def run(self, **kwargs):
+        self.run_id = new_run_id()
+        started = time.perf_counter()
+        if self.registry is not None:
+            self.registry.start(self.run_id, self.symbol, self._strategy, strategy_params(self._strategy, kwargs), self._data)
+
+        try:
+            stats = self._run_logged(**kwargs)
+        except Exception as e:
+            if self.registry is not None:
+                self.registry.finish(self.run_id, time.perf_counter() - started, "failed", f"{type(e).__name__}: {e}")
+            raise
+
+        if self.registry is not None:
+            self.registry.finish(self.run_id, time.perf_counter() - started)
+        return stats
+
+
+    def _run_logged(self, **kwargs):
+        # 이번 실행(현재 스레드)의 레코드에만 태그를 붙이고 저장소로 전달
+        sink = self.sink
+        if self.result_store is not None:
+            sink = TeeSink(sink if sink is not None else log_writer.sink, self.result_store)
+
+        with log_writer.redirect(sink, tags={"run_id": self.run_id, "symbol": self.symbol}):
+            try:
+                stats = super().run(**kwargs)
+            except Exception:
+                log_writer.flush()
+                if self.result_store is not None:
+                    self.result_store.discard()
+                raise
+        # 바 루프가 끝난 뒤 이번 실행의 레코드가 모두 기록될 때까지 대기
+        log_writer.flush()
+
+        profiler = getattr(stats._strategy, "profiler", None)
+        if profiler is not None:
+            stats.loc["_profile"] = profiler.summary()
+
+        if self.result_store is not None:
+            self.result_store.write_run(self.symbol or "UNKNOWN", stats=stats, run_id=self.run_id)
+        return stats
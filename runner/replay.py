@@ -0,0 +1,380 @@
+import math
+import time
+from dataclasses import dataclass
+from typing import Optional, Union
+
+import pandas as pd
+
+from indicators.incremental import IncrementalADX, IncrementalEMA, IncrementalMACD, IncrementalRSI, IncrementalSMA
+from indicators.incremental._rolling import RollingStd
+from regime import MarketRegime
+from scoring.score_factors import calc_ema_adx_score, calc_macd_hist_score, calc_rsi_score, calc_volume_score
+from strategies.smart_score import SmartScore
+from utils.data_loader import read_ohlcv_file
+from utils.profiling import PhaseProfiler, instrument
+
+
+"""
+⏯️ replay
+
+바 재생(replay) 기반 페이퍼 트레이딩 루프
+
+Backtest.run 없이 바를 하나씩 받아 SmartScore의 스코어링/레짐/청산 로직을 실행합니다. (라이브 피드 연결 전 검증용)
+- BarFeed           : 로컬 파일(또는 DataFrame)의 바를 하나씩 내보내는 피드, speed로 재생 속도 지정
+- PaperBroker       : 시장가 주문을 다음 바 시가에 체결하는 페이퍼 브로커 (backtesting.py의 체결/수수료 규칙과 동일)
+- ReplaySmartScore  : 지표/팩터 점수/레짐을 증분 상태(indicators.incremental)로 갱신하는 SmartScore
+                      (매수/손절/익절/트레일링 스탑은 SmartScore의 메서드를 그대로 사용)
+
+바마다 지표 갱신(indicators), 매매 판단(decision), 바 전체(bar) 처리 시간을 기록하여
+분봉/초봉을 실시간으로 따라갈 수 있는지(ReplayResult.keeps_up) 판단합니다.
+"""
+
+
+class BarFeed:
+    """
+    OHLCV를 한 바씩 (시각, 시가, 고가, 저가, 종가, 거래량)으로 내보내는 재생 피드
+    - speed=None이면 대기 없이 최대 속도로 재생
+    - speed=k이면 인덱스 시각 간격을 k배 빠르게 재생 (1: 실시간, 60: 1분봉을 초당 1개)
+    - 소비자가 예정 시각까지 이전 바 처리를 끝내지 못하면 지연 시간을 lags에 기록
+    """
+
+    def __init__(self, data: pd.DataFrame, speed: Optional[float] = None):
+        if speed is not None and speed <= 0:
+            raise ValueError(f"speed는 0보다 커야 합니다: {speed}")
+        self.data = data
+        self.speed = speed
+        self.lags = []              # 예정 시각보다 늦게 전달된 바의 지연 시간(초)
+
+
+    def __len__(self):
+        return len(self.data)
+
+
+    def __iter__(self):
+        rows = zip(self.data.index, *(self.data[c].to_numpy(dtype=float) for c in ("Open", "High", "Low", "Close", "Volume")))
+        if self.speed is None:
+            yield from rows
+            return
+
+        offsets = (self.data.index - self.data.index[0]).total_seconds().to_numpy() / self.speed
+        started = time.perf_counter()
+        for offset, row in zip(offsets, rows):
+            wait = started + offset - time.perf_counter()
+            if wait > 0:
+                time.sleep(wait)
+            elif offset > 0:
+                self.lags.append(-wait)
+            yield row
+
+
+class PaperPosition:
+    """ 보유 수량 (Strategy.position 대체) """
+
+    def __init__(self, broker: "PaperBroker"):
+        self._broker = broker
+
+
+    @property
+    def size(self) -> int:
+        return sum(trade.size for trade in self._broker.trades)
+
+
+class PaperTrade:
+    """ 미청산 거래 """
+    __slots__ = ("size", "entry_price", "entry_time")
+
+    def __init__(self, size: int, entry_price: float, entry_time):
+        self.size = size
+        self.entry_price = entry_price
+        self.entry_time = entry_time
+
+
+class PaperBroker:
+    """
+    시장가 주문만 처리하는 페이퍼 브로커 (backtesting.py _Broker의 체결 규칙을 따름)
+    - 주문은 다음 바 시가에 체결, 수수료는 진입/청산 시 각각 cash에서 차감
+    - 반대 방향 주문은 기존 거래를 FIFO로 청산하고, 증거금이 부족하면 주문을 취소
+    - 지정가/스탑/SL/TP 주문은 지원하지 않음
+    """
+
+    def __init__(self, cash: float = 10000, commission: float = .002):
+        self._cash = cash
+        self._commission_rate = commission
+        self.orders = []                # 체결 대기 주문 수량 (+매수 / -매도, 0~1은 가용 증거금 비율)
+        self.trades = []                # 미청산 거래 (PaperTrade)
+        self.closed_trades = []         # 청산 거래 기록
+        self.canceled_orders = 0        # 증거금 부족으로 취소된 주문 수
+        self.position = PaperPosition(self)
+        self.last_price = math.nan
+
+
+    def new_order(self, size, limit=None, stop=None, sl=None, tp=None, tag=None):
+        """ Strategy.buy/sell에서 호출 """
+        if any(v is not None for v in (limit, stop, sl, tp)):
+            raise ValueError("PaperBroker는 시장가 주문만 지원합니다")
+        self.orders.append(float(size))
+        return size
+
+
+    @property
+    def equity(self) -> float:
+        return self._cash + sum(t.size * (self.last_price - t.entry_price) for t in self.trades)
+
+
+    @property
+    def margin_available(self) -> float:
+        return max(0, self.equity - sum(abs(t.size) * self.last_price for t in self.trades))
+
+
+    def next(self, timestamp, open_: float, close: float) -> float:
+        """ 새 바: 대기 주문을 시가에 체결하고 종가 기준 자산 반환 """
+        self.last_price = close
+        orders, self.orders = self.orders, []
+        for size in orders:
+            self._fill(size, open_, timestamp)
+        return self.equity
+
+
+    def _commission(self, size: float, price: float) -> float:
+        return abs(size) * price * self._commission_rate
+
+
+    def _fill(self, size: float, price: float, timestamp):
+        price_with_commission = price + self._commission(size, price) / abs(size)
+        if -1 < size < 1:
+            size = math.copysign(int(self.margin_available * abs(size) // price_with_commission), size)
+            if not size:
+                self.canceled_orders += 1
+                return
+        need_size = int(size)
+
+        # 반대 방향 거래를 FIFO로 청산
+        for trade in list(self.trades):
+            if (trade.size > 0) == (need_size > 0):
+                continue
+            if abs(need_size) >= abs(trade.size):
+                need_size += trade.size
+                self._close(trade, trade.size, price, timestamp)
+            else:
+                self._close(trade, -need_size, price, timestamp)
+                need_size = 0
+            if not need_size:
+                break
+
+        if abs(need_size) * price_with_commission > self.margin_available:
+            self.canceled_orders += 1
+            return
+        if need_size:
+            self.trades.append(PaperTrade(need_size, price, timestamp))
+            self._cash -= self._commission(need_size, price)
+
+
+    def _close(self, trade: PaperTrade, size: int, price: float, timestamp):
+        """ trade에서 size(거래와 같은 부호)만큼 청산 """
+        pnl = size * (price - trade.entry_price)
+        commission = self._commission(size, price)
+        self._cash += pnl - commission
+
+        trade.size -= size
+        if not trade.size:
+            self.trades.remove(trade)
+        self.closed_trades.append({
+            "Size": size,
+            "EntryPrice": trade.entry_price,
+            "ExitPrice": price,
+            "PnL": pnl - commission - self._commission(size, trade.entry_price),
+            "EntryTime": trade.entry_time,
+            "ExitTime": timestamp,
+        })
+
+
+class ReplayData:
+    """ SmartScore 메서드가 읽는 self.data 대체 (마지막 바만 보관: data.Close[-1], data.index[-1]) """
+    __slots__ = ("index", "Open", "High", "Low", "Close", "Volume")
+
+    def __init__(self):
+        self.update(pd.NaT, math.nan, math.nan, math.nan, math.nan, math.nan)
+
+
+    def update(self, timestamp, open_, high, low, close, volume):
+        self.index = (timestamp,)
+        self.Open, self.High, self.Low, self.Close, self.Volume = (open_,), (high,), (low,), (close,), (volume,)
+
+
+class ReplaySmartScore(SmartScore):
+    """
+    바 단위 증분 계산 SmartScore
+    - 지표(EMA/ADX/RSI/MACD), 평균 거래량, 레짐용 SMA/표준편차를 증분 상태로 유지하고
+      팩터 점수/레짐은 vectorized 모드의 현재 바 값과 동일하게 계산
+    - Backtest와 같이 모든 지표가 유효해진 다음 바부터 next()를 실행
+    - regime_source="zscore"만 지원 (evaluator는 전체 히스토리 분류가 필요)
+    """
+
+    def __init__(self, broker: PaperBroker, params: Optional[dict] = None):
+        super().__init__(broker, ReplayData(), params or {})
+        self.init()
+
+
+    def init(self):
+        if self.regime_source != "zscore":
+            raise ValueError(f"replay는 regime_source='zscore'만 지원합니다: {self.regime_source}")
+        self.profiler = instrument(self, self._PROFILED_PHASES, names=self._PROFILED_PHASES) if self.profile else None
+        self.latency = PhaseProfiler()
+
+        self._ema_short = IncrementalEMA(self.n1)
+        self._ema_long = IncrementalEMA(self.n2)
+        self._adx = IncrementalADX(14)
+        self._rsi = IncrementalRSI()
+        self._macd = IncrementalMACD()
+        self._avg_volume = IncrementalSMA(self.volume_window)
+        self._regime_sma = IncrementalSMA(self.regime_window)
+        self._regime_std_dev = RollingStd(self.regime_window, ddof=0)
+        self._regime_std = math.nan
+
+        self._i = -1                            # 현재 바 번호
+        self._first_valid = [None] * 6          # 지표별 첫 유효 바 번호 (Backtest 워밍업 계산과 동일)
+        self._start = None                      # next()를 처음 실행하는 바 번호
+        self.equity_curve = []
+
+
+    def on_bar(self, timestamp, open_, high, low, close, volume) -> bool:
+        """ 바 하나를 반영하고 워밍업이 끝났으면 매매 판단(next)까지 실행 (판단했으면 True) """
+        clock = time.perf_counter_ns
+        started = clock()
+        self._i += 1
+        self.equity_curve.append(self._broker.next(timestamp, open_, close))
+        self.data.update(timestamp, open_, high, low, close, volume)
+        self._update_indicators(high, low, close, volume)
+        updated = clock()
+
+        decided = self._start is not None and self._i >= self._start
+        if decided:
+            self.next()
+        finished = clock()
+
+        record = self.latency.record
+        record("indicators", updated - started)
+        if decided:
+            record("decision", finished - updated)
+        record("bar", finished - started)
+        return decided
+
+
+    def _update_indicators(self, high, low, close, volume):
+        values = (
+            self._ema_short.update(close),
+            self._ema_long.update(close),
+            self._adx.update(high, low, close),
+            self._rsi.update(close),
+            *self._macd.update(close),
+        )
+        self._avg_volume.update(volume)
+        self._regime_sma.update(close)
+        self._regime_std = self._regime_std_dev.update(close)
+
+        if self._start is None:
+            for k, value in enumerate(values):
+                if self._first_valid[k] is None and value == value:
+                    self._first_valid[k] = self._i
+            if None not in self._first_valid:
+                self._start = 1 + max(self._first_valid)
+
+
+    def _factor_scores(self):
+        """ 증분 지표의 현재 값으로 팩터 점수 계산 """
+        ema_adx_score = calc_ema_adx_score((self._ema_short.value,), (self._ema_long.value,), (self._adx.value,))
+        macd_score = calc_macd_hist_score((self._macd.macd,), (self._macd.signal,))
+        rsi_score = calc_rsi_score(self._rsi.value)
+        volume_score = calc_volume_score(self.data.Volume[-1], self._avg_volume.value)
+        return ema_adx_score, macd_score, rsi_score, volume_score
+
+
+    def get_market_regime(self):
+        """ 증분 SMA/표준편차로 z-score 레짐 판단 (regime_window 미만 구간은 NONE) """
+        self.std = 0
+        self.z_score = 0
+        if self._i < self.regime_window - 1:
+            self.market_regime = MarketRegime.NONE
+            return self.market_regime
+
+        self.std = self._regime_std
+        self.z_score = (self.data.Close[-1] - self._regime_sma.value) / self.std if self.std != 0 else 0.0
+        self.market_regime = self._classify_regime(self.std, self.z_score)
+        return self.market_regime
+
+
+@dataclass
+class ReplayResult:
+    latency: pd.DataFrame       # phase별 처리 시간 (bar: 바 전체, indicators: 지표 갱신, decision: 매매 판단)
+    trades: pd.DataFrame        # 청산 거래 (Size, EntryPrice, ExitPrice, PnL, EntryTime, ExitTime)
+    equity: pd.Series           # 바별 자산 (종가 기준)
+    bars: int                   # 재생한 바 수
+    decisions: int              # next()를 실행한 바 수 (워밍업 제외)
+    elapsed: float              # 재생 소요 시간(초)
+    late_bars: int              # 예정 시각보다 늦게 처리된 바 수 (speed 지정 시)
+    max_lag: float              # 최대 지연 시간(초)
+    profile: Optional[pd.DataFrame] = None      # 전략 메서드별 처리 시간 (profile=True인 경우)
+
+    def keeps_up(self, bar_seconds: float, phase: str = "bar") -> bool:
+        """ phase의 p99 처리 시간이 바 간격(초)보다 짧으면 True """
+        latency = self.latency.set_index("phase")
+        return bool(latency.loc[phase, "p99_us"] < bar_seconds * 1e6)
+
+
+def run_replay(
+    source: Union[str, pd.DataFrame],
+    speed: Optional[float] = None,
+    cash: float = 10000,
+    commission: float = .002,
+    strategy=ReplaySmartScore,
+    **params,
+) -> ReplayResult:
+    """
+    바를 하나씩 재생하며 전략을 실행합니다.
+
+    :param source: OHLCV 파일 경로(parquet/csv) 또는 DataFrame
+    :param speed: 재생 속도 배율 (None: 대기 없이 최대 속도, 1: 실시간)
+    :param params: 전략 파라미터 (SmartScore 클래스 변수, 기본값: log_enabled=False)
+    :return: ReplayResult (처리 시간 통계, 거래, 자산 곡선)
+    """
+    data = read_ohlcv_file(source) if isinstance(source, str) else source
+    params.setdefault("log_enabled", False)
+
+    broker = PaperBroker(cash=cash, commission=commission)
+    instance = strategy(broker, params)
+    feed = BarFeed(data, speed=speed)
+
+    started = time.perf_counter()
+    decisions = sum(instance.on_bar(*bar) for bar in feed)
+    elapsed = time.perf_counter() - started
+
+    return ReplayResult(
+        latency=instance.latency.summary(),
+        trades=pd.DataFrame(broker.closed_trades, columns=["Size", "EntryPrice", "ExitPrice", "PnL", "EntryTime", "ExitTime"]),
+        equity=pd.Series(instance.equity_curve, index=data.index, name="Equity"),
+        bars=len(data),
+        decisions=decisions,
+        elapsed=elapsed,
+        late_bars=len(feed.lags),
+        max_lag=max(feed.lags, default=0.0),
+        profile=instance.profiler.summary() if instance.profiler is not None else None,
+    )
+
+
+if __name__ == "__main__":
+    import sys
+
+    from config.config import backtesting_config
+    from utils.data_loader import get_stock_data
+
+    # python -m runner.replay [OHLCV 파일 경로] [speed]
+    if len(sys.argv) > 1:
+        source = sys.argv[1]
+    else:
+        source = get_stock_data(backtesting_config.SYMBOL, start=backtesting_config.FETCH_START, end=backtesting_config.BACKTEST_END)
+    speed = float(sys.argv[2]) if len(sys.argv) > 2 else None
+
+    result = run_replay(source, speed=speed, cash=backtesting_config.CASH, commission=backtesting_config.COMMISSION)
+    print(result.latency.to_string(index=False))
+    print(f"바 {result.bars}개 / 판단 {result.decisions}회 / {result.elapsed:.2f}s, 지연된 바 {result.late_bars}개")
+    print(f"1분봉 {'가능' if result.keeps_up(60) else '불가'}, 1초봉 {'가능' if result.keeps_up(1) else '불가'}")
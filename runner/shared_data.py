@@ -0,0 +1,90 @@
+import sys
+from multiprocessing import resource_tracker, shared_memory
+
+import numpy as np
+import pandas as pd
+
+
+class SharedOHLCV:
+    """
+    OHLCV DataFrame을 공유 메모리 한 블록에 올려 워커 프로세스들이 복사 없이 읽도록 합니다.
+    - 블록 구성: [인덱스(int64, ns) | 컬럼 값(float64, time x column)]
+    - spec(이름, 행 수, 컬럼, 타임존)만 워커에 전달되므로 태스크마다 데이터를 pickle하지 않습니다.
+    - 생성한 프로세스에서 close()(또는 with 블록 종료) 시 공유 메모리를 해제합니다.
+      (워커의 attach()는 resource_tracker에 등록하지 않으므로 워커 종료 시 해제되거나 경고가 출력되지 않음)
+    """
+
+    def __init__(self, data: pd.DataFrame):
+        n, columns = len(data), list(data.columns)
+        index = pd.DatetimeIndex(data.index)
+        tz = str(index.tz) if index.tz is not None else None
+        if tz is not None:
+            index = index.tz_convert("UTC").tz_localize(None)   # UTC 기준으로 저장
+
+        self.shm = shared_memory.SharedMemory(create=True, size=max(1, n * (len(columns) + 1) * 8))
+        index_buf, values_buf = self._views(self.shm, n, len(columns))
+        index_buf[:] = index.asi8
+        values_buf[:] = data.to_numpy(dtype=np.float64)
+
+        self.spec = (self.shm.name, n, columns, tz)
+
+
+    @staticmethod
+    def _views(shm, n, n_columns):
+        index_buf = np.ndarray((n,), dtype=np.int64, buffer=shm.buf)
+        values_buf = np.ndarray((n, n_columns), dtype=np.float64, buffer=shm.buf, offset=n * 8)
+        return index_buf, values_buf
+
+
+    @staticmethod
+    def attach(spec):
+        """
+        워커 프로세스에서 공유 메모리에 연결하여 (shm, DataFrame)을 반환합니다.
+        반환된 shm 객체는 DataFrame을 사용하는 동안 참조를 유지해야 합니다.
+        """
+        name, n, columns, tz = spec
+        shm = SharedOHLCV._open_untracked(name)
+
+        index_buf, values_buf = SharedOHLCV._views(shm, n, len(columns))
+        values_buf.setflags(write=False)
+
+        index = pd.DatetimeIndex(index_buf.view("M8[ns]"))
+        if tz is not None:
+            index = index.tz_localize("UTC").tz_convert(tz)
+        return shm, pd.DataFrame(values_buf, index=index, columns=columns, copy=False)
+
+
+    @staticmethod
+    def _open_untracked(name):
+        """
+        기존 공유 메모리에 resource_tracker 등록 없이 연결 (Python 3.13+의 track=False와 동일)
+        - 3.13 미만에서는 연결만 해도 등록되어, 별도 tracker를 쓰는 프로세스는 종료 시 블록을 해제(unlink)하고
+          "leaked shared_memory" 경고를 출력합니다.
+        - 연결 후 unregister하면 tracker를 공유하는 워커(fork/spawn 풀)는 생성 프로세스의 등록까지 지우게 되므로
+          연결하는 동안 등록 자체를 생략합니다. (워커 초기화 시 한 번만 호출)
+        """
+        if sys.version_info >= (3, 13):
+            return shared_memory.SharedMemory(name=name, track=False)
+
+        register = resource_tracker.register
+        resource_tracker.register = lambda resource, rtype: None if rtype == "shared_memory" else register(resource, rtype)
+        try:
+            return shared_memory.SharedMemory(name=name)
+        finally:
+            resource_tracker.register = register
+
+
+    def close(self):
+        if self.shm is None:
+            return
+        self.shm.close()
+        self.shm.unlink()
+        self.shm = None
+
+
+    def __enter__(self):
+        return self
+
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -0,0 +1,179 @@
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from config.config import PathConfig
+from runner.backtest import LoggedBacktest
+from runner.shared_data import SharedOHLCV
+from strategies.smart_score import SmartScore
+from utils.looger_sqlite import SQLiteLogger
+from utils.run_registry import RunRegistry
+from utils.stats import stats_to_row
+
+
+# ---------------------------
+# 🎲 파라미터 샘플링
+# ---------------------------
+def grid_params(param_grid: Dict[str, list]) -> List[dict]:
+    """
+    그리드 탐색용 파라미터 조합 생성
+    예: {"buy_threshold": [1.0, 1.5], "n1": [10, 12]} -> 4개 조합
+    """
+    keys = list(param_grid)
+    return [dict(zip(keys, values)) for values in itertools.product(*(param_grid[k] for k in keys))]
+
+
+def _is_int_range(bounds) -> bool:
+    return all(isinstance(b, (int, np.integer)) and not isinstance(b, bool) for b in bounds)
+
+
+def random_params(param_space: Dict[str, object], n: int, seed: Optional[int] = None) -> List[dict]:
+    """
+    랜덤 탐색용 파라미터 조합 생성
+    - 리스트 값: 후보 중 하나를 균등 선택
+    - (low, high) 튜플: 구간 내 균등 샘플 (둘 다 정수면 정수 샘플, high 포함)
+    """
+    rng = np.random.default_rng(seed)
+    samples = [{} for _ in range(n)]
+
+    for key, space in param_space.items():
+        if isinstance(space, tuple):
+            low, high = space
+            values = rng.integers(low, high + 1, n) if _is_int_range(space) else rng.uniform(low, high, n)
+        else:
+            values = [space[i] for i in rng.integers(0, len(space), n)]
+        for sample, value in zip(samples, values):
+            sample[key] = value.item() if hasattr(value, "item") else value
+
+    return samples
+
+
+def latin_hypercube_params(param_space: Dict[str, object], n: int, seed: Optional[int] = None) -> List[dict]:
+    """
+    라틴 하이퍼큐브 샘플링으로 파라미터 조합 생성
+    - 각 파라미터 구간을 n개 층으로 나누고 층마다 정확히 한 번씩 샘플 -> 적은 실행 수로 공간 전체를 고르게 탐색
+    - 값의 형식은 random_params와 동일 (리스트: 후보 선택, 튜플: 구간)
+    """
+    rng = np.random.default_rng(seed)
+    samples = [{} for _ in range(n)]
+
+    for key, space in param_space.items():
+        # [0, 1) 구간의 층화 샘플을 파라미터마다 독립적으로 섞음
+        u = (rng.permutation(n) + rng.uniform(0, 1, n)) / n
+
+        if isinstance(space, tuple):
+            low, high = space
+            if _is_int_range(space):
+                values = np.minimum(low + np.floor(u * (high - low + 1)).astype(int), high)
+            else:
+                values = low + u * (high - low)
+        else:
+            values = [space[i] for i in np.floor(u * len(space)).astype(int)]
+
+        for sample, value in zip(samples, values):
+            sample[key] = value.item() if hasattr(value, "item") else value
+
+    return samples
+
+
+# ---------------------------
+# ⚙️ 워커 프로세스
+# ---------------------------
+_worker = {}
+
+
+def _init_worker(spec, strategy, cash, commission, log_dir, symbol, registry_path):
+    """
+    워커 초기화: 공유 메모리의 OHLCV에 연결하고 LoggedBacktest 객체를 한 번만 생성
+    - 조합마다 run_id를 발급하여 로그 레코드에 붙이고, 실행 레지스트리(registry_path)에 기록
+    - log_dir이 주어지면 워커별 SQLite 파일로 로그를 분리, 없으면 로그 기록 비활성화
+    """
+    shm, data = SharedOHLCV.attach(spec)
+    _worker["shm"] = shm    # DataFrame이 참조하는 버퍼 유지
+    sink = SQLiteLogger(db_path=os.path.join(log_dir, f"sweep_{os.getpid()}.sqlite")) if log_dir is not None else None
+    _worker["bt"] = LoggedBacktest(
+        data, strategy, cash=cash, commission=commission, symbol=symbol, sink=sink, registry=RunRegistry(registry_path),
+    )
+    # log_enabled 파라미터를 지원하는 전략에만 전달
+    _worker["base_params"] = {"log_enabled": log_dir is not None} if hasattr(strategy, "log_enabled") else {}
+
+
+def _run_one(params: dict) -> dict:
+    """ 파라미터 조합 하나를 실행하여 결과 행을 반환 (실패 시 error 컬럼에 기록) """
+    bt = _worker["bt"]
+    try:
+        stats = bt.run(**_worker["base_params"], **params)
+        return {"run_id": bt.run_id, **params, **stats_to_row(stats), "error": None}
+    except Exception as e:
+        return {"run_id": bt.run_id, **params, "error": f"{type(e).__name__}: {e}"}
+
+
+def run_sweep(
+    data: pd.DataFrame,
+    params: List[dict],
+    strategy=SmartScore,
+    metric: str = "SQN",
+    maximize: bool = True,
+    max_workers: Optional[int] = None,
+    cash: float = 10000,
+    commission: float = .002,
+    log_dir: Optional[str] = None,
+    symbol: Optional[str] = None,
+    registry_path: Optional[str] = None,
+) -> pd.DataFrame:
+    """
+    파라미터 조합들을 프로세스 풀에서 병렬로 백테스트하고 결과를 하나의 테이블로 반환합니다.
+
+    :param data: OHLCV DataFrame (공유 메모리로 한 번만 전달)
+    :param params: 파라미터 조합 리스트 (grid_params / random_params / latin_hypercube_params)
+    :param metric: 랭킹 기준 stats 항목 (예: "SQN", "Return [%]", "Sharpe Ratio")
+    :param maximize: True면 metric 내림차순, False면 오름차순 정렬
+    :param max_workers: 워커 프로세스 수 (기본: CPU 코어 수)
+    :param log_dir: 워커별 로그 SQLite 저장 디렉토리 (None이면 로그 기록 비활성화)
+    :param symbol: 로그 레코드/실행 레지스트리에 기록할 종목 코드
+    :param registry_path: 실행 레지스트리 SQLite 경로 (기본값: PathConfig.RUN_REGISTRY_PATH)
+    :return: run_id + 파라미터 + stats 항목 컬럼의 DataFrame (rank 컬럼 포함, metric 기준 정렬)
+             run_id로 로그 레코드(run_id 컬럼)와 실행 레지스트리를 조회할 수 있습니다.
+    """
+    max_workers = max_workers or os.cpu_count() or 1
+    # 워커당 여러 조합을 묶어 전달하여 프로세스 간 통신 비용을 줄임
+    chunksize = max(1, len(params) // (max_workers * 4))
+
+    registry_path = registry_path or PathConfig.RUN_REGISTRY_PATH
+    if log_dir is not None:
+        os.makedirs(log_dir, exist_ok=True)
+
+    with SharedOHLCV(data) as shared:
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_worker,
+            initargs=(shared.spec, strategy, cash, commission, log_dir, symbol, registry_path),
+        ) as executor:
+            rows = list(executor.map(_run_one, params, chunksize=chunksize))
+
+    results = pd.DataFrame(rows)
+    if metric in results:
+        results = results.sort_values(metric, ascending=not maximize, na_position="last", kind="stable")
+        results.insert(0, "rank", range(1, len(results) + 1))
+    return results.reset_index(drop=True)
+
+
+if __name__ == "__main__":
+    from config.config import backtesting_config
+    from utils.data_loader import get_stock_data
+
+    data = get_stock_data(backtesting_config.SYMBOL, start=backtesting_config.FETCH_START, end=backtesting_config.BACKTEST_END)
+    data = data[data.index >= backtesting_config.BACKTEST_START]
+
+    grid = grid_params({
+        "buy_threshold": [1.0, 1.5, 2.0, 2.5],
+        "trailing_stop_drawdown": [0.05, 0.1, 0.15],
+        "regime_window": [10, 20, 30],
+    })
+    results = run_sweep(data, grid, metric="SQN", symbol=backtesting_config.SYMBOL,
+                        cash=backtesting_config.CASH, commission=backtesting_config.COMMISSION)
+    print(results.head(10).to_string())
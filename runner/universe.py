@@ -0,0 +1,178 @@
+import multiprocessing
+import os
+import pprint
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+from typing import Callable, List, Optional
+
+import pandas as pd
+
+from config.config import PathConfig, backtesting_config
+from runner.backtest import LoggedBacktest
+from strategies.smart_score import SmartScore
+from utils.data_loader import OHLCVCache, get_default_cache
+from utils.looger_sqlite import SQLiteLogger
+from utils.prefetch import iter_prefetch
+from utils.result_store import ParquetResultStore
+from utils.run_registry import RunRegistry
+from utils.stats import stats_to_row
+
+
+# 요약 테이블의 기본 컬럼 (성공한 종목은 뒤에 stats 항목 컬럼이 추가됨)
+SUMMARY_COLUMNS = ["symbol", "run_id", "status", "error", "elapsed_sec"]
+
+
+def load_universe(path: Optional[str] = None, symbols: Optional[str] = None) -> List[str]:
+    """
+    유니버스 종목 리스트를 읽어옵니다.
+    - path: 한 줄에 종목 하나인 텍스트 파일, 또는 symbol 컬럼이 있는 CSV (# 주석/빈 줄 무시)
+    - symbols: 콤마로 구분한 종목 문자열
+    둘 다 없으면 BacktestConfig.UNIVERSE_FILE / UNIVERSE 설정을 사용합니다.
+    """
+    if path is None and symbols is None:
+        path = backtesting_config.UNIVERSE_FILE or None
+        symbols = backtesting_config.UNIVERSE or None
+
+    if path:
+        if path.endswith(".csv"):
+            items = pd.read_csv(path)["symbol"].astype(str).tolist()
+        else:
+            with open(path, "r", encoding="utf-8") as f:
+                items = [line.split("#")[0] for line in f]
+    elif symbols:
+        items = symbols.split(",")
+    else:
+        raise ValueError("유니버스 종목이 지정되지 않았습니다. (UNIVERSE_FILE 또는 UNIVERSE 설정)")
+
+    # 공백 제거 + 중복 제거 (순서 유지)
+    return list(dict.fromkeys(s.strip().upper() for s in items if s.strip()))
+
+
+def _run_symbol(
+    symbol: str, data: pd.DataFrame, strategy, cash, commission, out_dir: str, store_dir: str, registry_path: str,
+) -> dict:
+    """
+    워커에서 종목 하나를 백테스트합니다.
+    - 종목별 디렉토리(out_dir/symbol)에 로그 SQLite와 결과 텍스트를 분리 저장
+    - 로그/stats는 Parquet 결과 저장소(store_dir)의 symbol 파티션에도 기록
+    - 실행 정보(run_id, 파라미터, 데이터 지문, 소요 시간)는 공유 실행 레지스트리(registry_path)에 기록
+    - 예외는 호출 측으로 전파하지 않고 status/error로 기록
+    """
+    started = time.perf_counter()
+    symbol_dir = os.path.join(out_dir, symbol)
+    os.makedirs(symbol_dir, exist_ok=True)
+
+    sink = SQLiteLogger(db_path=os.path.join(symbol_dir, "strategy_logs.sqlite"))
+    bt = None
+    try:
+        bt = LoggedBacktest(
+            data, strategy, cash=cash, commission=commission, symbol=symbol, sink=sink,
+            result_store=ParquetResultStore(store_dir), registry=RunRegistry(registry_path),
+        )
+        stats = bt.run()
+        with open(os.path.join(symbol_dir, PathConfig.TXT_BACKTEST_LOG), "w", encoding="utf-8") as f:
+            f.write(pprint.pformat(stats) + "\n")
+        row = {"symbol": symbol, "run_id": bt.run_id, "status": "ok", "error": None, **stats_to_row(stats)}
+    except Exception as e:
+        run_id = bt.run_id if bt is not None else None
+        row = {"symbol": symbol, "run_id": run_id, "status": "failed", "error": f"{type(e).__name__}: {e}"}
+    finally:
+        sink.close()
+
+    row["elapsed_sec"] = round(time.perf_counter() - started, 3)
+    return row
+
+
+def _print_progress(done: int, total: int, row: dict):
+    mark = "✅" if row["status"] == "ok" else "❌"
+    detail = f"Return {row.get('Return [%]', float('nan')):.2f}%" if row["status"] == "ok" else row["error"]
+    print(f"[{done}/{total}] {mark} {row['symbol']} ({row['elapsed_sec']:.2f}s) {detail}")
+
+
+def run_universe(
+    symbols: List[str],
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    fetch_start: Optional[str] = None,
+    strategy=SmartScore,
+    cash: Optional[float] = None,
+    commission: Optional[float] = None,
+    max_workers: Optional[int] = None,
+    max_concurrency: Optional[int] = None,
+    out_dir: Optional[str] = None,
+    cache: Optional[OHLCVCache] = None,
+    store_dir: Optional[str] = None,
+    registry_path: Optional[str] = None,
+    progress: Optional[Callable[[int, int, dict], None]] = _print_progress,
+) -> pd.DataFrame:
+    """
+    여러 종목을 프로세스 풀에서 병렬로 백테스트하고 종목별 요약을 하나의 테이블로 저장합니다.
+
+    - 데이터: 캐시(OHLCVCache.get)를 거쳐 종목별로 동시에 로드(utils.prefetch, 최대 max_concurrency개, 실패 시 재시도)하고,
+      로드가 끝난 종목부터 바로 백테스트를 제출 (나머지 종목은 백테스트와 동시에 계속 로드)
+    - 격리: 종목별 출력 디렉토리, 종목별 실패는 status="failed" 행으로 기록하고 나머지는 계속 진행
+    - 결과: out_dir/summary.parquet (종목당 한 행, stats 항목 컬럼)
+    - 로그: store_dir(기본값 PathConfig.RESULT_STORE_DIR)의 Parquet 결과 저장소에 종목별로 누적
+    - 실행 정보: registry_path(기본값 PathConfig.RUN_REGISTRY_PATH)의 실행 레지스트리에 종목별 run_id로 기록
+    - progress: 종목 하나가 끝날 때마다 (완료 수, 전체 수, 결과 행)으로 호출 (None이면 출력 안 함)
+    """
+    start = start or backtesting_config.BACKTEST_START
+    end = end or backtesting_config.BACKTEST_END
+    fetch_start = fetch_start or backtesting_config.FETCH_START
+    cash = cash or backtesting_config.CASH
+    commission = backtesting_config.COMMISSION if commission is None else commission
+    max_workers = max_workers or backtesting_config.UNIVERSE_WORKERS or os.cpu_count() or 1
+    max_concurrency = max_concurrency or backtesting_config.UNIVERSE_PREFETCH
+    out_dir = out_dir or os.path.join(PathConfig.RESULT_DIR, f"universe_{datetime.now().strftime('%H%M%S')}")
+    cache = cache or get_default_cache()
+    store_dir = store_dir or PathConfig.RESULT_STORE_DIR
+    registry_path = registry_path or PathConfig.RUN_REGISTRY_PATH
+    os.makedirs(out_dir, exist_ok=True)
+
+    rows, done, total = [], 0, len(symbols)
+
+    def record(row):
+        nonlocal done
+        done += 1
+        rows.append(row)
+        if progress is not None:
+            progress(done, total, row)
+
+    # 데이터 로드 스레드가 도는 중에 워커를 만들므로 fork 대신 spawn 사용 (스레드 상태/잠금을 복제하지 않음)
+    with ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context("spawn")) as executor:
+        futures = {}
+        # 📥 완료된 종목부터 수신 (SMA 등 프리롤 기간 포함 후 백테스트 구간만 사용)
+        loaded = iter_prefetch(symbols, fetch_start, end, provider=cache, max_concurrency=max_concurrency)
+        for symbol, data in loaded:
+            if isinstance(data, Exception):
+                record({"symbol": symbol, "status": "failed", "error": f"{type(data).__name__}: {data}", "elapsed_sec": 0.0})
+                continue
+
+            data = data[data.index >= start]
+            if data.empty:
+                record({"symbol": symbol, "status": "failed", "error": "데이터 없음", "elapsed_sec": 0.0})
+                continue
+
+            futures[executor.submit(_run_symbol, symbol, data, strategy, cash, commission, out_dir, store_dir, registry_path)] = symbol
+
+        for future in as_completed(futures):
+            try:
+                row = future.result()
+            except Exception as e:   # 워커 프로세스 자체가 죽은 경우 등
+                row = {"symbol": futures[future], "status": "failed", "error": f"{type(e).__name__}: {e}", "elapsed_sec": 0.0}
+            record(row)
+
+    # 입력 순서대로 정렬하여 요약 저장
+    order = {symbol: i for i, symbol in enumerate(symbols)}
+    summary = pd.DataFrame(rows) if rows else pd.DataFrame(columns=SUMMARY_COLUMNS)  # 종목이 없어도 같은 컬럼
+    summary = summary.sort_values("symbol", key=lambda s: s.map(order)).reset_index(drop=True)
+    summary.to_parquet(os.path.join(out_dir, "summary.parquet"), index=False)
+    return summary
+
+
+if __name__ == "__main__":
+    universe = load_universe()
+    summary = run_universe(universe)
+    ok = (summary["status"] == "ok").sum()
+    print(f"📊 {ok}/{len(summary)} 종목 완료")
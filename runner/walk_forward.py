@@ -0,0 +1,259 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from backtesting import Backtest
+
+from config.config import PathConfig
+from runner.backtest import LoggedBacktest
+from runner.shared_data import SharedOHLCV
+from strategies.smart_score import SmartScore
+from utils.run_registry import RunRegistry
+from utils.stats import stats_to_row
+
+
+"""
+🚶 walk_forward
+
+롤링 in-sample(IS) 최적화 / out-of-sample(OOS) 검증 (walk-forward optimization)
+
+1. 지표/팩터 점수/레짐을 전체 히스토리(FETCH_START~)에 대해 한 번만 계산합니다.
+   (전략의 init()을 그대로 실행하여 값을 얻고, 지표 관련 파라미터 조합마다 한 번씩)
+2. 각 구간은 OHLCV와 사전 계산 배열을 같은 행 범위로 잘라 전략의 precomputed 파라미터로 전달합니다.
+   구간 앞의 히스토리로 워밍업이 끝난 값이므로 구간 첫 바부터 지표가 유효합니다. (구간별 지표 재계산 없음)
+3. 모든 구간의 IS 파라미터 탐색을 프로세스 풀에서 병렬로 실행하고, 구간별 최적 파라미터로 OOS를 실행합니다.
+4. OOS 자산 곡선을 이어 붙여(앞 구간의 마지막 자산에서 다음 구간 시작) 하나의 결과로 반환합니다.
+
+IS/OOS 실행마다 run_id를 발급하여 실행 레지스트리에 기록하고, trials/windows의 run_id 컬럼으로 조회할 수 있습니다.
+
+구간 크기는 바(bar) 수로 지정하며, 구간은 backtest_start 이후 행에서만 만듭니다.
+"""
+
+
+@dataclass
+class WalkForwardResult:
+    windows: pd.DataFrame       # 구간별 IS/OOS 기간, 선택된 파라미터, IS/OOS 지표
+    trials: pd.DataFrame        # 모든 IS 실행 결과 (window, 파라미터, stats)
+    equity: pd.Series           # 이어 붙인 OOS 자산 곡선
+
+    def summary(self) -> dict:
+        """ 이어 붙인 OOS 자산 곡선의 수익률/최대 낙폭 """
+        if self.equity.empty:
+            return {"windows": 0, "Return [%]": np.nan, "Max. Drawdown [%]": np.nan}
+        drawdown = self.equity / self.equity.cummax() - 1
+        return {
+            "windows": len(self.windows),
+            "Start": self.equity.index[0],
+            "End": self.equity.index[-1],
+            "Equity Final [$]": float(self.equity.iloc[-1]),
+            "Return [%]": float((self.equity.iloc[-1] / self.equity.iloc[0] - 1) * 100),
+            "Max. Drawdown [%]": float(drawdown.min() * 100),
+        }
+
+
+def walk_forward_windows(
+    n_bars: int, start: int, train_bars: int, test_bars: int,
+    step_bars: Optional[int] = None, anchored: bool = False,
+) -> List[Tuple[int, int, int, int]]:
+    """
+    구간 목록 [(is_start, is_end, oos_start, oos_end)] (행 번호, end는 미포함)
+    :param start: 첫 IS 구간 시작 행 (backtest_start 위치, 그 이전은 워밍업용 히스토리)
+    :param step_bars: 다음 구간까지의 이동 바 수 (기본값: test_bars, OOS 구간이 겹치지 않음)
+    :param anchored: True이면 IS 구간 시작을 start에 고정하고 끝만 늘림 (expanding window)
+    """
+    step_bars = step_bars or test_bars
+    windows = []
+    offset = start
+    while offset + train_bars < n_bars:
+        is_start = start if anchored else offset
+        is_end = offset + train_bars
+        windows.append((is_start, is_end, is_end, min(is_end + test_bars, n_bars)))
+        offset += step_bars
+    return windows
+
+
+def precompute_key(strategy, params: dict) -> tuple:
+    """ 사전 계산 결과를 공유할 수 있는 파라미터 값 (전략의 _PRECOMPUTE_PARAMS 기준) """
+    return tuple((name, params.get(name, getattr(strategy, name))) for name in strategy._PRECOMPUTE_PARAMS)
+
+
+def precompute_indicators(data: pd.DataFrame, strategy=SmartScore, params: Optional[dict] = None) -> Dict[str, np.ndarray]:
+    """
+    전략의 init()을 data 전체에 대해 한 번 실행하고 사전 계산 배열(export_precomputed)을 반환
+    (공개 API인 Backtest.run으로 실행하되, next()는 아무것도 하지 않는 하위 클래스를 사용하여 주문/점수 계산 없이 바 루프만 통과)
+    """
+    class PrecomputeOnly(strategy):
+        def next(self):
+            pass
+
+    stats = Backtest(data, PrecomputeOnly).run(**(params or {}), log_enabled=False)
+    return stats._strategy.export_precomputed()
+
+
+# ---------------------------
+# ⚙️ 워커 프로세스
+# ---------------------------
+_worker = {}
+
+
+def _init_worker(spec, precomputed, strategy, cash, commission, symbol, registry_path):
+    """ 워커 초기화: 공유 메모리 OHLCV 연결, 사전 계산 배열 보관 """
+    shm, data = SharedOHLCV.attach(spec)
+    _worker.update(
+        shm=shm, data=data, precomputed=precomputed, strategy=strategy, cash=cash, commission=commission,
+        symbol=symbol, registry=RunRegistry(registry_path),
+    )
+
+
+def _run_window(task) -> dict:
+    """ 구간 하나에서 파라미터 조합 하나를 실행 (실패 시 error 컬럼에 기록) """
+    window, phase, lo, hi, params = task
+    strategy = _worker["strategy"]
+    row = {"window": window, "phase": phase, "run_id": None, **params}
+    try:
+        arrays = _worker["precomputed"][precompute_key(strategy, params)]
+        bt = LoggedBacktest(
+            _worker["data"].iloc[lo:hi], strategy, cash=_worker["cash"], commission=_worker["commission"],
+            symbol=_worker["symbol"], registry=_worker["registry"],
+        )
+        try:
+            stats = bt.run(**params, log_enabled=False, precomputed={k: v[lo:hi] for k, v in arrays.items()})
+        finally:
+            row["run_id"] = bt.run_id
+        row.update(stats_to_row(stats), error=None)
+        if phase == "oos":
+            row["_equity"] = stats["_equity_curve"]["Equity"]
+    except Exception as e:
+        row["error"] = f"{type(e).__name__}: {e}"
+    return row
+
+
+def _best_params(trials: pd.DataFrame, keys: List[str], metric: str, maximize: bool) -> dict:
+    """ IS 결과에서 metric 기준 최적 파라미터 (모두 NaN/실패면 첫 조합) """
+    ok = trials[trials["error"].isna()] if "error" in trials else trials
+    if metric in ok and ok[metric].notna().any():
+        best = ok.loc[ok[metric].idxmax() if maximize else ok[metric].idxmin()]
+    else:
+        best = trials.iloc[0]
+    return {k: best[k].item() if hasattr(best[k], "item") else best[k] for k in keys}
+
+
+def _stitch(curves: List[pd.Series], cash: float) -> pd.Series:
+    """ 구간별 OOS 자산 곡선을 이어 붙임 (각 구간을 앞 구간의 마지막 자산에서 시작하도록 비율 조정) """
+    parts, level = [], cash
+    for curve in curves:
+        if curve is None or curve.empty:
+            continue
+        scaled = curve / curve.iloc[0] * level
+        parts.append(scaled)
+        level = scaled.iloc[-1]
+    return pd.concat(parts).rename("Equity") if parts else pd.Series(dtype=float, name="Equity")
+
+
+def run_walk_forward(
+    data: pd.DataFrame,
+    params: List[dict],
+    train_bars: int,
+    test_bars: int,
+    backtest_start=None,
+    step_bars: Optional[int] = None,
+    anchored: bool = False,
+    strategy=SmartScore,
+    metric: str = "SQN",
+    maximize: bool = True,
+    max_workers: Optional[int] = None,
+    cash: float = 10000,
+    commission: float = .002,
+    symbol: Optional[str] = None,
+    registry_path: Optional[str] = None,
+) -> WalkForwardResult:
+    """
+    walk-forward 최적화를 실행합니다.
+
+    :param data: 워밍업 구간(FETCH_START~)을 포함한 전체 OHLCV
+    :param params: IS에서 탐색할 파라미터 조합 (runner.sweep의 grid_params / random_params / latin_hypercube_params)
+    :param train_bars: IS 구간 바 수
+    :param test_bars: OOS 구간 바 수
+    :param backtest_start: 첫 IS 구간 시작일 (BACKTEST_START, 이전 데이터는 지표 워밍업에만 사용, 기본값: 처음부터)
+    :param metric: IS 최적화 기준 stats 항목
+    :param symbol: 실행 레지스트리에 기록할 종목 코드
+    :param registry_path: 실행 레지스트리 SQLite 경로 (기본값: PathConfig.RUN_REGISTRY_PATH)
+    :return: WalkForwardResult (windows, trials, equity)
+    """
+    start = 0 if backtest_start is None else int(data.index.searchsorted(pd.Timestamp(backtest_start)))
+    windows = walk_forward_windows(len(data), start, train_bars, test_bars, step_bars, anchored)
+    if not windows:
+        raise ValueError(f"구간을 만들 수 없습니다: 바 {len(data) - start}개 < IS {train_bars}개 + OOS 1개")
+    params = params or [{}]
+    registry_path = registry_path or PathConfig.RUN_REGISTRY_PATH
+
+    # 지표 관련 파라미터 조합마다 전체 히스토리로 한 번씩 계산
+    precomputed = {}
+    for p in params:
+        key = precompute_key(strategy, p)
+        if key not in precomputed:
+            precomputed[key] = precompute_indicators(data, strategy, dict(key))
+
+    max_workers = max_workers or os.cpu_count() or 1
+    is_tasks = [(w, "is", lo, hi, p) for w, (lo, hi, _, _) in enumerate(windows) for p in params]
+
+    with SharedOHLCV(data) as shared:
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_worker,
+            initargs=(shared.spec, precomputed, strategy, cash, commission, symbol, registry_path),
+        ) as executor:
+            chunksize = max(1, len(is_tasks) // (max_workers * 4))
+            trials = pd.DataFrame(list(executor.map(_run_window, is_tasks, chunksize=chunksize)))
+
+            keys = sorted({k for p in params for k in p})
+            best = [_best_params(trials[trials["window"] == w], keys, metric, maximize) for w in range(len(windows))]
+            oos_tasks = [(w, "oos", lo, hi, best[w]) for w, (_, _, lo, hi) in enumerate(windows)]
+            oos = list(executor.map(_run_window, oos_tasks))
+
+    index = data.index
+    rows = []
+    for w, ((is_lo, is_hi, oos_lo, oos_hi), result) in enumerate(zip(windows, oos)):
+        in_sample = trials[(trials["window"] == w) & trials["error"].isna()]
+        is_metric = in_sample[metric] if metric in in_sample else pd.Series(dtype=float)
+        rows.append({
+            "window": w,
+            "is_start": index[is_lo], "is_end": index[is_hi - 1],
+            "oos_start": index[oos_lo], "oos_end": index[oos_hi - 1],
+            "oos_run_id": result.get("run_id"),
+            **best[w],
+            f"is_{metric}": is_metric.max() if maximize else is_metric.min(),
+            f"oos_{metric}": result.get(metric),
+            "oos_return": result.get("Return [%]"),
+            "oos_trades": result.get("# Trades"),
+            "error": result.get("error"),
+        })
+
+    return WalkForwardResult(
+        windows=pd.DataFrame(rows),
+        trials=trials,
+        equity=_stitch([r.get("_equity") for r in oos], cash),
+    )
+
+
+if __name__ == "__main__":
+    from config.config import backtesting_config
+    from runner.sweep import grid_params
+    from utils.data_loader import get_stock_data
+
+    data = get_stock_data(backtesting_config.SYMBOL, start=backtesting_config.FETCH_START, end=backtesting_config.BACKTEST_END)
+    grid = grid_params({
+        "buy_threshold": [1.0, 1.5, 2.0],
+        "sell_threshold": [-1.0, -1.5, -2.0],
+        "trailing_stop_drawdown": [0.05, 0.1],
+    })
+    result = run_walk_forward(
+        data, grid, train_bars=252, test_bars=63, backtest_start=backtesting_config.BACKTEST_START,
+        symbol=backtesting_config.SYMBOL,
+        cash=backtesting_config.CASH, commission=backtesting_config.COMMISSION,
+    )
+    print(result.windows.to_string())
+    print(result.summary())
@@ -1,11 +1,21 @@
-from .ema_adx_score import calc_ema_adx_score
-from .macd_hist_score import calc_macd_hist_score
-from .rsi_score import calc_rsi_score
-from .volume_score import calc_volume_score
+from .ema_adx_score import calc_ema_adx_score, calc_ema_adx_score_batch
+from .macd_hist_score import calc_macd_hist_score, calc_macd_hist_score_batch
+from .rsi_score import calc_rsi_score, calc_rsi_score_batch
+from .volume_score import calc_volume_score, calc_volume_score_batch
+from .bollinger_score import calc_bb_score_z, calc_bb_score_z_batch
+from .sma_score import calc_sma_score, calc_sma_score_batch
 
 __all__ = [
     "calc_ema_adx_score",
     "calc_macd_hist_score",
     "calc_rsi_score",
     "calc_volume_score",
-]
\ No newline at end of file
+    "calc_bb_score_z",
+    "calc_sma_score",
+    "calc_ema_adx_score_batch",
+    "calc_macd_hist_score_batch",
+    "calc_rsi_score_batch",
+    "calc_volume_score_batch",
+    "calc_bb_score_z_batch",
+    "calc_sma_score_batch",
+]
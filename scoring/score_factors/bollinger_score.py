@@ -9,9 +9,23 @@ def calc_bb_score_z(current_price, bb_mid, bb_upper, bb_lower, num_std=2):
     """ 최종적으로 산출된 z-score와 B.B 가중치를 곱하여 -3 ~ 3점으로 변환 """
     bb_width = bb_upper - bb_lower
     if bb_width == 0:
-        return 0
-    
+        return 0.0
+
     std = bb_width / (2 * num_std) # 표준편차 계산
     z = (current_price - bb_mid) / std
+    return min(max(float(z) * 3, -3.0), 3.0) # 과매도 최대 3점, 과매수 최소 -3점
+
+
+def calc_bb_score_z_batch(current_price, bb_mid, bb_upper, bb_lower, num_std=2) -> np.ndarray:
+    """calc_bb_score_z의 배열 버전"""
+    """ 밴드 폭이 0인 바는 0점 처리 """
+    current_price = np.asarray(current_price, dtype=float)
+    bb_mid = np.asarray(bb_mid, dtype=float)
+    bb_width = np.asarray(bb_upper, dtype=float) - np.asarray(bb_lower, dtype=float)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        std = bb_width / (2 * num_std) # 표준편차 계산
+        z = (current_price - bb_mid) / std
+        bb_score = np.clip(z * 3, -3, 3) # 과매도 최대 3점, 과매수 최소 -3점
 
-    return float(np.clip(z * 3, -3, 3)) # 과매도 최대 3점, 과매수 최소 -3점
+    return np.where(bb_width == 0, 0.0, bb_score)
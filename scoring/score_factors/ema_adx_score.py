@@ -1,3 +1,5 @@
+import math
+
 import numpy as np
 
 def calc_ema_adx_score(ema_short, ema_long, adx_values, sensitivity=800):
@@ -6,26 +8,55 @@ def calc_ema_adx_score(ema_short, ema_long, adx_values, sensitivity=800):
     - EMA 점수 (60%), ADX 점수 (40%) 합산
     - 최종 점수는 -4 ~ 4 범위로 조정
     """
-    if (
-        len(ema_short) < 1 or len(ema_long) < 1 or len(adx_values) < 1 or
-        np.isnan(ema_short[-1]) or np.isnan(ema_long[-1]) or np.isnan(adx_values[-1])
-    ):
+    if len(ema_short) < 1 or len(ema_long) < 1 or len(adx_values) < 1:
+        return 0.0
+
+    ema_short, ema_long, adx_value = float(ema_short[-1]), float(ema_long[-1]), float(adx_values[-1])
+    if math.isnan(ema_short) or math.isnan(ema_long) or math.isnan(adx_value):
         return 0.0
 
-    # ✅ EMA 스프레드 계산
-    spread = (ema_short[-1] - ema_long[-1]) / ema_long[-1]
-    spread_scaled = spread * sensitivity
-    ema_score = np.clip(spread_scaled, -2.4, 2.4)
+    # ✅ EMA 스프레드 점수
+    diff = ema_short - ema_long
+    if ema_long != 0:
+        spread = diff / ema_long
+    else:
+        spread = diff * math.inf if diff else math.nan  # 배열 버전(0 나눗셈 -> ±inf / NaN)과 동일
+    ema_score = min(max(spread * sensitivity, -2.4), 2.4)
 
-    # ✅ ADX 점수 계산
-    adx_value = adx_values[-1]
+    # ✅ ADX 점수
     if adx_value >= 25:
         adx_score = 1.6
     elif adx_value <= 15:
         adx_score = -1.6
     else:
-        normalized = (adx_value - 15) / 10
-        adx_score = (normalized * 3.2) - 1.6
+        adx_score = ((adx_value - 15) / 10 * 3.2) - 1.6
+
+    return min(max(ema_score + adx_score, -4.0), 4.0)
+
+
+def calc_ema_adx_score_batch(ema_short, ema_long, adx_values, sensitivity=800) -> np.ndarray:
+    """
+    calc_ema_adx_score의 배열 버전
+    - 전체 히스토리를 한 번에 계산하여 바(bar)별 점수 배열을 반환
+    - 입력 중 하나라도 NaN인 바는 0점 처리 (스칼라 버전과 동일)
+    """
+    ema_short = np.asarray(ema_short, dtype=float)
+    ema_long = np.asarray(ema_long, dtype=float)
+    adx_values = np.asarray(adx_values, dtype=float)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        # ✅ EMA 스프레드 점수
+        spread = (ema_short - ema_long) / ema_long
+        ema_score = np.clip(spread * sensitivity, -2.4, 2.4)
+
+        # ✅ ADX 점수
+        adx_score = np.select(
+            [adx_values >= 25, adx_values <= 15],
+            [1.6, -1.6],
+            default=((adx_values - 15) / 10 * 3.2) - 1.6,
+        )
+
+        total_score = np.clip(ema_score + adx_score, -4.0, 4.0)
 
-    total_score = ema_score + adx_score
-    return float(np.clip(total_score, -4.0, 4.0))
+    invalid = np.isnan(ema_short) | np.isnan(ema_long) | np.isnan(adx_values)
+    return np.where(invalid, 0.0, total_score)
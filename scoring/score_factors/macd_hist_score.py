@@ -5,6 +5,14 @@ def calc_macd_hist_score(macd, signal) -> float:
     MACD 히스토그램 기반 스코어 계산
     - 결과 점수는 -2 ~ +2 범위로 고정
     """
-    hist = macd[-1] - signal[-1]
-    hist_score = np.clip(hist * 10, -2, 2)  # 민감도 10배
-    return float(hist_score)
\ No newline at end of file
+    hist = float(macd[-1]) - float(signal[-1])
+    return min(max(hist * 10, -2.0), 2.0)  # 민감도 10배 (NaN은 그대로 NaN)
+
+
+def calc_macd_hist_score_batch(macd, signal) -> np.ndarray:
+    """
+    calc_macd_hist_score의 배열 버전
+    - 결과 점수 배열은 -2 ~ +2 범위로 고정
+    """
+    hist = np.asarray(macd, dtype=float) - np.asarray(signal, dtype=float)
+    return np.clip(hist * 10, -2, 2)  # 민감도 10배
@@ -1,16 +1,27 @@
+import numpy as np
+
 def calc_rsi_score(rsi_value):
     """ RSI 점수 계산 """
     """ rsi_value: RSI 값 """
     """ RSI 20 이하 -> -2점, RSI 80 이상 -> -2점 """
     if rsi_value < 20:
-        rsi_score = 2.0
+        return 2.0
     elif rsi_value < 30:
-        rsi_score = 1.0
+        return 1.0
     elif rsi_value > 80:
-        rsi_score = -2.0
+        return -2.0
     elif rsi_value > 70:
-        rsi_score = -1.0
-    else:
-        rsi_score = 0.0
+        return -1.0
+    return 0.0  # 30 ~ 70 구간 및 NaN
+
 
-    return rsi_score
\ No newline at end of file
+def calc_rsi_score_batch(rsi_values) -> np.ndarray:
+    """ calc_rsi_score의 배열 버전 """
+    """ rsi_values: RSI 시계열 (NaN은 0점 처리) """
+    rsi_values = np.asarray(rsi_values, dtype=float)
+    with np.errstate(invalid="ignore"):
+        return np.select(
+            [rsi_values < 20, rsi_values < 30, rsi_values > 80, rsi_values > 70],
+            [2.0, 1.0, -2.0, -1.0],
+            default=0.0,
+        )
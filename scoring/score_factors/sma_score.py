@@ -1,30 +1,78 @@
+import math
+
 import numpy as np
-from utils.logger_xl import write_log, file_score_log
-from backtesting.lib import crossover
 
 def calc_sma_score(sma_short, sma_long, sensitivity=1000, sma_weight=0.4, max_spread=0.05, bonus=0.5):
-    if len(sma_short) < 6 or sma_short[-5] == 0 or np.isnan(sma_short[-1]) or np.isnan(sma_short[-5]):
-        return 0
+    """
+    SMA 기울기/스프레드 기반 스코어 계산 (현재 바 기준)
+    - 골든/데드크로스 바는 기울기 기반 점수 + 보너스, 그 외에는 스프레드 기반 점수
+    - 로그는 남기지 않음 (크로스 기록이 필요하면 호출하는 전략의 _log에서 기록)
+    """
+    if len(sma_short) < 6:
+        return 0.0
+
+    short, short_1, short_4 = float(sma_short[-1]), float(sma_short[-2]), float(sma_short[-5])
+    long, long_1 = float(sma_long[-1]), float(sma_long[-2])
+    if short_4 == 0 or math.isnan(short) or math.isnan(short_4):
+        return 0.0
 
     # 1. 기울기 계산
-    slope = (sma_short[-1] - sma_short[-5]) / sma_short[-5]
+    slope = (short - short_4) / short_4
     slope_scaled = slope * sensitivity
 
     # 2. 스프레드 계산
-    spread = (sma_short[-1] - sma_long[-1]) / sma_long[-1]
-
-    # 3. 크로스 여부 체크
-    if crossover(sma_short, sma_long):
-        score = (np.clip(slope_scaled / 25, 0, 4) * sma_weight) + bonus
-        write_log(f"👑 [골든크로스] slope: {slope:.5f} | score: {score:.2f}", file_score_log)
-    elif crossover(sma_long, sma_short):
-        score = (np.clip(slope_scaled / 25, -4, 0) * sma_weight) - bonus
-        write_log(f"☠️ [데드크로스] slope: {slope:.5f} | score: {score:.2f}", file_score_log)
+    diff = short - long
+    if long != 0:
+        spread = diff / long
     else:
-        # ✨ 선형 스프레드 점수화
-        spread_score_raw = spread / max_spread  # 예: 0.03/0.05 = 0.6
-        spread_score = np.clip(spread_score_raw, -1, 1) * 4 * sma_weight
-        score = spread_score
-        # print(f"📈 [No Cross] spread: {spread:.5f} | score: {score:.2f}")
+        spread = diff * math.inf if diff else math.nan  # 배열 버전(0 나눗셈 -> ±inf / NaN)과 동일
+
+    # 3. 크로스 여부 체크 (backtesting.lib.crossover와 동일한 조건)
+    if short_1 < long_1 and short > long:
+        return min(max(slope_scaled / 25, 0.0), 4.0) * sma_weight + bonus
+    if long_1 < short_1 and long > short:
+        return min(max(slope_scaled / 25, -4.0), 0.0) * sma_weight - bonus
+
+    # ✨ 선형 스프레드 점수화 (예: 0.03/0.05 = 0.6)
+    return min(max(spread / max_spread, -1.0), 1.0) * 4 * sma_weight
+
+
+def calc_sma_score_batch(sma_short, sma_long, sensitivity=1000, sma_weight=0.4, max_spread=0.05, bonus=0.5) -> np.ndarray:
+    """
+    calc_sma_score의 배열 버전
+    - 골든/데드크로스 바는 기울기 기반 점수 + 보너스, 그 외에는 스프레드 기반 점수
+    - 히스토리가 6바 미만이거나 기울기를 계산할 수 없는 바는 0점 처리
+    """
+    sma_short = np.asarray(sma_short, dtype=float)
+    sma_long = np.asarray(sma_long, dtype=float)
+    n = len(sma_short)
+
+    # 4바 전 / 1바 전 값 (앞쪽은 NaN으로 채움)
+    short_4 = np.full(n, np.nan)
+    short_4[4:] = sma_short[:-4]
+    short_1 = np.full(n, np.nan)
+    short_1[1:] = sma_short[:-1]
+    long_1 = np.full(n, np.nan)
+    long_1[1:] = sma_long[:-1]
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        # 1. 기울기 계산
+        slope = (sma_short - short_4) / short_4
+        slope_scaled = slope * sensitivity
+
+        # 2. 스프레드 계산
+        spread = (sma_short - sma_long) / sma_long
+
+        # 3. 크로스 여부 체크 (backtesting.lib.crossover와 동일한 조건)
+        golden = (short_1 < long_1) & (sma_short > sma_long)
+        dead = (long_1 < short_1) & (sma_long > sma_short)
+
+        golden_score = (np.clip(slope_scaled / 25, 0, 4) * sma_weight) + bonus
+        dead_score = (np.clip(slope_scaled / 25, -4, 0) * sma_weight) - bonus
+        # ✨ 선형 스프레드 점수화 (예: 0.03/0.05 = 0.6)
+        spread_score = np.clip(spread / max_spread, -1, 1) * 4 * sma_weight
+
+    score = np.select([golden, dead], [golden_score, dead_score], default=spread_score)
 
-    return score
\ No newline at end of file
+    invalid = (np.arange(n) < 5) | (short_4 == 0) | np.isnan(sma_short) | np.isnan(short_4)
+    return np.where(invalid, 0.0, score)
@@ -6,9 +6,19 @@ def calc_volume_score(volume, avg_volume, sensitivity=10):
     """ avg_volume: 평균 거래량 """
     """ sensitivity: 민감도 조정 """
     if avg_volume == 0:
-        volume_score = 0
-    else:
-        volume_ratio = (volume - avg_volume) / avg_volume # 평균 거래량 대비 거래량 비율
-        volume_score = np.clip(volume_ratio * 10, -1, 1)  # 최대 1점, 최소 -1점
+        return 0.0
 
-    return volume_score
\ No newline at end of file
+    volume_ratio = (volume - avg_volume) / avg_volume # 평균 거래량 대비 거래량 비율
+    return min(max(float(volume_ratio) * 10, -1.0), 1.0)  # 최대 1점, 최소 -1점
+
+
+def calc_volume_score_batch(volume, avg_volume, sensitivity=10) -> np.ndarray:
+    """ calc_volume_score의 배열 버전 """
+    """ volume: 거래량 시계열 """
+    """ avg_volume: 평균 거래량 시계열 (0인 바는 0점 처리) """
+    volume = np.asarray(volume, dtype=float)
+    avg_volume = np.asarray(avg_volume, dtype=float)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        volume_ratio = (volume - avg_volume) / avg_volume
+        volume_score = np.clip(volume_ratio * 10, -1, 1)
+    return np.where(avg_volume == 0, 0.0, volume_score)
@@ -2,7 +2,8 @@ import pandas as pd
 import numpy as np
 from backtesting import Strategy
 
-from utils.looger_sqlite import sqlite_logger, LOG_TABLES
+from utils.looger_sqlite import LOG_TABLES
+from utils.log_writer import log_writer
 from indicators.base import EMA, SMA
 from indicators.advanced import ADX, RSI, MACD_and_signal
 from scoring.score_factors import (
@@ -10,8 +11,19 @@ from scoring.score_factors import (
     calc_macd_hist_score,
     calc_rsi_score,
     calc_volume_score,
+    calc_ema_adx_score_batch,
+    calc_macd_hist_score_batch,
+    calc_rsi_score_batch,
+    calc_volume_score_batch,
 )
 from regime import MarketRegime
+from regime.market_regime_evaluator import MarketRegimeEvaluator
+from utils.profiling import instrument
+
+
+def _precomputed_values(values):
+    """ self.I에 사전 계산된 배열을 그대로 등록 """
+    return values
 
 
 class SmartScore(Strategy):
@@ -40,15 +52,149 @@ class SmartScore(Strategy):
     std = 0                             # 표준편차 초기화
     z_score = 0                         # z-score 초기화
 
+    # 벡터화 스코어링 모드
+    # True : init()에서 전체 히스토리의 팩터 점수/레짐을 한 번에 계산하고 next()에서는 인덱싱만 수행
+    # False: 매 바(bar)마다 전체 히스토리를 다시 계산 (기존 방식)
+    vectorized = True
+    volume_window = 20                  # 평균 거래량 계산 기간
+
+    # 로그 기록 여부 (파라미터 스윕 등 대량 실행 시 False)
+    log_enabled = True
+
+    # 시장 레짐 판단 방식
+    # "zscore"   : SMA 기반 z-score 분류 (기존 방식)
+    # "evaluator": MarketRegimeEvaluator.classify()로 전체 히스토리를 사전 분류하고 next()에서는 인덱싱만 수행
+    regime_source = "zscore"
+
+    # 단계별 실행 시간 측정 (True이면 아래 메서드를 측정용 래퍼로 교체, 결과는 self.profiler.summary())
+    profile = False
+    _PROFILED_PHASES = {
+        "next": "next",
+        "calculate_score": "calculate_score",
+        "get_market_regime": "get_market_regime",
+        "handle_bull_market_logic": "handle_bull_market_logic",
+        "check_exit_conditions": "check_exit_conditions",
+        "_log": "log",
+    }
+
+
+    # 사전 계산된 지표/팩터 점수/레짐 배열 {속성 이름: 배열} (None이면 init()에서 self.data로 계산)
+    # runner.walk_forward가 전체 히스토리(FETCH_START~)로 한 번 계산한 값을 구간별로 잘라 전달하므로,
+    # 구간 시작부터 워밍업이 끝난 지표를 사용하고 구간마다 지표를 다시 계산하지 않음
+    precomputed = None
+    _PRECOMPUTED_INDICATORS = {         # self.I로 등록하는 지표: (이름, overlay)
+        "ema1": ("EMA", True),
+        "ema2": ("EMA", True),
+        "adx": ("ADX", False),
+        "rsi": ("RSI", False),
+        "macd": ("MACD", False),
+        "signal": ("Signal", False),
+    }
+    _PRECOMPUTED_ARRAYS = (             # vectorized / evaluator 모드의 사전 계산 배열
+        "_ema_adx_scores", "_macd_scores", "_rsi_scores", "_volume_scores",
+        "_regime_std", "_regime_z_score", "_regimes", "_evaluator_regimes",
+    )
+    # 사전 계산 결과에 영향을 주는 파라미터 (값이 같은 실행끼리 사전 계산 결과를 공유)
+    _PRECOMPUTE_PARAMS = ("n1", "n2", "volume_window", "regime_window", "vectorized", "regime_source")
+
 
     def init(self):
         """ 초기화 """
+        self.profiler = instrument(self, self._PROFILED_PHASES, names=self._PROFILED_PHASES) if self.profile else None
+
+        if self.regime_source not in ("zscore", "evaluator"):
+            raise ValueError(f"지원하지 않는 regime_source입니다: {self.regime_source}")
+
+        if self.precomputed is not None:
+            self._load_precomputed(self.precomputed)
+            return
+
         self.ema1 = self.I(EMA, self.data.Close, self.n1, overlay=True)                         # 단기 EMA(12일선)
         self.ema2 = self.I(EMA, self.data.Close, self.n2, overlay=True)                         # 중기 EMA(26일선)
         self.adx = self.I(ADX, self.data.High, self.data.Low, self.data.Close, period=14, overlay=False)   # ADX 계산
         self.rsi = self.I(RSI, self.data.Close, overlay=False)                                  # RSI 계산
         self.macd, self.signal = self.I(MACD_and_signal, self.data.Close, name='MACD', overlay=False)  # MACD 계산
-    
+
+        if self.vectorized:
+            self._precompute_scores()
+            self._precompute_market_regime()
+
+        if self.regime_source == "evaluator":
+            evaluator = MarketRegimeEvaluator(self.data.df, ema_fast_period=self.n1, ema_slow_period=self.n2)
+            self._evaluator_regimes = evaluator.classify().to_numpy()
+
+
+    def _load_precomputed(self, precomputed: dict):
+        """ 사전 계산된 배열을 지표(self.I)와 팩터 점수/레짐 배열로 등록 """
+        for attr, (name, overlay) in self._PRECOMPUTED_INDICATORS.items():
+            setattr(self, attr, self.I(_precomputed_values, precomputed[attr], name=name, overlay=overlay))
+        for attr in self._PRECOMPUTED_ARRAYS:
+            if attr in precomputed:
+                setattr(self, attr, precomputed[attr])
+
+
+    def export_precomputed(self) -> dict:
+        """ init() 이후 지표/팩터 점수/레짐 배열을 {속성 이름: 배열}로 반환 (precomputed 파라미터 형식) """
+        values = {attr: np.asarray(getattr(self, attr)) for attr in self._PRECOMPUTED_INDICATORS}
+        values.update({attr: getattr(self, attr) for attr in self._PRECOMPUTED_ARRAYS if hasattr(self, attr)})
+        return values
+
+
+    def _precompute_scores(self):
+        """ 전체 히스토리에 대한 팩터 점수를 한 번에 계산 (vectorized 모드) """
+        """ self.I로 등록하지 않은 일반 NumPy 배열이므로 워밍업 구간/차트에 영향을 주지 않음 """
+        volume = np.asarray(self.data.Volume, dtype=float)
+        avg_volume = pd.Series(volume).rolling(window=self.volume_window).mean().to_numpy()
+
+        self._ema_adx_scores = calc_ema_adx_score_batch(self.ema1, self.ema2, self.adx)
+        self._macd_scores = calc_macd_hist_score_batch(self.macd, self.signal)
+        self._rsi_scores = calc_rsi_score_batch(self.rsi)
+        self._volume_scores = calc_volume_score_batch(volume, avg_volume)
+
+
+    def _precompute_market_regime(self):
+        """ get_market_regime의 z-score 레짐 분류를 전체 히스토리에 대해 한 번에 계산 (vectorized 모드) """
+        close = np.asarray(self.data.Close, dtype=float)
+        close_series = pd.Series(close)
+
+        sma = SMA(close, self.regime_window).to_numpy()
+        std = close_series.rolling(window=self.regime_window).std(ddof=0).to_numpy()
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            z_score = np.where(std != 0, (close - sma) / std, 0.0)
+
+        std_threshold = 1.8  # 변동성 기준
+        z_score_threshold = 0.9  # z-score 기준
+
+        # 🔽 z-score를 이용한 시장 레짐 분류
+        regimes = np.select(
+            [
+                std >= std_threshold,
+                z_score >= z_score_threshold,
+                z_score <= -z_score_threshold,
+                np.abs(z_score) < z_score_threshold,
+            ],
+            [MarketRegime.VOLATILE, MarketRegime.BULL, MarketRegime.BEAR, MarketRegime.SIDEWAYS],
+            default=MarketRegime.NONE,
+        )
+
+        # regime_window 미만 구간은 판단 불가 -> NONE, std/z-score 0
+        warmup = np.arange(len(close)) < self.regime_window - 1
+        regimes[warmup] = MarketRegime.NONE
+        std[warmup] = 0
+        z_score[warmup] = 0
+
+        self._regime_std = std
+        self._regime_z_score = z_score
+        self._regimes = regimes
+
+
+    def _log(self, table: str, row: dict):
+        """ LOG_TABLES[table] 테이블에 로그 레코드 기록 (log_enabled=False이면 생략) """
+        if self.log_enabled:
+            log_writer.insert(LOG_TABLES[table], row)
+
+
     def calculate_score(self):
         """ 매수/매도 판단을 위한 스코어링 엔진 - 각 지표의 Signal을 Score로 계산 """
         """ SMA Crossover, 볼린저 밴드, RSI, Volume을 종합하여 종목별 점수 산출 """
@@ -56,30 +202,11 @@ class SmartScore(Strategy):
         """ 가중치 : EMA & ADX(40%) + MACD(20%) + RSI(20%) + Volume(10%) """
 
         score = 0           # 총합 Score(+-10 ~ -10)
-        ema_adx_score = 0   # EMA Crossover + ADX Score
-        macd_score = 0      # MACD Score
-        rsi_score = 0       # RSI Score
-        volume_score = 0    # Volume Score
+        ema_adx_score, macd_score, rsi_score, volume_score = self._factor_scores()
 
-        # ✅ 1. EMA Crossover 점수 계산(가중치 40%)
-        ema_adx_score = calc_ema_adx_score(self.ema1, self.ema2, self.adx)
         score += ema_adx_score
-
-        # ✅ 2. MACD 히스토그램 점수(가중치 20%)
-        macd_score = calc_macd_hist_score(self.macd, self.signal)
         score += macd_score
-
-
-        # ✅ 3. RSI 점수 계산(가중치 20%)
-        # RSI 20 이하 -> -2점, RSI 80 이상 -> -2점
-        rsi_score = calc_rsi_score(self.rsi[-1])
         score += rsi_score
-
-
-        # ✅ 4. 거래량 점수 계산(가중치 10%)
-        volume = self.data.Volume[-1]
-        avg_volume = pd.Series(self.data.Volume).rolling(window=20).mean().iloc[-1]
-        volume_score = calc_volume_score(volume, avg_volume)
         score += volume_score
 
 
@@ -98,22 +225,64 @@ class SmartScore(Strategy):
             "z-score": round(self.z_score, 2) if self.z_score is not None else "-",
             "market_regime": self.market_regime.value,
         }
-        sqlite_logger.insert(LOG_TABLES["score"], sccore_log)
+        self._log("score", sccore_log)
 
         return score
+
+
+    def _factor_scores(self):
+        """ 현재 바의 팩터 점수 (EMA & ADX, MACD, RSI, Volume) """
+        if self.vectorized:
+            # ✅ 사전 계산된 팩터 점수에서 현재 바의 값만 조회
+            i = len(self.data) - 1
+            ema_adx_score = float(self._ema_adx_scores[i])
+            macd_score = float(self._macd_scores[i])
+            rsi_score = float(self._rsi_scores[i])
+            volume_score = float(self._volume_scores[i])
+        else:
+            # ✅ 1. EMA Crossover 점수 계산(가중치 40%)
+            ema_adx_score = calc_ema_adx_score(self.ema1, self.ema2, self.adx)
+
+            # ✅ 2. MACD 히스토그램 점수(가중치 20%)
+            macd_score = calc_macd_hist_score(self.macd, self.signal)
+
+            # ✅ 3. RSI 점수 계산(가중치 20%)
+            # RSI 20 이하 -> -2점, RSI 80 이상 -> -2점
+            rsi_score = calc_rsi_score(self.rsi[-1])
+
+            # ✅ 4. 거래량 점수 계산(가중치 10%)
+            volume = self.data.Volume[-1]
+            avg_volume = pd.Series(self.data.Volume).rolling(window=self.volume_window).mean().iloc[-1]
+            volume_score = calc_volume_score(volume, avg_volume)
+
+        return ema_adx_score, macd_score, rsi_score, volume_score
     
 
     def get_market_regime(self):
         """ SMA 기반의 z-score로 시장 레짐 판단 """
         self.std = 0        # 표준편차 초기화
         self.z_score = 0    # z-score 초기화
+
+        if self.regime_source == "evaluator":
+            # MarketRegimeEvaluator.classify() 결과에서 현재 바의 값만 조회 (std/z-score는 사용하지 않음)
+            self.market_regime = self._evaluator_regimes[len(self.data) - 1]
+            return self.market_regime
+
+        if self.vectorized:
+            # 사전 계산된 레짐/std/z-score 배열에서 현재 바의 값만 조회
+            # (워밍업 구간은 _precompute_market_regime에서 0으로 채워져 있어 바 단위 계산의 초기값과 같음)
+            i = len(self.data) - 1
+            self.std = float(self._regime_std[i])
+            self.z_score = float(self._regime_z_score[i])
+            self.market_regime = self._regimes[i]
+            return self.market_regime
         
         close = self.data.Close
         if len(close) < self.regime_window:
             self.market_regime = MarketRegime.NONE
             return self.market_regime
 
-        sma_series = SMA(close, self.regime_window)
+        sma_series = SMA.uncached(close, self.regime_window)     # 바마다 길이가 달라지는 입력이므로 캐시를 거치지 않음
         latest_price = close[-1]
         sma = sma_series.iloc[-1]
 
@@ -124,23 +293,28 @@ class SmartScore(Strategy):
         self.std = float(np.std(close[-self.regime_window:]))
         self.z_score = float((latest_price - sma) / self.std) if self.std != 0 else 0
 
+        self.market_regime = self._classify_regime(self.std, self.z_score)
+        return self.market_regime
+
+
+    @staticmethod
+    def _classify_regime(std: float, z_score: float) -> MarketRegime:
+        """ 표준편차/z-score로 현재 바의 시장 레짐 분류 (_precompute_market_regime의 바 단위 버전) """
         std_threshold = 1.8  # 변동성 기준
         z_score_threshold = 0.9  # z-score 기준
 
 
         # 🔽 z-score를 이용한 시장 레짐 분류
-        if self.std >= std_threshold:
-            self.market_regime = MarketRegime.VOLATILE
-        elif self.z_score >= z_score_threshold:
-            self.market_regime = MarketRegime.BULL
-        elif self.z_score <= -z_score_threshold:
-            self.market_regime = MarketRegime.BEAR
-        elif abs(self.z_score) < z_score_threshold:
-            self.market_regime = MarketRegime.SIDEWAYS
+        if std >= std_threshold:
+            return MarketRegime.VOLATILE
+        elif z_score >= z_score_threshold:
+            return MarketRegime.BULL
+        elif z_score <= -z_score_threshold:
+            return MarketRegime.BEAR
+        elif abs(z_score) < z_score_threshold:
+            return MarketRegime.SIDEWAYS
         else:
-            self.market_regime = MarketRegime.NONE
-
-        return self.market_regime
+            return MarketRegime.NONE
 
 
     
@@ -165,7 +339,7 @@ class SmartScore(Strategy):
                 "roi": round(roi, 2),
                 "market_value": 0.0
             }
-            sqlite_logger.insert(LOG_TABLES["trade"], trading_log)
+            self._log("trade", trading_log)
 
             self.avg_entry_price = 0  # 포지션 초기화
             self.last_size = 0
@@ -210,7 +384,7 @@ class SmartScore(Strategy):
                 "market_value": 0.0,
                 "market_regime": self.market_regime.value
             }
-            sqlite_logger.insert(LOG_TABLES["trade"], trading_log)
+            self._log("trade", trading_log)
 
             self.avg_entry_price = 0
             self.last_size = 0
@@ -249,11 +423,11 @@ class SmartScore(Strategy):
                     "price": round(current_price, 2),
                     "size": size,
                     "avg_price": round(self.avg_entry_price, 2),
-                    "roi": "-",
+                    "roi": None,
                     "market_value": round(market_value, 2),
                     "market_regime": self.market_regime.value
                 }
-                sqlite_logger.insert(LOG_TABLES["trade"], trading_log)
+                self._log("trade", trading_log)
 
 
     def next(self):
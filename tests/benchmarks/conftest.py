@@ -0,0 +1,91 @@
+import json
+import os
+
+import pytest
+
+from indicators.cache import indicator_cache
+from tests.benchmarks.harness import compare, load_baseline, measure, save_baseline, to_records
+from tests.conftest import make_ohlcv
+
+
+"""
+실행 예)
+    pytest tests/benchmarks --benchmark                          # 기준값과 비교 (50% 이상 느려지면 실패)
+    pytest tests/benchmarks --benchmark --benchmark-bars=1000000 # 100만 바
+    pytest tests/benchmarks --benchmark --benchmark-save         # 현재 환경에서 기준값 갱신
+"""
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+_results = []
+
+
+@pytest.fixture(autouse=True)
+def _benchmark_enabled(request):
+    if not request.config.getoption("--benchmark"):
+        pytest.skip("벤치마크는 --benchmark 옵션을 지정한 경우에만 실행")
+
+
+@pytest.fixture(autouse=True)
+def _no_indicator_cache(monkeypatch):
+    # 반복 측정이 캐시 적중이 되지 않도록 지표 캐시 비활성화
+    monkeypatch.setattr(indicator_cache, "enabled", False)
+
+
+@pytest.fixture(scope="session")
+def bars(request) -> int:
+    return request.config.getoption("--benchmark-bars")
+
+
+@pytest.fixture(scope="session")
+def backtest_bars(request, bars) -> int:
+    return min(bars, request.config.getoption("--benchmark-backtest-bars"))
+
+
+@pytest.fixture(scope="session")
+def bench_ohlcv(bars):
+    # 1천만 바까지 만들 수 있도록 1분 간격 인덱스 사용
+    return make_ohlcv(bars, start="2000-01-03", freq="min")
+
+
+@pytest.fixture(scope="session")
+def _benchmark_session(request):
+    config = request.config
+    path = config.getoption("--benchmark-baseline") or BASELINE_PATH
+    yield load_baseline(path)
+
+    if config.getoption("--benchmark-save") and _results:
+        save_baseline(path, _results)
+    if config.getoption("--benchmark-json"):
+        with open(config.getoption("--benchmark-json"), "w", encoding="utf-8") as f:
+            json.dump(to_records(_results), f, indent=2, ensure_ascii=False)
+
+
+@pytest.fixture
+def bench(request, _benchmark_session):
+    """
+    bench(name, func, bars): func()을 측정하고 기준값 대비 회귀가 있으면 실패
+    """
+    config = request.config
+
+    def run(name, func, bars):
+        result = measure(name, bars, func, rounds=config.getoption("--benchmark-rounds"))
+        _results.append(result)
+        if config.getoption("--benchmark-save"):
+            return result
+
+        regressions = compare(result, _benchmark_session.get(result.key), config.getoption("--benchmark-threshold"))
+        if regressions:
+            pytest.fail("성능 회귀: " + ", ".join(regressions))
+        return result
+
+    return run
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    if not _results:
+        return
+    terminalreporter.section("benchmark")
+    terminalreporter.write_line(f"{'name':<50} {'bars':>10} {'time [s]':>12} {'peak [MB]':>12}")
+    for result in _results:
+        terminalreporter.write_line(f"{result.name:<50} {result.bars:>10} {result.time_sec:>12.5f} {result.peak_mb:>12.2f}")
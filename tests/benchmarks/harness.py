@@ -0,0 +1,90 @@
+import gc
+import json
+import os
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from typing import Callable, Dict, List, Optional
+
+
+"""
+⏱️ benchmark harness
+
+벤치마크 측정/기준값(baseline) 비교 유틸리티
+- 시간: warmup 1회(numba 컴파일 등) 후 rounds회 실행한 최소 시간
+- 메모리: tracemalloc으로 측정한 1회 실행의 최대 할당량 (NumPy 배열 포함)
+- 기준값: {"이름[바 수]": {"time_sec", "peak_mb"}} JSON (측정 환경별로 --benchmark-save로 갱신)
+"""
+
+# 이보다 작은 차이는 측정 오차로 보고 회귀로 판단하지 않음
+MIN_TIME_DIFF_SEC = 0.005
+MIN_MEMORY_DIFF_MB = 1.0
+
+
+@dataclass
+class BenchmarkResult:
+    name: str
+    bars: int
+    time_sec: float
+    peak_mb: float
+
+    @property
+    def key(self) -> str:
+        return f"{self.name}[{self.bars}]"
+
+
+def measure(name: str, bars: int, func: Callable[[], object], rounds: int = 5) -> BenchmarkResult:
+    """ func()의 실행 시간(최소값)과 최대 메모리 사용량 측정 """
+    func()      # warmup
+
+    times = []
+    for _ in range(rounds):
+        gc.collect()
+        started = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - started)
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return BenchmarkResult(name, bars, min(times), peak / 2**20)
+
+
+def load_baseline(path: str) -> Dict[str, dict]:
+    if not os.path.exists(path):
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_baseline(path: str, results: List[BenchmarkResult]):
+    """ 기존 기준값에 측정 결과를 덮어써서 저장 (다른 바 수의 기준값은 유지) """
+    baseline = load_baseline(path)
+    for result in results:
+        baseline[result.key] = {"time_sec": round(result.time_sec, 6), "peak_mb": round(result.peak_mb, 3)}
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(dict(sorted(baseline.items())), f, indent=2, ensure_ascii=False)
+        f.write("\n")
+
+
+def compare(result: BenchmarkResult, baseline: Optional[dict], threshold: float) -> List[str]:
+    """ 기준값 대비 threshold(비율)를 넘는 시간/메모리 증가 목록 (기준값이 없으면 비교하지 않음) """
+    if not baseline:
+        return []
+
+    regressions = []
+    base_time, base_peak = baseline["time_sec"], baseline["peak_mb"]
+    if result.time_sec > base_time * (1 + threshold) and result.time_sec - base_time > MIN_TIME_DIFF_SEC:
+        regressions.append(f"{result.key} 시간 {base_time:.4f}s -> {result.time_sec:.4f}s")
+    if result.peak_mb > base_peak * (1 + threshold) and result.peak_mb - base_peak > MIN_MEMORY_DIFF_MB:
+        regressions.append(f"{result.key} 메모리 {base_peak:.1f}MB -> {result.peak_mb:.1f}MB")
+    return regressions
+
+
+def to_records(results: List[BenchmarkResult]) -> List[dict]:
+    return [asdict(result) for result in results]
@@ -0,0 +1,27 @@
+import numpy as np
+import pandas as pd
+
+from utils.bar_store import BarStore, build_bar_store
+
+
+def test_bar_store_open(bench, tmp_path, bars):
+    """ 메모리 맵 바 저장소 열기 + 종목 하나 읽기 (500종목 × 최대 5천 바, float32) """
+    symbols, n = 500, min(bars, 5_000)
+    index = pd.bdate_range("2000-01-03", periods=n)
+    rng = np.random.default_rng(0)
+    close = 100 * np.exp(np.cumsum(rng.normal(0.0005, 0.015, (n, symbols)), axis=0))
+    data = {
+        f"S{j:04d}": pd.DataFrame(
+            {"Open": close[:, j], "High": close[:, j], "Low": close[:, j], "Close": close[:, j], "Volume": 1.0},
+            index=index,
+        )
+        for j in range(symbols)
+    }
+    path = str(tmp_path / "bars")
+    build_bar_store(path, data, dtype=np.float32)
+
+    def run():
+        store = BarStore(path)
+        return store.frame("S0250")
+
+    bench("data.bar_store.open", run, n * symbols)
@@ -0,0 +1,105 @@
+import numpy as np
+import pytest
+
+from indicators import arrays
+from indicators.advanced.adx import ADX
+from indicators.advanced.bollinger import BollingerBands
+from indicators.advanced.cci import CCI
+from indicators.advanced.macd import MACD, MACD_and_signal, MACD_histogram, MACD_signal_crossover
+from indicators.advanced.roc import ROC
+from indicators.advanced.rsi import RSI
+from indicators.base.atr import ATR
+from indicators.base.ema import EMA
+from indicators.base.sma import SMA
+from indicators.incremental import (
+    IncrementalADX, IncrementalATR, IncrementalBollingerBands, IncrementalCCI, IncrementalEMA,
+    IncrementalMACD, IncrementalROC, IncrementalRSI, IncrementalSMA,
+)
+
+
+# (이름, 지표 함수, 입력 컬럼, 파라미터)
+CLOSE = ("Close",)
+HLC = ("High", "Low", "Close")
+
+INDICATORS = [
+    ("EMA", EMA, CLOSE, {"window": 12}),
+    ("SMA", SMA, CLOSE, {"window": 20}),
+    ("ATR", ATR, HLC, {"window": 14}),
+    ("ADX", ADX, HLC, {"period": 14}),
+    ("RSI", RSI, CLOSE, {"window": 14}),
+    ("CCI", CCI, HLC, {"window": 14}),
+    ("ROC", ROC, CLOSE, {"window": 14}),
+    ("BollingerBands", BollingerBands, CLOSE, {"window": 20}),
+    ("MACD", MACD, CLOSE, {}),
+    ("MACD_and_signal", MACD_and_signal, CLOSE, {}),
+    ("MACD_histogram", MACD_histogram, CLOSE, {}),
+    ("MACD_signal_crossover", MACD_signal_crossover, CLOSE, {}),
+]
+
+# ndarray API (indicators/arrays.py)
+ARRAYS = [
+    ("ema", arrays.ema, CLOSE, {"window": 12}),
+    ("sma", arrays.sma, CLOSE, {"window": 20}),
+    ("atr", arrays.atr, HLC, {"window": 14}),
+    ("adx", arrays.adx, HLC, {"period": 14}),
+    ("rsi", arrays.rsi, CLOSE, {"window": 14}),
+    ("cci", arrays.cci, HLC, {"window": 14}),
+    ("bollinger_bands", arrays.bollinger_bands, CLOSE, {"window": 20}),
+    ("macd_and_signal", arrays.macd_and_signal, CLOSE, {}),
+]
+
+# 증분 지표 (바별 update 루프)
+INCREMENTAL = [
+    ("IncrementalEMA", lambda: IncrementalEMA(12), CLOSE),
+    ("IncrementalSMA", lambda: IncrementalSMA(20), CLOSE),
+    ("IncrementalATR", lambda: IncrementalATR(14), HLC),
+    ("IncrementalADX", lambda: IncrementalADX(14), HLC),
+    ("IncrementalRSI", lambda: IncrementalRSI(14), CLOSE),
+    ("IncrementalCCI", lambda: IncrementalCCI(14), HLC),
+    ("IncrementalROC", lambda: IncrementalROC(14), CLOSE),
+    ("IncrementalBollingerBands", lambda: IncrementalBollingerBands(20), CLOSE),
+    ("IncrementalMACD", lambda: IncrementalMACD(), CLOSE),
+]
+
+
+@pytest.mark.parametrize("name, func, columns, params", INDICATORS, ids=[case[0] for case in INDICATORS])
+def test_indicator(bench, bench_ohlcv, bars, name, func, columns, params):
+    inputs = [bench_ohlcv[col] for col in columns]
+    bench(f"indicators.{name}", lambda: func(*inputs, **params), bars)
+
+
+@pytest.mark.parametrize("name, func, columns, params", INDICATORS[:4], ids=[case[0] for case in INDICATORS[:4]])
+def test_indicator_panel(bench, bench_ohlcv, bars, name, func, columns, params):
+    """ 2차원 입력 (시간 × 10종목, 종목마다 상장 시점이 다름) """
+    symbols = 10
+    n = max(bars // symbols, 100)
+    panels = []
+    for col in columns:
+        panel = bench_ohlcv[col].to_numpy()[: n * symbols].reshape(symbols, -1).T.copy()
+        for j in range(symbols):
+            panel[: j * 5, j] = float("nan")
+        panels.append(panel)
+    bench(f"indicators.panel.{name}", lambda: func(*panels, **params), n * symbols)
+
+
+@pytest.mark.parametrize("dtype", ["float64", "float32"])
+@pytest.mark.parametrize("name, func, columns, params", ARRAYS, ids=[case[0] for case in ARRAYS])
+def test_array_indicator(bench, bench_ohlcv, bars, name, func, columns, params, dtype):
+    """ ndarray 입력 -> 미리 할당한 out 버퍼 (float32는 입력/결과 메모리 절반) """
+    inputs = [bench_ohlcv[col].to_numpy(dtype=dtype) for col in columns]
+    count = {"bollinger_bands": 3, "macd_and_signal": 2}.get(name, 1)
+    outs = tuple(np.empty(bars, dtype=dtype) for _ in range(count))
+    out = outs if count > 1 else outs[0]
+    bench(f"indicators.arrays.{name}.{dtype}", lambda: func(*inputs, **params, out=out), bars)
+
+
+@pytest.mark.parametrize("name, factory, columns", INCREMENTAL, ids=[case[0] for case in INCREMENTAL])
+def test_incremental_indicator(bench, bench_ohlcv, backtest_bars, name, factory, columns):
+    rows = list(zip(*(bench_ohlcv[col].to_numpy()[:backtest_bars].tolist() for col in columns)))
+
+    def run():
+        indicator = factory()
+        for row in rows:
+            indicator.update(*row)
+
+    bench(f"indicators.incremental.{name}", run, backtest_bars)
@@ -0,0 +1,65 @@
+import numpy as np
+import pytest
+
+from indicators.advanced import ADX, RSI, BollingerBands, MACD_and_signal
+from indicators.base import EMA, SMA
+from scoring.score_factors import (
+    calc_bb_score_z, calc_bb_score_z_batch,
+    calc_ema_adx_score, calc_ema_adx_score_batch,
+    calc_macd_hist_score, calc_macd_hist_score_batch,
+    calc_rsi_score, calc_rsi_score_batch,
+    calc_sma_score, calc_sma_score_batch,
+    calc_volume_score, calc_volume_score_batch,
+)
+
+
+@pytest.fixture(scope="session")
+def factors(bench_ohlcv):
+    close, volume = bench_ohlcv["Close"], bench_ohlcv["Volume"]
+    macd, signal = MACD_and_signal(close)
+    bb_mid, bb_upper, bb_lower = BollingerBands(close)
+    arrays = {
+        "close": close, "volume": volume, "avg_volume": volume.rolling(20).mean(),
+        "ema_short": EMA(close, 12), "ema_long": EMA(close, 26),
+        "adx": ADX(bench_ohlcv["High"], bench_ohlcv["Low"], close),
+        "rsi": RSI(close), "macd": macd, "signal": signal,
+        "sma_short": SMA(close, 5), "sma_long": SMA(close, 20),
+        "bb_mid": bb_mid, "bb_upper": bb_upper, "bb_lower": bb_lower,
+    }
+    return {k: np.asarray(v, dtype=float) for k, v in arrays.items()}
+
+
+BATCH = [
+    ("ema_adx", calc_ema_adx_score_batch, ("ema_short", "ema_long", "adx")),
+    ("macd_hist", calc_macd_hist_score_batch, ("macd", "signal")),
+    ("rsi", calc_rsi_score_batch, ("rsi",)),
+    ("volume", calc_volume_score_batch, ("volume", "avg_volume")),
+    ("sma", calc_sma_score_batch, ("sma_short", "sma_long")),
+    ("bb_z", calc_bb_score_z_batch, ("close", "bb_mid", "bb_upper", "bb_lower")),
+]
+
+
+# 바별 호출 (전략의 per-bar 모드와 같은 방식으로 현재까지의 히스토리 또는 현재 값을 전달)
+PER_BAR = [
+    ("ema_adx", lambda f, i: calc_ema_adx_score(f["ema_short"][:i], f["ema_long"][:i], f["adx"][:i])),
+    ("macd_hist", lambda f, i: calc_macd_hist_score(f["macd"][:i], f["signal"][:i])),
+    ("rsi", lambda f, i: calc_rsi_score(f["rsi"][i - 1])),
+    ("volume", lambda f, i: calc_volume_score(f["volume"][i - 1], f["avg_volume"][i - 1])),
+    ("sma", lambda f, i: calc_sma_score(f["sma_short"][:i], f["sma_long"][:i])),
+    ("bb_z", lambda f, i: calc_bb_score_z(f["close"][i - 1], f["bb_mid"][i - 1], f["bb_upper"][i - 1], f["bb_lower"][i - 1])),
+]
+
+
+@pytest.mark.parametrize("name, func, inputs", BATCH, ids=[case[0] for case in BATCH])
+def test_score_factor_batch(bench, factors, bars, name, func, inputs):
+    args = [factors[k] for k in inputs]
+    bench(f"scoring.{name}_batch", lambda: func(*args), bars)
+
+
+@pytest.mark.parametrize("name, call", PER_BAR, ids=[case[0] for case in PER_BAR])
+def test_score_factor_per_bar(bench, factors, backtest_bars, name, call):
+    def run():
+        for i in range(1, backtest_bars + 1):
+            call(factors, i)
+
+    bench(f"scoring.{name}", run, backtest_bars)
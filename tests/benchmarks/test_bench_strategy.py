@@ -0,0 +1,58 @@
+from backtesting import Backtest
+
+from regime.market_regime_evaluator import MarketRegimeEvaluator
+from strategies.smart_score import SmartScore
+from utils.log_writer import log_writer
+
+
+class _NullSink:
+    def insert(self, table, data):
+        pass
+
+    def flush(self):
+        pass
+
+    def close(self):
+        pass
+
+
+def test_regime_evaluator_init(bench, bench_ohlcv, bars):
+    bench("regime.MarketRegimeEvaluator", lambda: MarketRegimeEvaluator(bench_ohlcv), bars)
+
+
+def test_regime_score_noise(bench, bench_ohlcv, bars, backtest_bars):
+    """ score_noise_series 1회 + 날짜별 score_noise 조회 (evaluator 생성 포함) """
+    dates = bench_ohlcv.index[-backtest_bars:]
+
+    def run():
+        evaluator = MarketRegimeEvaluator(bench_ohlcv)
+        for date in dates:
+            evaluator.score_noise(date)
+
+    bench("regime.score_noise", run, bars)
+
+
+def test_regime_classify(bench, bench_ohlcv, bars):
+    bench("regime.classify", lambda: MarketRegimeEvaluator(bench_ohlcv).classify(), bars)
+
+
+def test_backtest_smart_score(bench, bench_ohlcv, backtest_bars):
+    """ 전체 백테스트 (로그 레코드 생성/큐 전달 포함, 기록은 하지 않음) """
+    data = bench_ohlcv.iloc[:backtest_bars]
+
+    def run():
+        with log_writer.redirect(_NullSink()):
+            Backtest(data, SmartScore, cash=10000, commission=.002).run()
+
+    bench("backtest.SmartScore", run, backtest_bars)
+
+
+def test_backtest_smart_score_profiled(bench, bench_ohlcv, backtest_bars):
+    """ profile=True 실행 (단계별 측정 래퍼 오버헤드 확인용) """
+    data = bench_ohlcv.iloc[:backtest_bars]
+
+    def run():
+        with log_writer.redirect(_NullSink()):
+            Backtest(data, SmartScore, cash=10000, commission=.002).run(profile=True)
+
+    bench("backtest.SmartScore.profile", run, backtest_bars)
@@ -0,0 +1,55 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+
+def make_ohlcv(n: int = 1000, seed: int = 0, start: str = "2015-01-01", freq: str = "B") -> pd.DataFrame:
+    """
+    테스트용 합성 OHLCV 데이터 생성 (기하 브라운 운동 기반, 기본값: 영업일 인덱스)
+    - freq: 인덱스 간격 (영업일 인덱스는 약 6만 바에서 날짜 범위를 넘으므로 대용량 벤치마크는 "min" 사용)
+    """
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0.0005, 0.015, n)))
+    open_ = np.r_[close[0], close[:-1]]
+    high = np.maximum(close * (1 + rng.uniform(0, 0.01, n)), open_)
+    low = np.minimum(close * (1 - rng.uniform(0, 0.01, n)), open_)
+    volume = rng.integers(100_000, 1_000_000, n).astype(float)
+
+    index = pd.date_range(start, periods=n, freq=freq)
+    return pd.DataFrame(
+        {"Open": open_, "High": high, "Low": low, "Close": close, "Volume": volume},
+        index=index,
+    )
+
+
+@pytest.fixture
+def ohlcv():
+    return make_ohlcv()
+
+
+def pytest_addoption(parser):
+    # ⏱️ 벤치마크 (tests/benchmarks, 기본적으로 실행하지 않음)
+    group = parser.getgroup("benchmark")
+    group.addoption("--benchmark", action="store_true", help="tests/benchmarks의 성능 벤치마크 실행")
+    group.addoption("--benchmark-bars", type=int, default=10_000, help="합성 OHLCV 바 수 (1천 ~ 1천만)")
+    group.addoption("--benchmark-backtest-bars", type=int, default=2_000,
+                    help="전체 백테스트/바별 루프 벤치마크의 바 수 (--benchmark-bars보다 크면 그 값으로 제한)")
+    group.addoption("--benchmark-rounds", type=int, default=5, help="측정 반복 횟수 (최소 시간 사용)")
+    group.addoption("--benchmark-threshold", type=float, default=0.5, help="기준값 대비 허용 증가율 (0.5 = 50%%)")
+    group.addoption("--benchmark-baseline", default=None, help="기준값 JSON 경로 (기본값: tests/benchmarks/baseline.json)")
+    group.addoption("--benchmark-save", action="store_true", help="측정 결과로 기준값 갱신 (회귀 검사 안 함)")
+    group.addoption("--benchmark-json", default=None, help="측정 결과를 저장할 JSON 경로")
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "benchmark: 실행 시간 예산 검사 (--benchmark 옵션을 지정한 경우에만 실행)")
+
+
+def pytest_collection_modifyitems(config, items):
+    # tests/benchmarks 밖의 시간 측정 테스트도 --benchmark 옵션을 지정한 경우에만 실행
+    if config.getoption("--benchmark"):
+        return
+    skip = pytest.mark.skip(reason="벤치마크는 --benchmark 옵션을 지정한 경우에만 실행")
+    for item in items:
+        if item.get_closest_marker("benchmark") is not None:
+            item.add_marker(skip)
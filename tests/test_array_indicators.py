@@ -0,0 +1,166 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from indicators import arrays, kernels
+from indicators.advanced import ADX, RSI
+from indicators.advanced.bollinger import BollingerBands
+from indicators.advanced.cci import CCI
+from indicators.advanced.macd import MACD, MACD_and_signal, MACD_histogram, MACD_signal_crossover
+from indicators.advanced.roc import ROC
+from indicators.base import ATR, EMA, SMA
+from indicators.cache import indicator_cache
+from tests.conftest import make_ohlcv
+
+
+# (ndarray 함수, pandas 함수, 입력 컬럼, 파라미터)
+CASES = [
+    (arrays.sma, SMA, ("Close",), (20,)),
+    (arrays.ema, EMA, ("Close",), (12,)),
+    (arrays.atr, ATR, ("High", "Low", "Close"), (14,)),
+    (arrays.adx, ADX, ("High", "Low", "Close"), (14,)),
+    (arrays.rsi, RSI, ("Close",), (14,)),
+    (arrays.roc, ROC, ("Close",), (14,)),
+    (arrays.cci, CCI, ("High", "Low", "Close"), (14,)),
+    (arrays.bollinger_bands, BollingerBands, ("Close",), (20, 2)),
+    (arrays.macd, MACD, ("Close",), (12, 26)),
+    (arrays.macd_and_signal, MACD_and_signal, ("Close",), (12, 26, 9)),
+    (arrays.macd_histogram, MACD_histogram, ("Close",), (12, 26, 9)),
+    (arrays.macd_signal_crossover, MACD_signal_crossover, ("Close",), (12, 26, 9)),
+]
+IDS = [case[0].__name__ for case in CASES]
+
+
+@pytest.fixture
+def data():
+    # NaN 구간과 가격이 변하지 않는 구간을 포함한 데이터
+    df = make_ohlcv(n=400)
+    df.iloc[100:104] = np.nan
+    df.iloc[200:220, :4] = 50.0
+    return df
+
+
+def _results(result):
+    return result if isinstance(result, tuple) else (result,)
+
+
+def _expected(pandas_func, data, columns, params):
+    return [r.to_numpy(dtype=np.float64) for r in _results(pandas_func.uncached(*(data[c] for c in columns), *params))]
+
+
+@pytest.mark.parametrize("compiled", [True, False])
+@pytest.mark.parametrize("func, pandas_func, columns, params", CASES, ids=IDS)
+def test_matches_pandas_functions(data, func, pandas_func, columns, params, compiled, monkeypatch):
+    """ ndarray 입력 결과가 pandas 함수와 같고, pandas 객체를 반환하지 않는지 확인 (numba 미사용 경로 포함) """
+    monkeypatch.setattr(kernels, "USE_KERNELS", compiled)
+    expected = _expected(pandas_func, data, columns, params)
+
+    results = _results(func.uncached(*(data[c].to_numpy() for c in columns), *params))
+    assert len(results) == len(expected)
+    for result, exp in zip(results, expected):
+        assert type(result) is np.ndarray
+        np.testing.assert_allclose(result, exp, rtol=kernels.KERNEL_RTOL, equal_nan=True)
+
+
+@pytest.mark.parametrize("func, pandas_func, columns, params", CASES, ids=IDS)
+def test_panel_input_matches_pandas(data, func, pandas_func, columns, params):
+    """ 2차원(시간 × 종목) 입력: 상장일이 다른 종목 포함, pandas 패널 계산과 동일 """
+    def panel(col):
+        values = data[col].to_numpy()
+        late = np.r_[np.full(60, np.nan), values[60:]]
+        return np.column_stack([values, late, values * 2])
+
+    inputs = [panel(c) for c in columns]
+    expected = [r.to_numpy(dtype=np.float64) for r in _results(pandas_func.uncached(*inputs, *params))]
+    for result, exp in zip(_results(func.uncached(*inputs, *params)), expected):
+        assert result.shape == inputs[0].shape
+        if result.dtype.kind == "i":
+            exp = np.nan_to_num(exp)    # 정수 결과의 상장 이전 구간은 0
+        np.testing.assert_allclose(result, exp, rtol=kernels.KERNEL_RTOL, equal_nan=True)
+
+
+def test_out_buffer_is_filled_in_place(data):
+    close = data["Close"].to_numpy()
+    out = np.full(close.shape, -1.0)
+    assert arrays.ema(close, 12, out=out) is out
+    np.testing.assert_array_equal(out, arrays.ema.uncached(close, 12))
+
+    bands = tuple(np.empty_like(close) for _ in range(3))
+    result = arrays.bollinger_bands(close, 20, 2, out=bands)
+    assert all(r is o for r, o in zip(result, bands))
+
+    crossover = np.empty(close.shape, dtype=np.int8)
+    assert arrays.macd_signal_crossover(close, out=crossover) is crossover
+
+
+def test_out_bypasses_indicator_cache(data):
+    indicator_cache.clear()
+    close = data["Close"].to_numpy()
+    out = np.empty_like(close)
+    arrays.sma(close, 20, out=out)
+    arrays.sma(close, 20, out=out)
+    assert indicator_cache.stats()["size"] == 0
+
+    arrays.sma(close, 20)
+    arrays.sma(close, 20)
+    assert indicator_cache.stats()["hits"] == 1
+
+
+@pytest.mark.parametrize("func, pandas_func, columns, params", CASES[:-1], ids=IDS[:-1])
+def test_float32(data, func, pandas_func, columns, params):
+    """ float32 입력은 float32 결과 (float64 결과와 float32 정밀도 수준에서 일치) """
+    inputs = [data[c].to_numpy(dtype=np.float32) for c in columns]
+    expected = _expected(pandas_func, data, columns, params)
+    for result, exp in zip(_results(func.uncached(*inputs, *params)), expected):
+        assert result.dtype == np.float32
+        scale = np.nanmax(np.abs(exp))
+        np.testing.assert_allclose(result, exp, rtol=1e-4, atol=1e-4 * scale, equal_nan=True)
+
+
+def test_dtype_resolution(data):
+    close = data["Close"].to_numpy()
+    assert arrays.rsi(close).dtype == np.float64
+    assert arrays.rsi(close, dtype=np.float32).dtype == np.float32
+    assert arrays.rsi(close.astype(np.float32)).dtype == np.float32
+    assert arrays.rsi(close.astype(np.float32), dtype="float64").dtype == np.float64
+    assert arrays.rsi(np.arange(50)).dtype == np.float64                         # 정수 입력
+    assert arrays.rsi(close, out=np.empty(close.shape, dtype=np.float32)).dtype == np.float32
+
+
+def test_accepts_pandas_inputs_without_copy(data):
+    close = data["Close"]
+    result = arrays.sma.uncached(close, 20)
+    assert type(result) is np.ndarray
+    np.testing.assert_array_equal(result, SMA.uncached(close, 20).to_numpy())
+
+
+@pytest.mark.parametrize("kwargs", [
+    {"out": np.empty(10)},                                  # shape 불일치
+    {"out": np.empty(400, dtype=np.float32), "dtype": np.float64},     # dtype 불일치
+    {"out": np.empty(400, dtype=np.int64)},                 # 정수 out
+    {"dtype": np.int32},
+])
+def test_invalid_out_or_dtype(data, kwargs):
+    close = data["Close"].to_numpy()
+    with pytest.raises(ValueError):
+        arrays.ema(close, 12, **kwargs)
+
+
+def test_mismatched_input_shapes():
+    with pytest.raises(ValueError):
+        arrays.atr(np.ones(10), np.ones(10), np.ones(9))
+
+
+def test_rolling_kernels_match_pandas_bitwise():
+    rng = np.random.default_rng(1)
+    values = rng.normal(0, 1, 1000)
+    values[50:60] = np.nan
+    values[200:260] = 3.0
+    values[300:310] = -0.0
+    for window in (1, 2, 20):
+        mean = np.empty_like(values)
+        std = np.empty_like(values)
+        kernels.rolling_mean_into(values, window, window, mean)
+        kernels.rolling_std_into(values, window, window, 1, std)
+        np.testing.assert_array_equal(mean, pd.Series(values).rolling(window).mean().to_numpy())
+        np.testing.assert_array_equal(std, pd.Series(values).rolling(window).std().to_numpy())
@@ -0,0 +1,121 @@
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from tests.conftest import make_ohlcv
+from utils.bar_store import build_bar_store, build_bar_store_from_cache
+from utils.data_loader import LocalFileProvider, OHLCVCache
+
+
+@pytest.fixture
+def universe():
+    # 종목마다 거래일이 다름 (늦은 상장, 거래 정지 구간)
+    full = make_ohlcv(n=300, seed=1, start="2020-01-01")
+    late = make_ohlcv(n=200, seed=2, start="2020-06-01")
+    halted = make_ohlcv(n=300, seed=3, start="2020-01-01").drop(index=pd.bdate_range("2020-03-02", periods=10))
+    return {"FULL": full, "LATE": late, "HALT": halted}
+
+
+@pytest.fixture
+def store(tmp_path, universe):
+    return build_bar_store(str(tmp_path / "bars"), universe)
+
+
+def _column_sum(store, symbol):
+    return float(np.nansum(store.column("Close", symbol)))
+
+
+def test_round_trip_on_common_calendar(store, universe):
+    calendar = universe["FULL"].index.union(universe["LATE"].index)
+    assert store.symbols == ["FULL", "LATE", "HALT"]
+    assert store.shape == (len(calendar), 3)
+    pd.testing.assert_index_equal(store.calendar, calendar.rename("Date"), check_exact=True)
+
+    for symbol, df in universe.items():
+        pd.testing.assert_frame_equal(store.frame(symbol), df.rename_axis("Date"), check_freq=False)
+
+    # 바가 없는 날은 NaN
+    late = store.column("Close", "LATE")
+    assert np.isnan(late[: store.calendar.searchsorted(pd.Timestamp("2020-06-01"))]).all()
+    halted = store.frame("HALT", dropna=False).loc["2020-03-02":"2020-03-13"]
+    assert halted.isna().all().all()
+
+
+def test_fields_are_read_only_memory_maps(store):
+    close = store["Close"]
+    assert isinstance(close, np.memmap)
+    assert not close.flags.writeable
+    assert close.flags.f_contiguous
+
+    # 종목 하나의 시계열은 파일 매핑의 연속 뷰 (복사 없음)
+    column = store.column("Close", "LATE")
+    assert column.flags.c_contiguous
+    assert np.shares_memory(column, close)
+
+    with pytest.raises(KeyError):
+        store["Adj Close"]
+    with pytest.raises(KeyError):
+        store.column("Close", "NONE")
+
+
+def test_rows_and_panel(store):
+    rows = store.rows("2020-06-01", "2020-07-01")
+    assert store.calendar[rows.start] == pd.Timestamp("2020-06-01")
+    assert store.calendar[rows.stop - 1] < pd.Timestamp("2020-07-01") <= store.calendar[rows.stop]
+
+    panel = store.panel("Close", start="2020-06-01", end="2020-07-01")
+    assert list(panel.columns) == store.symbols
+    assert len(panel) == rows.stop - rows.start
+
+    subset = store.panel("Close", ["HALT", "FULL"])
+    np.testing.assert_array_equal(subset["FULL"].to_numpy(), store.column("Close", "FULL"))
+
+
+def test_float32_store(tmp_path, universe):
+    store = build_bar_store(str(tmp_path / "bars32"), universe, dtype=np.float32)
+    assert store["Close"].dtype == np.float32
+    np.testing.assert_allclose(store.frame("FULL").to_numpy(), universe["FULL"].to_numpy(), rtol=1e-6)
+
+    with pytest.raises(ValueError):
+        build_bar_store(str(tmp_path / "bars16"), universe, dtype=np.float16)
+
+
+def test_workers_open_store_by_path(store):
+    """ pickle에는 경로만 담기고, 워커 프로세스는 같은 파일을 다시 매핑 """
+    payload = pickle.dumps(store)
+    assert len(payload) < 1000
+    assert pickle.loads(payload).symbols == store.symbols
+
+    with ProcessPoolExecutor(max_workers=2) as pool:
+        sums = list(pool.map(_column_sum, [store] * 3, store.symbols))
+    assert sums == [_column_sum(store, symbol) for symbol in store.symbols]
+
+
+def test_rebuild_replaces_store_and_keeps_open_readers(tmp_path, universe):
+    path = str(tmp_path / "bars")
+    old = build_bar_store(path, universe)
+    old_close = old.column("Close", "FULL")
+    expected = old_close.copy()
+
+    new = build_bar_store(path, {"FULL": universe["FULL"] * 2})
+    assert new.symbols == ["FULL"]
+    np.testing.assert_array_equal(new.column("Close", "FULL"), universe["FULL"]["Close"].to_numpy() * 2)
+    np.testing.assert_array_equal(old_close, expected)       # 기존 매핑은 이전 파일을 계속 읽음
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["bars"]
+
+
+def test_build_from_cache_skips_missing_symbols(tmp_path, universe):
+    root = tmp_path / "files"
+    root.mkdir()
+    for symbol in ("FULL", "LATE"):
+        universe[symbol].to_csv(root / f"{symbol}.csv")
+    cache = OHLCVCache(str(tmp_path / "cache"), provider=LocalFileProvider(str(root)))
+
+    store = build_bar_store_from_cache(
+        str(tmp_path / "bars"), ["FULL", "NONE", "LATE"], "2020-01-01", "2021-01-01", cache=cache,
+    )
+    assert store.symbols == ["FULL", "LATE"]
+    np.testing.assert_allclose(store.frame("LATE").to_numpy(), universe["LATE"].loc[:"2020-12-31"].to_numpy())
@@ -0,0 +1,168 @@
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+import pytest
+
+from tests.conftest import make_ohlcv
+from utils.data_loader import CacheStats, DataProvider, LocalFileProvider, OHLCVCache, get_stock_data
+
+
+class RecordingProvider(DataProvider):
+    """ 호출된 구간을 기록하는 메모리 공급자 """
+
+    def __init__(self, data: pd.DataFrame):
+        self.data = data
+        self.calls = []
+
+    def fetch(self, symbol, start, end, interval="1d"):
+        self.calls.append((start, end))
+        return self.data[(self.data.index >= start) & (self.data.index < end)]
+
+
+@pytest.fixture
+def provider():
+    return RecordingProvider(make_ohlcv(n=1500, start="2019-01-01"))
+
+
+@pytest.fixture
+def cache(tmp_path, provider):
+    return OHLCVCache(str(tmp_path), provider=provider)
+
+
+def test_miss_then_hit(cache, provider):
+    first = cache.get("TEST", "2019-06-01", "2020-06-01")
+    second = cache.get("TEST", "2019-09-01", "2020-01-01")
+
+    assert provider.calls == [("2019-06-01", "2020-06-01")]
+    assert (cache.stats.misses, cache.stats.hits) == (1, 1)
+    pd.testing.assert_frame_equal(second, first.loc["2019-09-01":"2019-12-31"], check_freq=False)
+
+
+def test_incremental_top_up_fetches_only_missing_tail(cache, provider):
+    cache.get("TEST", "2019-01-01", "2020-01-01")
+    data = cache.get("TEST", "2019-01-01", "2021-01-01")
+
+    assert provider.calls == [("2019-01-01", "2020-01-01"), ("2020-01-01", "2021-01-01")]
+    assert cache.stats.partial_hits == 1
+
+    expected = provider.data[(provider.data.index >= "2019-01-01") & (provider.data.index < "2021-01-01")]
+    pd.testing.assert_frame_equal(data, expected, check_freq=False, check_names=False)
+
+    # 병합된 구간은 이후 캐시만으로 응답
+    cache.get("TEST", "2019-03-01", "2020-12-01")
+    assert len(provider.calls) == 2
+    assert cache.stats.hits == 1
+
+
+def test_incremental_top_up_fetches_missing_head(cache, provider):
+    cache.get("TEST", "2020-01-01", "2021-01-01")
+    cache.get("TEST", "2019-06-01", "2021-01-01")
+
+    assert provider.calls[-1] == ("2019-06-01", "2020-01-01")
+
+
+def test_cache_persists_across_instances(tmp_path, provider):
+    OHLCVCache(str(tmp_path), provider=provider).get("TEST", "2019-01-01", "2020-01-01")
+
+    other = OHLCVCache(str(tmp_path), provider=provider, fmt="parquet")
+    other.get("TEST", "2019-01-01", "2020-01-01")
+    assert len(provider.calls) == 1
+    assert other.stats.hits == 1
+
+
+def test_stats_are_exact_under_concurrent_gets(cache):
+    cache.get("AAA", "2020-01-01", "2020-06-02")
+    with ThreadPoolExecutor(8) as executor:
+        list(executor.map(lambda _: cache.get("AAA", "2020-01-01", "2020-06-02"), range(64)))
+    assert (cache.stats.misses, cache.stats.hits, cache.stats.fetches) == (1, 64, 1)
+
+    stats = CacheStats()
+    threads = [threading.Thread(target=lambda: [stats.add(hits=1, fetched_rows=2) for _ in range(5000)]) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert (stats.hits, stats.fetched_rows) == (40000, 80000)
+
+
+def test_local_file_provider(tmp_path):
+    make_ohlcv(n=300, start="2020-01-01").to_csv(tmp_path / "LOCAL.csv")
+    cache = OHLCVCache(str(tmp_path / "cache"), provider=LocalFileProvider(str(tmp_path)))
+
+    data = get_stock_data("LOCAL", start="2020-02-01", end="2020-03-01", cache=cache)
+    assert list(data.columns) == ["Open", "High", "Low", "Close", "Volume"]
+    assert data.index.min() >= pd.Timestamp("2020-02-01")
+    assert data.index.max() < pd.Timestamp("2020-03-01")
+
+    with pytest.raises(FileNotFoundError):
+        cache.get("MISSING", "2020-01-01", "2020-02-01")
+
+
+def test_get_many_checks_cache_files_without_loading(cache, provider, monkeypatch):
+    cache.get("AAA", "2019-01-01", "2020-01-01")
+    reads = []
+    original = cache._read
+    monkeypatch.setattr(cache, "_read", lambda symbol, interval: reads.append(symbol) or original(symbol, interval))
+
+    result = cache.get_many(["AAA", "BBB"], "2019-01-01", "2020-01-01")
+
+    assert set(result) == {"AAA", "BBB"}
+    assert reads == ["AAA"]                 # 캐시된 종목은 get()에서 한 번만 읽음
+    assert provider.calls[-1] == ("2019-01-01", "2020-01-01")
+
+
+def test_second_get_makes_no_provider_call(cache, provider):
+    cache.get("TEST", "2019-06-03", "2020-06-02")
+    cache.get("TEST", "2019-06-03", "2020-06-02")
+
+    assert len(provider.calls) == 1
+    assert cache.stats.hits == 1
+
+
+class FlakyEmptyProvider(RecordingProvider):
+    """ 지정한 호출 순번에서 빈 응답(일시적 실패)을 반환하는 공급자 """
+
+    def __init__(self, data: pd.DataFrame, empty_calls=()):
+        super().__init__(data)
+        self.empty_calls = set(empty_calls)
+
+    def fetch(self, symbol, start, end, interval="1d"):
+        data = super().fetch(symbol, start, end, interval)
+        return data.iloc[:0] if len(self.calls) in self.empty_calls else data
+
+
+def test_empty_top_up_does_not_extend_coverage(tmp_path):
+    # 두 번째 호출(뒤 구간 보충)만 빈 응답, 다음 호출에서는 정상 응답
+    provider = FlakyEmptyProvider(make_ohlcv(n=1500, start="2019-01-01"), empty_calls={2})
+    cache = OHLCVCache(str(tmp_path), provider=provider)
+    meta_end = lambda: json.loads((tmp_path / "1d" / "TEST.json").read_text())["end"]
+
+    cache.get("TEST", "2019-06-03", "2019-12-02")
+    assert meta_end() == "2019-11-30T00:00:00"              # 마지막 바(11/29) 다음 날까지
+
+    truncated = cache.get("TEST", "2019-06-03", "2020-06-02")
+    assert truncated.index[-1] == pd.Timestamp("2019-11-29")
+    assert meta_end() == "2019-11-30T00:00:00"              # 빈 응답은 보유 기간으로 기록하지 않음
+
+    data = cache.get("TEST", "2019-06-03", "2020-06-02")
+    assert provider.calls[-1] == ("2019-11-30", "2020-06-02")
+    expected = provider.data[(provider.data.index >= "2019-06-03") & (provider.data.index < "2020-06-02")]
+    pd.testing.assert_frame_equal(data, expected, check_freq=False, check_names=False)
+
+    calls = len(provider.calls)
+    cache.get("TEST", "2019-06-03", "2020-06-02")
+    assert len(provider.calls) == calls
+
+
+def test_empty_head_does_not_extend_coverage(tmp_path):
+    provider = FlakyEmptyProvider(make_ohlcv(n=1500, start="2019-01-01"), empty_calls={2})
+    cache = OHLCVCache(str(tmp_path), provider=provider)
+
+    cache.get("TEST", "2020-01-01", "2021-01-01")
+    cache.get("TEST", "2019-06-03", "2021-01-01")          # 앞 구간 빈 응답
+    data = cache.get("TEST", "2019-06-03", "2021-01-01")   # 다시 조회하여 채움
+
+    assert provider.calls[1:] == [("2019-06-03", "2020-01-01")] * 2
+    assert data.index[0] == pd.Timestamp("2019-06-03")
@@ -0,0 +1,108 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from indicators.base import SMA, EMA, ATR
+from indicators.advanced import RSI, MACD_and_signal, ADX, CCI, ROC, BollingerBands
+from indicators.incremental import (
+    IncrementalSMA, IncrementalEMA, IncrementalATR, IncrementalRSI, IncrementalMACD,
+    IncrementalADX, IncrementalCCI, IncrementalROC, IncrementalBollingerBands,
+)
+from indicators.incremental._rolling import RollingMean, RollingStd, ExponentialMean
+from tests.conftest import make_ohlcv
+
+# 증분 계산은 누적합 갱신 순서가 배치 계산과 달라 부동소수점 오차만 허용
+RTOL = 1e-9
+
+
+@pytest.fixture(scope="module")
+def df():
+    return make_ohlcv(n=3000, seed=7)
+
+
+def stream(indicator, *columns):
+    """ 각 바를 순서대로 update()에 넣어 출력 배열을 만듦 """
+    return np.array([indicator.update(*bar) for bar in zip(*columns)], dtype=float)
+
+
+def assert_matches(actual, expected):
+    np.testing.assert_allclose(actual, np.asarray(expected, dtype=float), rtol=RTOL, atol=1e-9, equal_nan=True)
+
+
+@pytest.mark.parametrize("window", [1, 5, 20])
+def test_sma(df, window):
+    assert_matches(stream(IncrementalSMA(window), df.Close), SMA(df.Close, window))
+
+
+@pytest.mark.parametrize("window", [1, 12, 26])
+def test_ema(df, window):
+    assert_matches(stream(IncrementalEMA(window), df.Close), EMA(df.Close, window))
+
+
+def test_ema_with_nan_gaps(df):
+    close = df.Close.copy()
+    close.iloc[[0, 1, 50, 51, 52, 400]] = np.nan
+    assert_matches(stream(IncrementalEMA(10), close), EMA(close, 10))
+
+
+def test_atr(df):
+    assert_matches(stream(IncrementalATR(14), df.High, df.Low, df.Close), ATR(df.High, df.Low, df.Close, 14))
+
+
+def test_rsi(df):
+    assert_matches(stream(IncrementalRSI(14), df.Close), RSI(df.Close, 14))
+
+
+def test_macd(df):
+    incremental = IncrementalMACD()
+    macd, signal = zip(*(incremental.update(c) for c in df.Close))
+    expected_macd, expected_signal = MACD_and_signal(df.Close)
+
+    assert_matches(macd, expected_macd)
+    assert_matches(signal, expected_signal)
+    assert incremental.histogram == pytest.approx(expected_macd.iloc[-1] - expected_signal.iloc[-1])
+
+
+def test_adx(df):
+    assert_matches(stream(IncrementalADX(14), df.High, df.Low, df.Close), ADX(df.High, df.Low, df.Close, 14))
+
+
+def test_cci(df):
+    assert_matches(stream(IncrementalCCI(14), df.High, df.Low, df.Close), CCI(df.High, df.Low, df.Close, 14))
+
+
+def test_roc(df):
+    assert_matches(stream(IncrementalROC(14), df.Close), ROC(df.Close, 14))
+
+
+def test_bollinger(df):
+    incremental = IncrementalBollingerBands(20, 2)
+    bands = list(zip(*(incremental.update(c) for c in df.Close)))
+
+    for actual, expected in zip(bands, BollingerBands(df.Close, 20, 2)):
+        assert_matches(actual, expected)
+
+
+def test_flat_prices_match_batch():
+    # 0 나눗셈 구간(변화 없음)도 배치 계산과 같은 NaN/inf 처리
+    flat = pd.Series([10.0] * 40 + [11.0] * 5)
+    assert_matches(stream(IncrementalRSI(14), flat), RSI(flat, 14))
+    assert_matches(stream(IncrementalADX(14), flat, flat, flat), ADX(flat, flat, flat, 14))
+    assert_matches(stream(IncrementalCCI(14), flat, flat, flat), CCI(flat, flat, flat, 14))
+
+
+@pytest.mark.parametrize("window", [1, 2, 20])
+def test_rolling_state_matches_pandas_bitwise(window):
+    # 배열 커널과 같은 스텝 함수를 쓰므로 pandas rolling/ewm과 비트 단위로 같음
+    rng = np.random.default_rng(1)
+    values = rng.normal(0, 1, 1000)
+    values[50:60] = np.nan
+    values[200:260] = 3.0
+    values[300:310] = -0.0
+    series = pd.Series(values)
+
+    np.testing.assert_array_equal(stream(RollingMean(window), values), series.rolling(window).mean())
+    np.testing.assert_array_equal(stream(RollingMean(window, 1), values), series.rolling(window, 1).mean())
+    np.testing.assert_array_equal(stream(RollingStd(window), values), series.rolling(window).std())
+    np.testing.assert_array_equal(stream(RollingStd(window, ddof=0), values), series.rolling(window).std(ddof=0))
+    np.testing.assert_array_equal(stream(ExponentialMean(window), values), series.ewm(span=window, adjust=False).mean())
@@ -0,0 +1,111 @@
+import numpy as np
+import pandas as pd
+import pytest
+from backtesting import Backtest
+
+from indicators import kernels
+from indicators.base import EMA
+from indicators.advanced import MACD_and_signal
+from indicators.cache import IndicatorCache, indicator_cache
+from regime.market_regime_evaluator import MarketRegimeEvaluator
+from strategies.smart_score import SmartScore
+
+
+@pytest.fixture(autouse=True)
+def clean_cache():
+    indicator_cache.clear()
+    yield
+    indicator_cache.clear()
+
+
+def test_evaluator_computes_each_series_once(ohlcv):
+    MarketRegimeEvaluator(ohlcv)
+
+    # ema_fast/ema_slow는 MACD 내부 EMA와, MACD_signal_crossover는 MACD_and_signal과 공유
+    assert indicator_cache.misses_by_name["MACD_and_signal"] == 1
+    assert indicator_cache.misses_by_name["MACD"] == 1
+    assert indicator_cache.misses_by_name["EMA"] == 3      # fast, slow, signal
+    assert indicator_cache.hits >= 3
+
+    misses = indicator_cache.misses
+    MarketRegimeEvaluator(ohlcv)
+    assert indicator_cache.misses == misses
+
+
+def test_cached_result_matches_uncached(ohlcv):
+    close = ohlcv["Close"]
+    macd, signal = MACD_and_signal(close)
+    macd_again, signal_again = MACD_and_signal(close)
+
+    raw_macd, raw_signal = MACD_and_signal.uncached(close)
+    pd.testing.assert_series_equal(macd, raw_macd)
+    pd.testing.assert_series_equal(signal_again, raw_signal)
+
+
+def test_returned_result_is_a_copy(ohlcv):
+    close = ohlcv["Close"]
+    ema = EMA(close, 12)
+    ema[:] = 0.0
+    assert (EMA(close, 12) != 0.0).all()
+
+
+def test_key_depends_on_data_and_params(ohlcv):
+    close = ohlcv["Close"]
+    EMA(close, 12)
+    EMA(close, 20)
+    EMA(close * 2, 12)
+    EMA(close.reset_index(drop=True), 12)
+    assert indicator_cache.misses == 4
+    assert indicator_cache.hits == 0
+
+
+def test_lru_eviction():
+    cache = IndicatorCache(maxsize=2)
+    for key in ("a", "b", "a", "c"):
+        cache.get_or_compute((key,), lambda: key)
+
+    assert cache.evictions == 1
+    assert cache.stats()["size"] == 2
+    cache.get_or_compute(("a",), lambda: "recomputed")      # a는 최근 사용되어 남아 있음
+    assert cache.hits == 2
+
+
+def test_byte_bound_eviction():
+    cache = IndicatorCache(maxsize=100, max_bytes=2000)
+    for key in ("a", "b", "c"):
+        cache.get_or_compute((key,), lambda: np.zeros(100))     # 800 bytes
+
+    assert cache.evictions == 1
+    assert cache.stats()["size"] == 2 and cache.stats()["bytes"] == 1600
+
+    cache.get_or_compute(("big",), lambda: np.zeros(1000))      # max_bytes보다 큰 결과는 저장하지 않음
+    assert cache.stats()["size"] == 2 and cache.misses == 4
+
+
+def test_key_depends_on_backend(ohlcv, monkeypatch):
+    close = ohlcv["Close"]
+    EMA(close, 12)
+    monkeypatch.setattr(kernels, "USE_KERNELS", not kernels.USE_KERNELS)
+    EMA(close, 12)
+    assert indicator_cache.misses == 2 and indicator_cache.hits == 0
+
+
+def test_strategy_and_evaluator_call_sites(ohlcv):
+    """
+    전략(self.I -> _Array)과 MarketRegimeEvaluator(Series) 입력은 인덱스가 달라 별도 항목으로 계산되고,
+    각 호출 측의 반복 실행은 모두 캐시에서 응답
+    """
+    run = lambda: Backtest(ohlcv, SmartScore).run(log_enabled=False, regime_source="evaluator")
+    run()
+    # 전략: EMA n1/n2(MACD 내부 EMA와 공유) + signal, 평가기: EMA fast/slow(MACD 내부와 공유) + signal
+    assert indicator_cache.misses_by_name["EMA"] == 6
+    assert indicator_cache.misses_by_name["MACD_and_signal"] == 2
+
+    misses = indicator_cache.misses
+    run()
+    assert indicator_cache.misses == misses
+
+
+def test_per_bar_regime_path_bypasses_cache(ohlcv):
+    Backtest(ohlcv.iloc[:300], SmartScore).run(log_enabled=False, vectorized=False)
+    assert indicator_cache.misses_by_name["SMA"] == 0
@@ -0,0 +1,61 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from indicators import kernels
+from indicators.base import EMA, ATR
+from indicators.advanced import ADX, RSI
+from tests.conftest import make_ohlcv
+
+
+@pytest.fixture
+def data():
+    # NaN 구간과 가격이 변하지 않는 구간을 포함한 데이터
+    df = make_ohlcv(n=400)
+    df.iloc[100:104] = np.nan
+    df.iloc[200:220, :4] = 50.0
+    return df
+
+
+def _pandas(func, *args, monkeypatch):
+    monkeypatch.setattr(kernels, "USE_KERNELS", False)
+    return func.uncached(*args)
+
+
+@pytest.mark.parametrize("compiled", [True, False])
+def test_kernels_match_pandas(data, compiled, monkeypatch):
+    """ 커널(컴파일/순수 Python 모두)이 pandas 구현과 허용 오차 내에서 일치하는지 확인 """
+    pick = (lambda k: k) if compiled else kernels.python_kernel
+    high, low, close = (kernels.as_float_array(data[c]) for c in ("High", "Low", "Close"))
+
+    cases = [
+        (pick(kernels.ema_kernel)(close, 12), _pandas(EMA, data["Close"], 12, monkeypatch=monkeypatch)),
+        (pick(kernels.atr_kernel)(high, low, close, 14), _pandas(ATR, data["High"], data["Low"], data["Close"], 14, monkeypatch=monkeypatch)),
+        (pick(kernels.adx_kernel)(high, low, close, 14), _pandas(ADX, data["High"], data["Low"], data["Close"], 14, monkeypatch=monkeypatch)),
+        (pick(kernels.rsi_kernel)(close, 14), _pandas(RSI, data["Close"], 14, monkeypatch=monkeypatch)),
+    ]
+    for result, expected in cases:
+        np.testing.assert_allclose(result, expected.to_numpy(), rtol=kernels.KERNEL_RTOL, equal_nan=True)
+
+
+def test_public_functions_use_kernels(data, monkeypatch):
+    """ USE_KERNELS=True일 때도 공개 함수의 반환 형식(index/name)이 동일한지 확인 """
+    calls = [
+        (EMA, (data["Close"], 12)),
+        (ATR, (data["High"], data["Low"], data["Close"], 14)),
+        (ADX, (data["High"], data["Low"], data["Close"], 14)),
+        (RSI, (data["Close"], 14)),
+        (EMA, (data["Close"].to_numpy(), 26)),
+    ]
+    for func, args in calls:
+        expected = _pandas(func, *args, monkeypatch=monkeypatch)
+        monkeypatch.setattr(kernels, "USE_KERNELS", True)
+        pd.testing.assert_series_equal(func.uncached(*args), expected, rtol=kernels.KERNEL_RTOL)
+
+
+def test_div_follows_numpy_rules():
+    div = kernels.python_kernel(kernels._div)
+    assert div(1.0, 0.0) == np.inf
+    assert div(-1.0, 0.0) == -np.inf
+    assert np.isnan(div(0.0, 0.0))
+    assert div(3.0, 2.0) == 1.5
@@ -0,0 +1,185 @@
+import threading
+
+import pytest
+
+from utils.log_writer import AsyncLogWriter
+
+
+class GatedSink:
+    """ gate가 열릴 때까지 insert를 지연시키는 테스트용 sink """
+
+    def __init__(self):
+        self.gate = threading.Event()
+        self.entered = threading.Event()
+        self.rows = []
+        self.flushes = 0
+
+    def insert(self, table, data):
+        self.entered.set()
+        self.gate.wait()
+        self.rows.append((table, data))
+
+    def flush(self):
+        self.flushes += 1
+
+
+def test_flush_waits_for_all_records():
+    sink = GatedSink()
+    sink.gate.set()
+    writer = AsyncLogWriter(sink=sink)
+
+    for i in range(100):
+        writer.insert("score_log", {"i": i})
+    assert writer.flush(timeout=5)
+
+    assert [row["i"] for _, row in sink.rows] == list(range(100))
+    assert sink.flushes >= 1
+    writer.close()
+
+
+def test_drop_policy_never_drops_trades():
+    sink = GatedSink()
+    writer = AsyncLogWriter(sink=sink, maxsize=2, policy="drop")
+
+    for i in range(20):
+        writer.insert("score_log", {"i": i})
+    assert writer.dropped > 0
+
+    # 매매 로그는 never_drop 대상이므로 큐 자리가 날 때까지 대기
+    sink.gate.set()
+    writer.insert("trading_log", {"action": "buy"})
+    writer.close()
+
+    assert ("trading_log", {"action": "buy"}) in sink.rows
+    assert writer.submitted + writer.dropped == 21
+
+
+def test_sample_policy_keeps_every_nth_record():
+    sink = GatedSink()
+    writer = AsyncLogWriter(sink=sink, maxsize=1, policy="sample", sample_rate=5)
+
+    # 첫 레코드는 기록 스레드가 잡고 대기, 두 번째 레코드로 큐가 가득 참
+    writer.insert("score_log", {"i": 0})
+    assert sink.entered.wait(timeout=5)
+    writer.insert("score_log", {"i": 1})
+
+    # 포화 상태에서 5개 중 4개는 버리고 5번째는 자리가 날 때까지 대기 후 기록
+    for i in range(2, 6):
+        writer.insert("score_log", {"i": i})
+    assert writer.dropped == 4
+
+    threading.Timer(0.1, sink.gate.set).start()
+    writer.insert("score_log", {"i": 6})
+    writer.close()
+
+    assert [row["i"] for _, row in sink.rows] == [0, 1, 6]
+
+
+def test_text_log(tmp_path, monkeypatch):
+    monkeypatch.setattr("utils.log_writer.PathConfig.RESULT_DIR", str(tmp_path))
+    writer = AsyncLogWriter(sink=GatedSink())
+
+    writer.write("first", "score_log.txt")
+    writer.write("second", "score_log.txt")
+    writer.close()
+
+    assert (tmp_path / "score_log.txt").read_text(encoding="utf-8") == "first\nsecond\n"
+
+
+def test_invalid_policy():
+    with pytest.raises(ValueError):
+        AsyncLogWriter(policy="ignore")
+
+
+def test_redirect_swaps_sink_and_tags_for_block():
+    default, redirected = GatedSink(), GatedSink()
+    default.gate.set()
+    redirected.gate.set()
+    writer = AsyncLogWriter(sink=default)
+
+    writer.insert("score_log", {"i": 0})
+    with writer.redirect(redirected, tags={"run_id": "r1"}):
+        writer.insert("score_log", {"i": 1})
+    writer.insert("score_log", {"i": 2})
+    writer.flush(timeout=5)
+
+    assert [row for _, row in default.rows] == [{"i": 0}, {"i": 2}]
+    assert [row for _, row in redirected.rows] == [{"run_id": "r1", "i": 1}]
+    assert writer.sink is default and writer.tags == {}
+    writer.close()
+
+
+def test_redirect_is_per_thread():
+    default, first, second = GatedSink(), GatedSink(), GatedSink()
+    for sink in (default, first, second):
+        sink.gate.set()
+    writer = AsyncLogWriter(sink=default)
+    barrier = threading.Barrier(2)
+
+    def run(sink, run_id):
+        with writer.redirect(sink, tags={"run_id": run_id}):
+            barrier.wait()      # 두 redirect 블록이 동시에 열린 상태에서 기록
+            for i in range(50):
+                writer.insert("score_log", {"i": i})
+            barrier.wait()
+
+    threads = [threading.Thread(target=run, args=(first, "r1")), threading.Thread(target=run, args=(second, "r2"))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5)
+    writer.insert("score_log", {"i": -1})
+    writer.flush(timeout=5)
+
+    assert [row for _, row in first.rows] == [{"run_id": "r1", "i": i} for i in range(50)]
+    assert [row for _, row in second.rows] == [{"run_id": "r2", "i": i} for i in range(50)]
+    assert [row for _, row in default.rows] == [{"i": -1}]
+    assert first.flushes >= 1 and second.flushes >= 1
+    writer.close()
+
+
+def test_redirect_does_not_wait_for_queue():
+    default, redirected = GatedSink(), GatedSink()
+    writer = AsyncLogWriter(sink=default)
+
+    # 기록 스레드가 기본 sink에서 멈춰 있어도 redirect 진입/종료는 대기하지 않음
+    writer.insert("score_log", {"i": 0})
+    assert default.entered.wait(timeout=5)
+    entered = threading.Event()
+
+    def run():
+        with writer.redirect(redirected, tags={"run_id": "r1"}):
+            writer.insert("score_log", {"i": 1})
+        entered.set()
+
+    threading.Thread(target=run, daemon=True).start()
+    assert entered.wait(timeout=1)
+
+    default.gate.set()
+    redirected.gate.set()
+    writer.close()
+    assert [row for _, row in redirected.rows] == [{"run_id": "r1", "i": 1}]
+
+
+def test_default_policy_does_not_block():
+    writer = AsyncLogWriter(sink=GatedSink())
+    assert writer.policy == "drop"
+    writer.close()
+
+
+def test_default_sink_is_created_lazily(monkeypatch):
+    import utils.looger_sqlite as looger_sqlite
+
+    class ClosableSink(GatedSink):
+        def close(self):
+            pass
+
+    created = []
+    monkeypatch.setattr(looger_sqlite, "_default_logger", None)
+    monkeypatch.setattr(looger_sqlite, "SQLiteLogger", lambda: created.append(ClosableSink()) or created[-1])
+
+    writer = AsyncLogWriter()
+    writer.close()
+    assert created == []            # 기록한 레코드가 없으면 기본 sink를 만들지 않음
+
+    assert writer.sink is looger_sqlite.get_sqlite_logger() is created[0]
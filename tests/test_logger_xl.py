@@ -0,0 +1,60 @@
+import numpy as np
+import pandas as pd
+import pytest
+from openpyxl import load_workbook
+
+import utils.logger_xl as logger_xl
+from utils.logger_xl import write_log_xlsx
+
+
+@pytest.fixture
+def result_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(logger_xl.PathConfig, "RESULT_DIR", str(tmp_path))
+    return tmp_path
+
+
+def _score_log(n=200):
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({
+        "date": pd.bdate_range("2024-01-01", periods=n).strftime("%Y.%m.%d"),
+        "EMA": rng.normal(size=n).round(2),
+        "MACD": rng.normal(size=n).round(2),
+        "RSI": rng.normal(size=n).round(2),
+        "VOL": rng.normal(size=n).round(2),
+        "TOTAL": rng.normal(size=n).round(2),
+        "current price": rng.uniform(90, 110, n).round(2),
+        "σ (std)": ["-"] * 5 + list(rng.uniform(0, 3, n - 5).round(2)),
+        "z-score": [None] * 5 + list(rng.normal(size=n - 5).round(2)),
+        "market_regime": ["bull", "bear", "none", "sideways"] * (n // 4),
+    })
+
+
+def _cell_format(cell):
+    return (
+        cell.value,
+        cell.font.name, cell.font.sz, cell.font.b,
+        cell.alignment.horizontal, cell.alignment.vertical,
+        cell.fill.fill_type, cell.fill.fgColor.rgb,
+        cell.border.left.style, cell.border.bottom.style,
+    )
+
+
+@pytest.mark.parametrize("template", ["score", "default"])
+def test_fast_export_matches_regular_export(result_dir, template):
+    """ write-only 모드 출력이 기존(셀 단위 서식) 출력과 값/서식이 동일한지 확인 """
+    df = _score_log()
+    write_log_xlsx(df, "fast.xlsx", template=template)
+    write_log_xlsx(df, "regular.xlsx", template=template, fast=False)
+
+    fast = load_workbook(result_dir / "fast.xlsx").active
+    regular = load_workbook(result_dir / "regular.xlsx").active
+
+    assert fast.max_row == regular.max_row == len(df) + 1
+    assert fast.max_column == regular.max_column
+    for fast_row, regular_row in zip(fast.iter_rows(), regular.iter_rows()):
+        assert [_cell_format(c) for c in fast_row] == [_cell_format(c) for c in regular_row]
+
+    assert fast.freeze_panes == regular.freeze_panes == "A2"
+    assert fast.auto_filter.ref == regular.auto_filter.ref
+    for letter, dim in regular.column_dimensions.items():
+        assert fast.column_dimensions[letter].width == dim.width
@@ -1,7 +1,8 @@
 import pandas as pd
 import pytest
 from regime.market_regime_evaluator import MarketRegimeEvaluator
-from utils.data_loader import get_stock_data
+from utils.data_loader import get_stock_data, OHLCVCache, LocalFileProvider
+from tests.conftest import make_ohlcv
 
 # 에러나면 PYTHONPATH 설정(Windows)
 # set PYTHONPATH=.
@@ -9,9 +10,12 @@ from utils.data_loader import get_stock_data
 
 
 @pytest.fixture
-def evaluator():
-    # Sample data for testing
-    df = get_stock_data("AAPL", start="2022-01-01", end="2024-12-31")
+def evaluator(tmp_path):
+    # Sample data for testing (yfinance 대신 로컬 파일 공급자 사용)
+    make_ohlcv(n=1000, start="2021-01-01").to_csv(tmp_path / "AAPL.csv")
+    cache = OHLCVCache(str(tmp_path / "cache"), provider=LocalFileProvider(str(tmp_path)))
+
+    df = get_stock_data("AAPL", start="2022-01-01", end="2024-12-31", cache=cache)
     evaluator = MarketRegimeEvaluator(df)
     return evaluator
 
@@ -61,3 +65,66 @@ def test_score_noise_across_dates(evaluator):
     # assert로 최소 하나 이상은 0 또는 1 나오는지 확인 (완전 실패 방지용)
     scores = [evaluator.score_noise(date) for date in dates]
     assert any(score in [0, 1] for score in scores)
+
+
+def _score_noise_reference(df, date, window=14, std_threshold=1.5, z_score_threshold=1.5):
+    """ 기존(날짜별 ATR 재계산) score_noise 구현 """
+    from indicators.base import ATR
+
+    atr_series = ATR(df["High"], df["Low"], df["Close"], window)
+    if len(atr_series) < window or date not in atr_series.index:
+        return 0
+    idx = atr_series.index.get_loc(date)
+    if idx < window:
+        return 0
+    atr_window = atr_series.iloc[idx - window + 1 : idx + 1]
+    latest_atr = atr_window.iloc[-1]
+    mean = atr_window.mean()
+    std = atr_window.std()
+    z_score = (latest_atr - mean) / std if std != 0 else 0
+    if latest_atr >= std_threshold or abs(z_score) >= z_score_threshold:
+        return 1
+    return 0
+
+
+@pytest.mark.parametrize("params", [
+    dict(),
+    dict(window=20, std_threshold=3.0, z_score_threshold=1.0),
+])
+def test_score_noise_series_matches_per_date(evaluator, params):
+    series = evaluator.score_noise_series(**params)
+    assert list(series.columns) == ["atr", "atr_mean", "atr_std", "z_score", "noise"]
+    assert series.index.equals(evaluator.df.index)
+
+    for date in evaluator.df.index[:300]:
+        expected = _score_noise_reference(evaluator.df, date, **params)
+        assert series.at[date, "noise"] == expected, date
+        assert evaluator.score_noise(date, **params) == expected
+
+    assert evaluator.score_noise_series(**params) is series      # 캐시된 결과 재사용
+    assert evaluator.score_noise(pd.Timestamp("1990-01-01"), **params) == 0
+
+
+def test_classify_full_history(evaluator):
+    from regime import MarketRegime
+
+    regimes = evaluator.classify()
+    assert isinstance(regimes.dtype, pd.CategoricalDtype)
+    assert list(regimes.cat.categories) == list(MarketRegime)
+    assert regimes.index.equals(evaluator.df.index)
+    assert regimes.iloc[0] == MarketRegime.NONE                     # 워밍업 구간
+    assert regimes.nunique() > 1
+    assert evaluator.classify() is regimes                          # 캐시된 결과 재사용
+
+    # 추세가 없는 바는 SIDEWAYS 또는 VOLATILE(노이즈)로만 분류
+    weak = evaluator.indicators["adx"] < 20
+    noise = evaluator.score_noise_series()["noise"] == 1
+    assert (regimes[weak & ~noise].dropna() != MarketRegime.BULL).all()
+    assert set(regimes[weak & noise].iloc[30:]) <= {MarketRegime.VOLATILE}
+
+
+def test_classify_is_causal(evaluator):
+    """ 앞부분만 잘라 분류해도 결과가 같아야 함 (미래 데이터 미사용) """
+    full = evaluator.classify()
+    head = MarketRegimeEvaluator(evaluator.df.iloc[:400]).classify()
+    assert (full.iloc[:400].to_numpy() == head.to_numpy()).all()
@@ -0,0 +1,74 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from indicators import kernels
+from indicators.base import SMA, EMA, ATR
+from indicators.advanced import MACD_and_signal, MACD_signal_crossover, BollingerBands, ADX, RSI, ROC, CCI
+from tests.conftest import make_ohlcv
+
+
+@pytest.fixture
+def panel():
+    """ 상장일이 서로 다른 4개 종목의 wide DataFrame (컬럼 = 종목) """
+    frames = {f"S{i}": make_ohlcv(n=300, seed=i) for i in range(4)}
+    starts = {"S0": 0, "S1": 15, "S2": 120, "S3": 299}
+    wide = {}
+    for field in ("High", "Low", "Close"):
+        df = pd.DataFrame({s: f[field] for s, f in frames.items()})
+        for s, start in starts.items():
+            df.iloc[:start, df.columns.get_loc(s)] = np.nan
+        wide[field] = df
+    return wide
+
+
+CASES = [
+    (SMA, ("Close",), (20,)),
+    (EMA, ("Close",), (12,)),
+    (ATR, ("High", "Low", "Close"), (14,)),
+    (ADX, ("High", "Low", "Close"), (14,)),
+    (RSI, ("Close",), (14,)),
+    (ROC, ("Close",), (14,)),
+    (CCI, ("High", "Low", "Close"), (14,)),
+    (MACD_and_signal, ("Close",), ()),
+    (MACD_signal_crossover, ("Close",), ()),
+    (BollingerBands, ("Close",), (20, 2)),
+]
+
+
+@pytest.mark.parametrize("use_kernels", [True, False])
+@pytest.mark.parametrize("func, fields, params", CASES, ids=[c[0].__name__ for c in CASES])
+def test_panel_matches_per_symbol(panel, func, fields, params, use_kernels, monkeypatch):
+    """ 2차원 계산 결과의 각 컬럼 == 해당 종목을 상장 이후 데이터만으로 단독 계산한 결과 """
+    monkeypatch.setattr(kernels, "USE_KERNELS", use_kernels)
+
+    result = func.uncached(*(panel[f] for f in fields), *params)
+    results = result if isinstance(result, tuple) else (result,)
+
+    for symbol in panel["Close"].columns:
+        listed = panel["Close"][symbol].notna()
+        single = func.uncached(*(panel[f][symbol][listed] for f in fields), *params)
+        singles = single if isinstance(single, tuple) else (single,)
+
+        for frame, expected in zip(results, singles):
+            assert isinstance(frame, pd.DataFrame)
+            assert frame.index.equals(panel["Close"].index)
+            assert frame[symbol][~listed].isna().all()      # 상장 이전 구간은 NaN
+            np.testing.assert_allclose(
+                frame[symbol][listed].to_numpy(dtype=float), expected.to_numpy(dtype=float),
+                rtol=kernels.KERNEL_RTOL, equal_nan=True,
+            )
+
+
+def test_panel_from_ndarray(panel):
+    close = panel["Close"].to_numpy()
+    result = RSI(close, 14)
+    assert isinstance(result, pd.DataFrame)
+    assert result.shape == close.shape
+    np.testing.assert_allclose(result.to_numpy(), RSI(panel["Close"], 14).to_numpy(), equal_nan=True)
+
+
+def test_one_dimensional_unchanged(panel):
+    close = panel["Close"]["S0"]
+    assert isinstance(RSI(close, 14), pd.Series)
+    assert MACD_signal_crossover(close).dtype == np.int64
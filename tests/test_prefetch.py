@@ -0,0 +1,155 @@
+import asyncio
+import time
+from collections import Counter
+
+import pandas as pd
+import pytest
+
+from tests.conftest import make_ohlcv
+from utils.data_loader import DataProvider, LocalFileProvider, OHLCVCache, normalize_ohlcv
+from utils.prefetch import AsyncDataProvider, RetryPolicy, iter_prefetch, prefetch
+
+
+NO_WAIT = RetryPolicy(backoff=0.0, jitter=0.0)
+
+
+class FlakyProvider(DataProvider):
+    """ 종목별로 처음 failures번은 실패(또는 빈 응답)하는 동기 공급자 """
+
+    def __init__(self, failures=0, empty=False, delay=0.0):
+        self.failures = failures
+        self.empty = empty
+        self.delay = delay
+        self.calls = Counter()
+
+    def fetch(self, symbol, start, end, interval="1d"):
+        self.calls[symbol] += 1
+        time.sleep(self.delay)
+        if self.calls[symbol] <= self.failures:
+            if self.empty:
+                return normalize_ohlcv(pd.DataFrame())
+            raise ConnectionError(f"{symbol} 일시 오류")
+        return make_ohlcv(n=50, seed=len(symbol))
+
+
+class SleepingProvider(AsyncDataProvider):
+    """ 종목별 지연 후 응답하는 비동기 공급자 (동시 실행 수 기록) """
+
+    def __init__(self, delays):
+        self.delays = delays
+        self.running = 0
+        self.max_running = 0
+
+    async def fetch(self, symbol, start, end, interval="1d"):
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        try:
+            await asyncio.sleep(self.delays[symbol])
+        finally:
+            self.running -= 1
+        return make_ohlcv(n=10)
+
+
+async def _collect(*args, **kwargs):
+    return [item async for item in prefetch(*args, **kwargs)]
+
+
+def test_yields_in_completion_order_with_bounded_concurrency():
+    delays = {"SLOW": 0.2, **{f"S{i}": 0.01 * i for i in range(1, 10)}}
+    provider = SleepingProvider(delays)
+
+    results = asyncio.run(_collect(list(delays), "2020-01-01", "2021-01-01", provider=provider, max_concurrency=4))
+
+    assert [symbol for symbol, _ in results][-1] == "SLOW"
+    assert {symbol for symbol, _ in results} == set(delays)
+    assert provider.max_running == 4
+
+
+def test_retries_transient_failures():
+    provider = FlakyProvider(failures=2)
+    results = dict(asyncio.run(_collect(["A", "B", "A"], "2020-01-01", "2021-01-01", provider=provider, retry=NO_WAIT)))
+
+    assert set(results) == {"A", "B"}                 # 중복 종목은 한 번만
+    assert all(isinstance(df, pd.DataFrame) and len(df) == 50 for df in results.values())
+    assert provider.calls == {"A": 3, "B": 3}
+
+
+def test_gives_up_after_retries():
+    provider = FlakyProvider(failures=10)
+    retry = RetryPolicy(retries=2, backoff=0.0, jitter=0.0)
+    results = dict(asyncio.run(_collect(["A"], "2020-01-01", "2021-01-01", provider=provider, retry=retry)))
+
+    assert isinstance(results["A"], ConnectionError)
+    assert provider.calls["A"] == 3
+
+    with pytest.raises(ConnectionError):
+        asyncio.run(_collect(["A"], "2020-01-01", "2021-01-01", provider=provider, retry=retry, return_exceptions=False))
+
+
+def test_empty_response_is_retried_then_returned():
+    provider = FlakyProvider(failures=1, empty=True)
+    results = dict(asyncio.run(_collect(["A"], "2020-01-01", "2021-01-01", provider=provider, retry=NO_WAIT)))
+    assert len(results["A"]) == 50 and provider.calls["A"] == 2
+
+    provider = FlakyProvider(failures=10, empty=True)
+    results = dict(asyncio.run(_collect(["A"], "2020-01-01", "2021-01-01", provider=provider, retry=NO_WAIT)))
+    assert results["A"].empty and provider.calls["A"] == 4
+
+
+def test_timeout_is_retried():
+    provider = SleepingProvider({"A": 1.0})
+    retry = RetryPolicy(retries=1, backoff=0.0, jitter=0.0)
+    results = dict(asyncio.run(_collect(["A"], "2020-01-01", "2021-01-01", provider=provider, retry=retry, timeout=0.05)))
+    assert isinstance(results["A"], asyncio.TimeoutError)
+
+
+def test_retry_delay_is_exponential_and_capped():
+    retry = RetryPolicy(backoff=0.5, max_backoff=3.0, jitter=0.0)
+    assert [retry.delay(i) for i in range(4)] == [0.5, 1.0, 2.0, 3.0]
+    assert 0.45 <= RetryPolicy(backoff=0.5, jitter=0.1).delay(0) <= 0.55
+
+
+def test_sync_providers_run_concurrently():
+    provider = FlakyProvider(delay=0.2)
+    symbols = [f"S{i}" for i in range(8)]
+
+    started = time.perf_counter()
+    results = dict(iter_prefetch(symbols, "2020-01-01", "2021-01-01", provider=provider, max_concurrency=8))
+
+    assert time.perf_counter() - started < 0.2 * len(symbols) / 2
+    assert set(results) == set(symbols)
+
+
+def test_iter_prefetch_through_cache(tmp_path):
+    root = tmp_path / "files"
+    root.mkdir()
+    for seed, symbol in enumerate(["AAA", "BBB"]):
+        make_ohlcv(n=300, seed=seed, start="2020-01-01").to_csv(root / f"{symbol}.csv")
+    cache = OHLCVCache(str(tmp_path / "cache"), provider=LocalFileProvider(str(root)))
+
+    results = dict(iter_prefetch(["AAA", "MISSING", "BBB"], "2020-01-01", "2021-01-01", provider=cache, retry=NO_WAIT))
+
+    assert isinstance(results["MISSING"], FileNotFoundError)      # 재시도 없이 실패
+    pd.testing.assert_frame_equal(results["AAA"], cache.get("AAA", "2020-01-01", "2021-01-01"))
+    assert cache.stats.misses == 3 and cache.stats.hits == 1
+
+
+@pytest.mark.filterwarnings("error::pytest.PytestUnhandledThreadExceptionWarning")
+def test_iter_prefetch_stops_early():
+    provider = SleepingProvider({"FAST": 0.0, "SLOW": 5.0})
+
+    started = time.perf_counter()
+    for symbol, _ in iter_prefetch(["FAST", "SLOW"], "2020-01-01", "2021-01-01", provider=provider):
+        assert symbol == "FAST"
+        break
+    assert time.perf_counter() - started < 2.0             # 남은 요청은 취소
+
+
+@pytest.mark.filterwarnings("error::pytest.PytestUnhandledThreadExceptionWarning")
+def test_iter_prefetch_propagates_caller_error():
+    """ 순회 중 호출 측 예외는 그대로 전파되고, 로드 스레드는 예외 없이 종료 """
+    provider = SleepingProvider({"FAST": 0.0, "SLOW": 5.0})
+
+    with pytest.raises(RuntimeError, match="caller"):
+        for _ in iter_prefetch(["FAST", "SLOW"], "2020-01-01", "2021-01-01", provider=provider):
+            raise RuntimeError("caller")
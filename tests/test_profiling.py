@@ -0,0 +1,106 @@
+import numpy as np
+import pandas as pd
+import pytest
+from backtesting import Backtest
+
+import runner.backtest as backtest_module
+import strategies.smart_score as smart_score
+from runner.backtest import LoggedBacktest
+from strategies.smart_score import SmartScore
+from utils.log_writer import AsyncLogWriter
+from utils.looger_sqlite import SQLiteLogger
+from utils.profiling import PROFILE_COLUMNS, PhaseProfiler, PhaseStats, instrument
+from utils.result_store import ParquetResultStore
+
+
+@pytest.fixture(autouse=True)
+def tmp_log_writer(tmp_path, monkeypatch):
+    writer = AsyncLogWriter(sink=SQLiteLogger(db_path=str(tmp_path / "strategy_logs.sqlite")))
+    monkeypatch.setattr(smart_score, "log_writer", writer)
+    monkeypatch.setattr(backtest_module, "log_writer", writer)
+    yield writer
+    writer.close()
+    writer.sink.close()
+
+
+class Counter:
+    def __init__(self):
+        self.n = 0
+
+    def step(self, k=1):
+        self.n += k
+        return self.n
+
+
+def test_instrument_wraps_only_the_instance():
+    counter, other = Counter(), Counter()
+    profiler = instrument(counter, ["step"], names={"step": "counting"})
+
+    assert counter.step(2) == 2 and counter.step() == 3
+    assert "step" not in vars(other)            # 다른 인스턴스/클래스는 그대로
+
+    summary = profiler.summary()
+    assert list(summary.columns) == PROFILE_COLUMNS
+    row = summary.set_index("phase").loc["counting"]
+    assert row["calls"] == 2
+    assert 0 < row["p50_us"] <= row["p99_us"]
+    assert row["total_ms"] == pytest.approx(row["mean_us"] * 2 / 1e3)
+
+
+def test_exceptions_are_timed_and_reraised():
+    profiler = PhaseProfiler()
+    failing = profiler.wrap("fail", lambda: 1 / 0)
+    with pytest.raises(ZeroDivisionError):
+        failing()
+    assert profiler.summary()["calls"].tolist() == [1]
+
+
+def test_phase_stats_memory_is_bounded_and_percentiles_are_close():
+    ns = np.random.default_rng(0).lognormal(9, 1.5, 50_000).astype(np.int64)
+    stats = PhaseStats()
+    buckets = len(stats.buckets)
+    for value in ns.tolist():
+        stats.add(value)
+
+    assert len(stats.buckets) == buckets            # 호출 수와 관계없이 고정 크기
+    assert stats.count == len(ns) and stats.total == ns.sum()
+    assert (stats.min, stats.max) == (ns.min(), ns.max())
+    for q in (1, 50, 99):
+        assert stats.percentile(q) == pytest.approx(np.percentile(ns, q), rel=0.05)
+
+    # 값이 하나면 분위수는 그 값 (최소~최대 범위로 제한)
+    single = PhaseStats()
+    single.add(123_456)
+    assert single.percentile(50) == single.percentile(99) == 123_456
+
+
+def test_smart_score_phase_breakdown(ohlcv):
+    plain = Backtest(ohlcv, SmartScore, cash=10000, commission=.002).run()
+    profiled = Backtest(ohlcv, SmartScore, cash=10000, commission=.002).run(profile=True)
+
+    # 측정 여부와 관계없이 매매 결과 동일, 비활성화 시에는 메서드를 교체하지 않음
+    assert plain._strategy.profiler is None
+    assert "next" not in vars(plain._strategy)
+    assert plain._trades[["EntryBar", "ExitBar", "Size"]].equals(profiled._trades[["EntryBar", "ExitBar", "Size"]])
+
+    summary = profiled._strategy.profiler.summary().set_index("phase")
+    assert set(SmartScore._PROFILED_PHASES.values()) - {"handle_bull_market_logic", "check_exit_conditions"} <= set(summary.index)
+    assert summary.loc["calculate_score", "calls"] == summary.loc["next", "calls"]
+    assert summary.loc["log", "calls"] >= summary.loc["next", "calls"]      # 바마다 스코어 로그 + 매매 로그
+    assert summary.loc["next", "total_ms"] >= summary.loc["calculate_score", "total_ms"]
+
+
+def test_profile_is_stored_with_run(ohlcv, tmp_path):
+    store = ParquetResultStore(str(tmp_path / "store"))
+    bt = LoggedBacktest(ohlcv, SmartScore, cash=10000, commission=.002, symbol="AAA", result_store=store)
+    stats = bt.run(profile=True)
+
+    assert isinstance(stats["_profile"], pd.DataFrame)
+    stored = store.query("profile", filters=[("symbol", "=", "AAA")])
+    assert set(stored["run_id"]) == {bt.run_id}
+    assert sorted(stored["phase"]) == sorted(stats["_profile"]["phase"])
+    assert stored["calls"].dtype == "Int64"
+
+    # profile=False 실행은 profile 테이블에 기록하지 않음
+    LoggedBacktest(ohlcv, SmartScore, cash=10000, commission=.002, symbol="BBB", result_store=store).run()
+    assert set(store.query("profile", columns=["symbol"])["symbol"]) == {"AAA"}
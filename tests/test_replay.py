@@ -0,0 +1,105 @@
+import numpy as np
+import pandas as pd
+import pytest
+from backtesting import Backtest
+
+from runner.replay import BarFeed, PaperBroker, ReplaySmartScore, run_replay
+from strategies.smart_score import SmartScore
+from tests.conftest import make_ohlcv
+
+
+TRADE_COLUMNS = ["Size", "EntryPrice", "ExitPrice", "PnL"]
+
+
+@pytest.fixture
+def data():
+    return make_ohlcv(n=1500, seed=1)
+
+
+@pytest.mark.parametrize("params", [{}, {"buy_threshold": 1.0, "trailing_stop_drawdown": 0.03}])
+def test_matches_backtest(data, params):
+    """ 증분 상태로 재생한 거래/자산 곡선이 Backtest.run(vectorized) 결과와 같음 """
+    stats = Backtest(data, SmartScore, cash=10000, commission=.002).run(log_enabled=False, **params)
+    result = run_replay(data, cash=10000, commission=.002, **params)
+
+    expected = stats["_trades"].reset_index(drop=True)
+    assert len(result.trades) == len(expected) > 0
+    np.testing.assert_allclose(result.trades[TRADE_COLUMNS].to_numpy(float), expected[TRADE_COLUMNS].to_numpy(float))
+    assert (result.trades["EntryTime"].to_numpy() == expected["EntryTime"].to_numpy()).all()
+    assert (result.trades["ExitTime"].to_numpy() == expected["ExitTime"].to_numpy()).all()
+    np.testing.assert_allclose(result.equity.to_numpy(), stats["_equity_curve"]["Equity"].to_numpy())
+
+
+def test_latency_report_from_file(tmp_path, data):
+    path = str(tmp_path / "bars.csv")
+    data.to_csv(path)
+    result = run_replay(path)
+
+    latency = result.latency.set_index("phase")
+    assert result.bars == len(data)
+    assert latency.loc["bar", "calls"] == len(data)
+    assert latency.loc["indicators", "calls"] == len(data)
+    assert latency.loc["decision", "calls"] == result.decisions < len(data)
+    assert (latency["p99_us"] >= latency["p50_us"]).all()
+    assert result.keeps_up(60)
+    assert not result.keeps_up(1e-9)
+    assert result.profile is None
+
+
+def test_profile_phases(data):
+    result = run_replay(data.iloc[:300], profile=True)
+    assert {"next", "calculate_score", "get_market_regime"} <= set(result.profile["phase"])
+
+
+def test_feed_speed_and_lag():
+    index = pd.date_range("2024-01-02 09:00", periods=11, freq="s")
+    data = make_ohlcv(n=11).set_axis(index)
+
+    # 1초봉 10개 간격을 100배속 -> 최소 0.1초
+    feed = BarFeed(data, speed=100)
+    bars = list(feed)
+    assert len(bars) == 11 and bars[0][0] == index[0]
+    assert feed.lags == []
+
+    result = run_replay(data, speed=100)
+    assert result.elapsed >= 0.1
+
+    # 처리 시간보다 바 간격이 짧으면 지연된 바로 기록
+    result = run_replay(make_ohlcv(n=200).set_axis(pd.date_range("2024-01-02", periods=200, freq="s")), speed=1e6)
+    assert result.late_bars > 0
+    assert result.max_lag > 0
+
+    with pytest.raises(ValueError):
+        BarFeed(data, speed=0)
+
+
+def test_paper_broker_fills_on_next_open():
+    broker = PaperBroker(cash=1000, commission=.01)
+    assert broker.next("t0", 10.0, 10.0) == 1000
+
+    broker.new_order(50)
+    assert broker.position.size == 0                    # 다음 바 시가에 체결
+    broker.next("t1", 10.0, 12.0)
+    assert broker.position.size == 50
+    assert broker.equity == pytest.approx(1000 - 5 + 50 * 2)
+
+    broker.new_order(-20)                               # 일부 청산
+    broker.next("t2", 11.0, 11.0)
+    assert broker.position.size == 30
+    assert broker.closed_trades[-1]["Size"] == 20
+    assert broker.closed_trades[-1]["PnL"] == pytest.approx(20 * 1 - 20 * 11 * .01 - 20 * 10 * .01)
+
+    broker.new_order(1000)                              # 증거금 부족 -> 취소
+    broker.next("t3", 11.0, 11.0)
+    assert broker.canceled_orders == 1
+    assert broker.position.size == 30
+
+    with pytest.raises(ValueError):
+        broker.new_order(1, limit=10.0)
+
+
+def test_rejects_unsupported_params():
+    with pytest.raises(ValueError):
+        ReplaySmartScore(PaperBroker(), {"regime_source": "evaluator"})
+    with pytest.raises(AttributeError):
+        ReplaySmartScore(PaperBroker(), {"no_such_param": 1})
@@ -0,0 +1,77 @@
+import pandas as pd
+import pytest
+
+import runner.backtest as backtest_module
+import strategies.smart_score as smart_score
+from runner.backtest import LoggedBacktest
+from strategies.smart_score import SmartScore
+from utils.log_writer import AsyncLogWriter
+from utils.looger_sqlite import SQLiteLogger
+from utils.result_store import ParquetResultStore, apply_schema, RESULT_SCHEMAS
+
+
+@pytest.fixture(autouse=True)
+def tmp_log_writer(tmp_path, monkeypatch):
+    writer = AsyncLogWriter(sink=SQLiteLogger(db_path=str(tmp_path / "strategy_logs.sqlite")))
+    monkeypatch.setattr(smart_score, "log_writer", writer)
+    monkeypatch.setattr(backtest_module, "log_writer", writer)
+    yield writer
+    writer.close()
+    writer.sink.close()
+
+
+@pytest.fixture
+def store(tmp_path):
+    return ParquetResultStore(str(tmp_path / "store"))
+
+
+def test_runs_are_stored_typed_and_partitioned(ohlcv, store, tmp_log_writer):
+    run_ids = {}
+    for symbol in ["AAA", "BBB"]:
+        bt = LoggedBacktest(ohlcv, SmartScore, cash=10000, commission=.002, symbol=symbol, result_store=store)
+        stats = bt.run()
+        run_ids[symbol] = bt.run_id
+
+    trades = store.query("trade")
+    assert set(trades["symbol"]) == {"AAA", "BBB"}
+    assert pd.api.types.is_datetime64_any_dtype(trades["date"])
+    assert trades["price"].dtype == "float64"
+    assert trades["roi"][trades["action"] == "buy"].isna().all()      # 매수 로그의 roi는 결측
+
+    # 기존 SQLite sink에도 그대로 기록 (run_id/symbol 태그 포함)
+    sqlite_rows = pd.read_sql("SELECT run_id, symbol FROM trading_log", tmp_log_writer.sink.conn)
+    assert len(sqlite_rows) == len(trades)
+    assert set(zip(sqlite_rows["symbol"], sqlite_rows["run_id"])) == set(run_ids.items())
+
+    # 파티션 조건 + 컬럼 선택
+    aaa = store.query("score", columns=["run_id", "TOTAL"], filters=[("symbol", "=", "AAA")])
+    assert list(aaa.columns) == ["run_id", "TOTAL"]
+    assert set(aaa["run_id"]) == {run_ids["AAA"]}
+    assert aaa["TOTAL"].dtype == "float64"
+
+    stats_rows = store.query("stats", columns=["symbol", "run_id", "# Trades", "Return [%]"])
+    assert len(stats_rows) == 2
+    assert stats_rows.set_index("symbol").loc["BBB", "Return [%]"] == pytest.approx(stats["Return [%]"])
+
+
+def test_failed_run_discards_logs(ohlcv, store):
+    class Broken(SmartScore):
+        def next(self):
+            super().next()
+            if len(self.data) > 100:
+                raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        LoggedBacktest(ohlcv, Broken, cash=10000, symbol="AAA", result_store=store).run()
+
+    assert store.query("score").empty
+    LoggedBacktest(ohlcv, SmartScore, cash=10000, symbol="AAA", result_store=store).run()
+    assert len(store.query("stats")) == 1
+
+
+def test_apply_schema_fills_missing_columns():
+    df = pd.DataFrame([{"date": "2024.01.02", "action": "Trailing Stop", "size": 3, "roi": "-"}])
+    typed = apply_schema(df, RESULT_SCHEMAS["trading_log"])
+    assert typed["market_regime"].isna().all()
+    assert str(typed["size"].dtype) == "Int64"
+    assert typed["date"].iloc[0] == pd.Timestamp("2024-01-02")
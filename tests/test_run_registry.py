@@ -0,0 +1,106 @@
+import sqlite3
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+import pytest
+
+import runner.backtest as backtest_module
+import strategies.smart_score as smart_score
+from indicators.cache import fingerprint
+from runner.backtest import LoggedBacktest
+from strategies.smart_score import SmartScore
+from tests.conftest import make_ohlcv
+from utils.log_writer import AsyncLogWriter
+from utils.looger_sqlite import SQLiteLogger
+from utils.run_registry import RunRegistry, strategy_params
+
+
+@pytest.fixture(autouse=True)
+def tmp_log_writer(tmp_path, monkeypatch):
+    writer = AsyncLogWriter(sink=SQLiteLogger(db_path=str(tmp_path / "strategy_logs.sqlite")))
+    monkeypatch.setattr(smart_score, "log_writer", writer)
+    monkeypatch.setattr(backtest_module, "log_writer", writer)
+    yield writer
+    writer.close()
+    writer.sink.close()
+
+
+@pytest.fixture
+def registry(tmp_path):
+    return RunRegistry(str(tmp_path / "runs.sqlite"))
+
+
+def test_strategy_params_resolves_class_defaults():
+    params = strategy_params(SmartScore, {"n1": 10})
+    assert params["n1"] == 10
+    assert params["n2"] == SmartScore.n2
+    assert params["regime_source"] == "zscore"
+    assert "init" not in params and "data" not in params
+
+
+def test_repeated_runs_are_recorded_separately(ohlcv, registry, tmp_log_writer):
+    bt = LoggedBacktest(ohlcv, SmartScore, cash=10000, commission=.002, symbol="AAA", registry=registry)
+    bt.run()
+    first = bt.run_id
+    bt.run(buy_threshold=1.0)
+    second = bt.run_id
+    assert first != second
+
+    runs = registry.runs(symbol="AAA")
+    assert list(runs["run_id"]) == [first, second]
+    assert (runs["status"] == "ok").all()
+    assert (runs["elapsed_sec"] > 0).all()
+    assert (runs["data_fingerprint"] == fingerprint(ohlcv)).all()
+    assert runs["bars"].tolist() == [len(ohlcv)] * 2
+
+    run = registry.get(second)
+    assert run["strategy"] == "SmartScore"
+    assert run["params"]["buy_threshold"] == 1.0
+    assert registry.get(first)["params"]["buy_threshold"] == SmartScore.buy_threshold
+
+    # 두 실행의 로그가 한 DB에 run_id로 구분되어 누적
+    logged = pd.read_sql("SELECT run_id, COUNT(*) AS n FROM score_log GROUP BY run_id", tmp_log_writer.sink.conn)
+    assert set(logged["run_id"]) == {first, second}
+
+
+def test_failed_run_is_marked(ohlcv, registry):
+    class Broken(SmartScore):
+        def next(self):
+            raise RuntimeError("boom")
+
+    bt = LoggedBacktest(ohlcv, Broken, cash=10000, symbol="AAA", registry=registry)
+    with pytest.raises(RuntimeError):
+        bt.run()
+
+    run = registry.get(bt.run_id)
+    assert run["status"] == "failed"
+    assert run["error"] == "RuntimeError: boom"
+    assert run["finished_at"] is not None
+
+
+def _run_shared(args):
+    """ 워커 프로세스: 공유 레지스트리 + 공유 로그 DB에 기록 """
+    seed, registry_path, log_path = args
+    writer = AsyncLogWriter(sink=SQLiteLogger(db_path=log_path, buffer_size=50))
+    smart_score.log_writer = backtest_module.log_writer = writer
+    bt = LoggedBacktest(make_ohlcv(n=300, seed=seed), SmartScore, cash=10000, symbol=f"S{seed}",
+                        registry=RunRegistry(registry_path))
+    bt.run()
+    writer.close()
+    writer.sink.close()
+    return bt.run_id
+
+
+def test_parallel_runs_share_registry_and_log_db(tmp_path):
+    registry_path, log_path = str(tmp_path / "runs.sqlite"), str(tmp_path / "logs.sqlite")
+    with ProcessPoolExecutor(max_workers=3) as executor:
+        run_ids = list(executor.map(_run_shared, [(seed, registry_path, log_path) for seed in range(6)]))
+
+    runs = RunRegistry(registry_path).runs()
+    assert sorted(runs["run_id"]) == sorted(run_ids)
+    assert (runs["status"] == "ok").all()
+
+    with sqlite3.connect(log_path) as conn:
+        counts = dict(conn.execute("SELECT run_id, COUNT(*) FROM score_log GROUP BY run_id").fetchall())
+    assert set(counts) == set(run_ids)
+    assert all(n > 0 for n in counts.values())
@@ -0,0 +1,122 @@
+import numpy as np
+import pytest
+
+from scoring.score_factors import (
+    calc_ema_adx_score, calc_ema_adx_score_batch,
+    calc_macd_hist_score, calc_macd_hist_score_batch,
+    calc_rsi_score, calc_rsi_score_batch,
+    calc_volume_score, calc_volume_score_batch,
+    calc_bb_score_z, calc_bb_score_z_batch,
+    calc_sma_score, calc_sma_score_batch,
+)
+
+
+@pytest.fixture
+def rng():
+    return np.random.default_rng(42)
+
+
+def with_nans(values, rng, ratio=0.05):
+    values = values.copy()
+    values[rng.random(len(values)) < ratio] = np.nan
+    return values
+
+
+def test_ema_adx_batch_matches_scalar(rng):
+    ema_short = with_nans(100 + rng.normal(0, 2, 300), rng)
+    ema_long = with_nans(100 + rng.normal(0, 2, 300), rng)
+    adx = with_nans(rng.choice([10, 15, 20, 25, 40], 300) + rng.normal(0, 1, 300) * (rng.random(300) < 0.5), rng)
+
+    batch = calc_ema_adx_score_batch(ema_short, ema_long, adx)
+    scalar = [calc_ema_adx_score(ema_short[:i + 1], ema_long[:i + 1], adx[:i + 1]) for i in range(300)]
+    np.testing.assert_array_equal(batch, scalar)
+
+
+def test_macd_hist_batch_matches_scalar(rng):
+    macd = with_nans(rng.normal(0, 0.3, 300), rng)
+    signal = rng.normal(0, 0.3, 300)
+
+    batch = calc_macd_hist_score_batch(macd, signal)
+    scalar = [calc_macd_hist_score(macd[:i + 1], signal[:i + 1]) for i in range(300)]
+    np.testing.assert_array_equal(batch, scalar)
+
+
+def test_rsi_batch_matches_scalar(rng):
+    rsi = with_nans(np.r_[[20, 30, 70, 80, 19.99, 80.01], rng.uniform(0, 100, 300)], rng)
+
+    batch = calc_rsi_score_batch(rsi)
+    scalar = [calc_rsi_score(v) for v in rsi]
+    np.testing.assert_array_equal(batch, scalar)
+
+
+def test_volume_batch_matches_scalar(rng):
+    volume = rng.uniform(1e5, 1e6, 300)
+    avg_volume = with_nans(np.r_[0, 0, rng.uniform(1e5, 1e6, 298)], rng)
+
+    batch = calc_volume_score_batch(volume, avg_volume)
+    scalar = [calc_volume_score(v, a) for v, a in zip(volume, avg_volume)]
+    np.testing.assert_array_equal(batch, scalar)
+
+
+def test_bb_batch_matches_scalar(rng):
+    price = 100 + rng.normal(0, 3, 300)
+    mid = 100 + rng.normal(0, 1, 300)
+    width = np.where(rng.random(300) < 0.1, 0, rng.uniform(1, 10, 300))
+
+    batch = calc_bb_score_z_batch(price, mid, mid + width / 2, mid - width / 2)
+    scalar = [calc_bb_score_z(p, m, m + w / 2, m - w / 2) for p, m, w in zip(price, mid, width)]
+    np.testing.assert_array_equal(batch, scalar)
+
+
+def test_sma_batch_matches_scalar(rng):
+    sma_short = with_nans(100 + np.cumsum(rng.normal(0, 1, 300)), rng, ratio=0.02)
+    sma_long = 100 + np.cumsum(rng.normal(0, 0.5, 300))
+
+    batch = calc_sma_score_batch(sma_short, sma_long)
+    scalar = [calc_sma_score(sma_short[:i + 1], sma_long[:i + 1]) for i in range(300)]
+    np.testing.assert_array_equal(batch, scalar)
+    assert all(type(v) is float for v in scalar)
+
+
+def test_scalar_matches_batch_at_branch_boundaries():
+    """ 스칼라 if/elif 구현과 배열 버전이 분기 경계·클리핑 경계·NaN에서 동일 """
+    nan = np.nan
+
+    rsi = [19.999, 20, 29.999, 30, 50, 70, 70.001, 80, 80.001, nan]
+    np.testing.assert_array_equal(calc_rsi_score_batch(rsi), [calc_rsi_score(v) for v in rsi])
+
+    # ADX 15/25 경계, EMA 스프레드 ±2.4 클리핑 경계(sensitivity=800 -> 스프레드 0.003), 합계 ±4 클리핑
+    adx = [14.999, 15, 15.001, 20, 24.999, 25, 25.001, 60, nan]
+    ema_long = [100.0] * len(adx)
+    for ema_short in (100.0, 100.3, 100.31, 99.7, 99.69, 150.0, 50.0, nan):
+        short = [ema_short] * len(adx)
+        batch = calc_ema_adx_score_batch(short, ema_long, adx)
+        scalar = [calc_ema_adx_score(short[:i + 1], ema_long[:i + 1], adx[:i + 1]) for i in range(len(adx))]
+        np.testing.assert_array_equal(batch, scalar)
+    assert calc_ema_adx_score([], [], []) == 0.0
+    assert calc_ema_adx_score([100.0], [0.0], [30.0]) == calc_ema_adx_score_batch([100.0], [0.0], [30.0])[0]
+
+    macd = [0.0, 0.2, 0.2001, -0.2, -0.2001, 1.0, nan]
+    signal = [0.0] * len(macd)
+    np.testing.assert_array_equal(
+        calc_macd_hist_score_batch(macd, signal),
+        [calc_macd_hist_score(macd[:i + 1], signal[:i + 1]) for i in range(len(macd))],
+    )
+
+    volume = [0.0, 100.0, 110.0, 110.1, 90.0, 89.9, 100.0, nan]
+    avg_volume = [0.0, 0.0, 100.0, 100.0, 100.0, 100.0, nan, 100.0]
+    np.testing.assert_array_equal(
+        calc_volume_score_batch(volume, avg_volume),
+        [calc_volume_score(v, a) for v, a in zip(volume, avg_volume)],
+    )
+
+    # 밴드 폭 0, z = ±1 (클리핑 경계), 밴드 밖, NaN
+    price = [100.0, 100.0, 101.0, 99.0, 101.5, 98.0, nan, 100.0]
+    mid = [100.0] * len(price)
+    width = [0.0, 4.0, 4.0, 4.0, 4.0, 4.0, 4.0, nan]
+    upper = [m + w / 2 for m, w in zip(mid, width)]
+    lower = [m - w / 2 for m, w in zip(mid, width)]
+    np.testing.assert_array_equal(
+        calc_bb_score_z_batch(price, mid, upper, lower),
+        [calc_bb_score_z(p, m, u, l) for p, m, u, l in zip(price, mid, upper, lower)],
+    )
@@ -0,0 +1,75 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+from runner.shared_data import SharedOHLCV
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 생성 프로세스가 2-워커 풀로 공유 블록을 읽고, 별도 인터프리터(자체 resource_tracker)에서도 연결한 뒤 해제
+SCRIPT = """
+import multiprocessing
+import subprocess
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from runner.shared_data import SharedOHLCV
+from tests.conftest import make_ohlcv
+
+_worker = {}
+
+
+def init(spec):
+    _worker["shm"], _worker["data"] = SharedOHLCV.attach(spec)
+
+
+def close_sum(_):
+    return float(_worker["data"]["Close"].sum())
+
+
+if __name__ == "__main__":
+    data = make_ohlcv(n=300)
+    with SharedOHLCV(data) as shared:
+        context = multiprocessing.get_context(sys.argv[1])
+        with ProcessPoolExecutor(2, mp_context=context, initializer=init, initargs=(shared.spec,)) as executor:
+            sums = list(executor.map(close_sum, range(4)))
+        assert sums == [float(data["Close"].sum())] * 4
+
+        code = f"from runner.shared_data import SharedOHLCV; shm, _ = SharedOHLCV.attach({shared.spec!r}); shm.close()"
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+        # 다른 프로세스가 종료되어도 블록은 생성 프로세스가 해제할 때까지 유지
+        shm, attached = SharedOHLCV.attach(shared.spec)
+        assert attached.equals(data)
+        del attached
+        shm.close()
+    print("ok")
+"""
+
+
+def test_attach_keeps_data_readable(ohlcv):
+    with SharedOHLCV(ohlcv) as shared:
+        shm, data = SharedOHLCV.attach(shared.spec)
+        assert data.equals(ohlcv)
+        assert not data["Close"].to_numpy().flags.writeable
+        del data
+        shm.close()
+
+
+@pytest.mark.parametrize("start_method", ["fork", "spawn"])
+def test_worker_pool_leaves_no_tracker_warnings(tmp_path, start_method):
+    script = tmp_path / "pool.py"
+    script.write_text(SCRIPT, encoding="utf-8")
+    env = {**os.environ, "PYTHONPATH": ROOT}
+
+    result = subprocess.run(
+        [sys.executable, str(script), start_method], cwd=ROOT, env=env, capture_output=True, text=True, timeout=120,
+    )
+
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip().endswith("ok")
+    for marker in ("resource_tracker", "leaked", "Traceback", "No such file"):
+        assert marker not in result.stderr
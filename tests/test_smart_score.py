@@ -0,0 +1,102 @@
+import numpy as np
+import pytest
+from backtesting import Backtest
+
+import strategies.smart_score as smart_score
+from strategies.smart_score import SmartScore
+from utils.log_writer import AsyncLogWriter
+from utils.looger_sqlite import SQLiteLogger
+
+
+@pytest.fixture(autouse=True)
+def tmp_log_writer(tmp_path, monkeypatch):
+    # 테스트 로그는 임시 디렉토리에 기록
+    writer = AsyncLogWriter(sink=SQLiteLogger(db_path=str(tmp_path / "strategy_logs.sqlite")))
+    monkeypatch.setattr(smart_score, "log_writer", writer)
+    yield writer
+    writer.close()
+    writer.sink.close()
+
+
+def test_vectorized_matches_per_bar(ohlcv):
+    """
+    vectorized 모드와 기존 바별 재계산 모드의 매매 결과가 동일한지 확인
+    """
+    vectorized = Backtest(ohlcv, SmartScore, cash=10000, commission=.002).run(vectorized=True)
+    per_bar = Backtest(ohlcv, SmartScore, cash=10000, commission=.002).run(vectorized=False)
+
+    assert vectorized["# Trades"] == per_bar["# Trades"]
+    assert vectorized["Equity Final [$]"] == pytest.approx(per_bar["Equity Final [$]"])
+    assert vectorized._trades[["EntryBar", "ExitBar", "Size"]].equals(
+        per_bar._trades[["EntryBar", "ExitBar", "Size"]]
+    )
+
+
+def test_evaluator_regime_source(ohlcv, tmp_log_writer):
+    """
+    regime_source="evaluator"이면 MarketRegimeEvaluator.classify() 결과를 바별로 사용
+    """
+    import pandas as pd
+    from regime.market_regime_evaluator import MarketRegimeEvaluator
+
+    Backtest(ohlcv, SmartScore, cash=10000, commission=.002).run(regime_source="evaluator")
+    tmp_log_writer.flush()
+
+    logged = pd.read_sql("SELECT date, market_regime FROM score_log", tmp_log_writer.sink.conn)
+    expected = MarketRegimeEvaluator(ohlcv).classify()
+    expected = expected.rename(index=lambda d: d.strftime("%Y.%m.%d")).map(lambda r: r.value)
+
+    # score_log는 get_market_regime() 이전에 기록되므로 직전 바의 레짐이 남음
+    assert len(logged) > 1
+    previous = expected.loc[logged["date"]].to_numpy()[:-1]
+    assert (logged["market_regime"].to_numpy()[1:] == previous).all()
+
+
+def test_unknown_regime_source(ohlcv):
+    with pytest.raises(ValueError):
+        Backtest(ohlcv, SmartScore, cash=10000, commission=.002).run(regime_source="unknown")
+
+
+def test_unknown_regime_source_with_precomputed(ohlcv):
+    from runner.walk_forward import precompute_indicators
+
+    precomputed = precompute_indicators(ohlcv, SmartScore)
+    with pytest.raises(ValueError):
+        Backtest(ohlcv, SmartScore).run(log_enabled=False, precomputed=precomputed, regime_source="unknown")
+
+
+def test_precomputed_window_reports_std_from_first_bar(ohlcv):
+    """ 워밍업이 끝난 사전 계산 배열을 자른 구간은 regime_window 이전 바에서도 std/z-score를 그대로 사용 """
+    from runner.walk_forward import precompute_indicators
+
+    precomputed = precompute_indicators(ohlcv, SmartScore)
+    lo, hi = 300, 300 + SmartScore.regime_window // 2
+    stats = Backtest(ohlcv.iloc[lo:hi], SmartScore).run(
+        log_enabled=False, precomputed={k: v[lo:hi] for k, v in precomputed.items()},
+    )
+
+    strategy = stats._strategy
+    assert strategy.std == precomputed["_regime_std"][hi - 1] != 0
+    assert strategy.z_score == precomputed["_regime_z_score"][hi - 1]
+
+
+@pytest.mark.parametrize("regime_window", [20, 120])
+def test_vectorized_std_and_z_match_per_bar(ohlcv, regime_window):
+    """ 워밍업 구간(0)을 포함해 바마다 std/z-score가 바 단위 계산과 같음 """
+    class Recording(SmartScore):
+        def get_market_regime(self):
+            regime = super().get_market_regime()
+            self.recorded.append((self.std, self.z_score))
+            return regime
+
+        def init(self):
+            super().init()
+            self.recorded = []
+
+    run = lambda vectorized: Backtest(ohlcv, Recording).run(
+        log_enabled=False, vectorized=vectorized, regime_window=regime_window,
+    )._strategy.recorded
+    vectorized, per_bar = run(True), run(False)
+
+    assert len(vectorized) == len(per_bar) > 0
+    np.testing.assert_allclose(vectorized, per_bar, rtol=1e-9, atol=1e-12)
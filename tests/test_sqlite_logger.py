@@ -0,0 +1,91 @@
+import sqlite3
+
+import pytest
+
+from utils.looger_sqlite import SQLiteLogger
+
+
+def fetch_all(db_path, table, columns="*"):
+    with sqlite3.connect(db_path) as conn:
+        return conn.execute(f'SELECT {columns} FROM "{table}"').fetchall()
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / "logs.sqlite")
+
+
+def test_buffered_rows_flush_on_size_threshold(db_path):
+    logger = SQLiteLogger(db_path, buffer_size=3, flush_interval=3600)
+
+    logger.insert("score_log", {"date": "2024.01.01", "TOTAL": 1.0})
+    logger.insert("score_log", {"date": "2024.01.02", "TOTAL": 2.0})
+    assert len(logger._buffer) == 2
+
+    logger.insert("score_log", {"date": "2024.01.03", "TOTAL": 3.0})
+    assert logger._buffer == []
+    assert len(fetch_all(db_path, "score_log")) == 3
+    logger.close()
+
+
+def test_context_manager_flushes_and_keeps_order(db_path):
+    # 컬럼 구성이 다른 행이 섞여도 기록 순서 유지 + 누락 컬럼 자동 추가
+    with SQLiteLogger(db_path) as logger:
+        logger.insert("trading_log", {"date": "2024.01.01", "action": "Trailing Stop"})
+        logger.insert("trading_log", {"date": "2024.01.02", "action": "buy", "market_regime": "bull"})
+        logger.insert("trading_log", {"date": "2024.01.03", "action": "Take Profit", "market_regime": "bull"})
+
+    rows = fetch_all(db_path, "trading_log", "date, action, market_regime")
+    assert [tuple(r) for r in rows] == [
+        ("2024.01.01", "Trailing Stop", None),
+        ("2024.01.02", "buy", "bull"),
+        ("2024.01.03", "Take Profit", "bull"),
+    ]
+
+
+def test_unbuffered_commits_every_row(db_path):
+    logger = SQLiteLogger(db_path, buffered=False, synchronous="FULL")
+    logger.insert("trading_log", {"date": "2024.01.01", "action": "buy"})
+
+    assert len(fetch_all(db_path, "trading_log")) == 1
+    logger.close()
+
+
+def test_invalid_synchronous_mode(db_path):
+    with pytest.raises(ValueError):
+        SQLiteLogger(db_path, synchronous="FAST")
+
+
+def test_declared_schema_and_indexes(db_path):
+    with SQLiteLogger(db_path) as logger:
+        logger.insert("trading_log", {"run_id": "r1", "symbol": "AAPL", "date": "2024.01.01",
+                                      "action": "buy", "price": 101.5, "size": 3, "roi": None})
+
+    with sqlite3.connect(db_path) as conn:
+        types = {row[1]: row[2] for row in conn.execute('PRAGMA table_info("trading_log")')}
+        indexes = {row[1] for row in conn.execute('PRAGMA index_list("trading_log")')}
+        stored = conn.execute('SELECT typeof(price), typeof(size), typeof(roi) FROM trading_log').fetchone()
+
+    assert types["id"] == "INTEGER"
+    assert types["run_id"] == types["symbol"] == types["action"] == "TEXT"
+    assert types["price"] == types["roi"] == "REAL"
+    assert types["size"] == "INTEGER"
+    assert {"idx_trading_log_run_id_date", "idx_trading_log_symbol_date"} <= indexes
+    assert stored == ("real", "integer", "null")
+
+
+def test_legacy_text_table_is_migrated(db_path):
+    # 기존(모든 컬럼 TEXT) 테이블에는 누락된 선언 컬럼과 인덱스만 추가
+    with sqlite3.connect(db_path) as conn:
+        conn.execute('CREATE TABLE "score_log" ("date" TEXT, "TOTAL" TEXT)')
+        conn.execute('INSERT INTO "score_log" VALUES (\'2024.01.01\', \'1.0\')')
+
+    with SQLiteLogger(db_path) as logger:
+        logger.insert("score_log", {"run_id": "r1", "date": "2024.01.02", "TOTAL": 2.0})
+
+    with sqlite3.connect(db_path) as conn:
+        types = {row[1]: row[2] for row in conn.execute('PRAGMA table_info("score_log")')}
+        indexes = {row[1] for row in conn.execute('PRAGMA index_list("score_log")')}
+    assert types["run_id"] == "TEXT" and types["RSI"] == "REAL"
+    assert "idx_score_log_run_id_date" in indexes
+    assert fetch_all(db_path, "score_log", "date, run_id") == [("2024.01.01", None), ("2024.01.02", "r1")]
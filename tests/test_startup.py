@@ -0,0 +1,101 @@
+import json
+import os
+import re
+import subprocess
+import sys
+
+import pytest
+
+
+"""
+🚀 import(콜드 스타트) 테스트
+
+워커 프로세스가 전략을 import할 때
+- 파일 시스템에 아무것도 만들지 않는지 (결과 디렉토리, 로그 DB, .env 읽기 없음)
+- import 시간이 예산 안에 있는지 (-X importtime 측정)
+를 새 인터프리터에서 확인합니다.
+"""
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 저장소 모듈의 import 시간 합계 (self 시간 기준, 측정값 약 0.05초의 5배)
+OWN_IMPORT_BUDGET_SEC = 0.25
+# 전체 import 시간 (backtesting/bokeh, pandas, numba 포함, 측정값 약 1.8초의 여유 포함)
+TOTAL_IMPORT_BUDGET_SEC = 5.0
+
+OWN_PACKAGES = ("config", "indicators", "regime", "runner", "scoring", "strategies", "utils")
+
+MODULES = [
+    "strategies.smart_score",
+    "runner.backtest",
+    "runner.universe",
+    "runner.sweep",
+    "utils.result_store",
+    "utils.run_registry",
+    "utils.logger_xl",
+]
+
+
+def _run_python(code: str, cwd, *args) -> subprocess.CompletedProcess:
+    env = {**os.environ, "PYTHONPATH": ROOT, "PYTHONDONTWRITEBYTECODE": "1"}
+    return subprocess.run(
+        [sys.executable, *args, "-c", code], cwd=cwd, env=env, capture_output=True, text=True, check=True,
+    )
+
+
+def test_import_has_no_filesystem_side_effects(tmp_path):
+    # 감사 훅으로 import 중 발생한 디렉토리 생성 / DB 연결 / 쓰기 또는 작업 디렉토리 파일 열기를 수집
+    code = f"""
+import json, os, sys
+cwd = os.getcwd()
+events = []
+def hook(event, args):
+    if event in ("os.mkdir", "sqlite3.connect"):
+        events.append([event, str(args[0])])
+    elif event == "open" and isinstance(args[0], (str, bytes, os.PathLike)):
+        path = os.path.abspath(os.fsdecode(args[0]))
+        mode = args[1] or "r"
+        if path.startswith(cwd) or any(c in mode for c in "wax+"):
+            events.append([event, path])
+sys.addaudithook(hook)
+for name in {MODULES!r}:
+    __import__(name)
+from utils.log_writer import log_writer
+log_writer.close()
+print(json.dumps(events))
+"""
+    (tmp_path / ".env").write_text("SYMBOL=TEST\n", encoding="utf-8")
+    result = _run_python(code, tmp_path)
+
+    assert json.loads(result.stdout.strip().splitlines()[-1]) == []
+    assert sorted(os.listdir(tmp_path)) == [".env"]
+
+
+def test_config_is_resolved_on_first_use(tmp_path):
+    (tmp_path / ".env").write_text("SYMBOL=TEST\n", encoding="utf-8")
+    code = "from config.config import backtesting_config, PathConfig; print(backtesting_config.SYMBOL, PathConfig.RESULT_DIR)"
+    symbol, result_dir = _run_python(code, tmp_path).stdout.split()
+
+    from config.config import PathConfig
+    assert symbol == "TEST"
+    assert result_dir == os.path.join("results", f"result_{PathConfig.TODAY}")
+
+
+@pytest.mark.benchmark
+def test_import_time_budget(tmp_path):
+    stderr = _run_python("import strategies.smart_score", tmp_path, "-X", "importtime").stderr
+
+    total = own = 0
+    for line in stderr.splitlines():
+        m = re.match(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)", line)
+        if not m:
+            continue
+        self_us, cumulative_us, indent, name = int(m[1]), int(m[2]), m[3], m[4]
+        if len(indent) == 1:                    # 최상위 import
+            total += cumulative_us
+        if name.split(".")[0] in OWN_PACKAGES:
+            own += self_us
+
+    assert total > 0, stderr[-2000:]
+    assert own / 1e6 < OWN_IMPORT_BUDGET_SEC, f"저장소 모듈 import {own / 1e6:.3f}초"
+    assert total / 1e6 < TOTAL_IMPORT_BUDGET_SEC, f"전체 import {total / 1e6:.3f}초"
@@ -0,0 +1,94 @@
+import glob
+import os
+import sqlite3
+
+import pandas as pd
+import pytest
+from backtesting import Backtest
+
+from runner.sweep import grid_params, random_params, latin_hypercube_params, run_sweep
+from strategies.smart_score import SmartScore
+from utils.run_registry import RunRegistry
+
+
+@pytest.fixture
+def registry_path(tmp_path):
+    return str(tmp_path / "runs.sqlite")
+
+
+def test_grid_params():
+    params = grid_params({"buy_threshold": [1.0, 1.5], "regime_window": [10, 20, 30]})
+
+    assert len(params) == 6
+    assert {"buy_threshold": 1.5, "regime_window": 30} in params
+
+
+def test_random_params_types():
+    params = random_params({"regime_window": (10, 30), "buy_threshold": (1.0, 2.0), "n1": [10, 12]}, n=50, seed=0)
+
+    assert all(isinstance(p["regime_window"], int) and 10 <= p["regime_window"] <= 30 for p in params)
+    assert all(1.0 <= p["buy_threshold"] < 2.0 for p in params)
+    assert {p["n1"] for p in params} == {10, 12}
+
+
+def test_latin_hypercube_covers_every_stratum():
+    n = 20
+    params = latin_hypercube_params({"buy_threshold": (0.0, 2.0), "regime_window": (1, 20)}, n=n, seed=0)
+
+    strata = sorted(int(p["buy_threshold"] / 2.0 * n) for p in params)
+    assert strata == list(range(n))
+    assert sorted(p["regime_window"] for p in params) == list(range(1, 21))
+
+
+def test_run_sweep_matches_single_backtest(ohlcv, registry_path):
+    params = grid_params({"buy_threshold": [1.0, 2.0], "trailing_stop_drawdown": [0.05, 0.1]})
+    results = run_sweep(ohlcv, params, metric="Return [%]", max_workers=2, registry_path=registry_path)
+
+    assert len(results) == 4
+    assert results["error"].isna().all()
+    assert results["Return [%]"].is_monotonic_decreasing
+    assert list(results["rank"]) == [1, 2, 3, 4]
+
+    best = results.iloc[0]
+    expected = Backtest(ohlcv, SmartScore, cash=10000, commission=.002).run(
+        log_enabled=False,
+        buy_threshold=best["buy_threshold"],
+        trailing_stop_drawdown=best["trailing_stop_drawdown"],
+    )
+    assert best["Return [%]"] == pytest.approx(expected["Return [%]"])
+
+
+def test_run_sweep_isolates_failures(ohlcv, registry_path):
+    results = run_sweep(ohlcv, [{"buy_threshold": 1.5}, {"no_such_param": 1}], max_workers=1, registry_path=registry_path)
+
+    assert results["error"].notna().sum() == 1
+    failed = results.loc[results["error"].notna(), "run_id"].item()
+    assert RunRegistry(registry_path).get(failed)["status"] == "failed"
+
+
+def test_sweep_rows_are_queryable_by_run_id(ohlcv, tmp_path, registry_path):
+    params = grid_params({"buy_threshold": [1.0, 2.0], "trailing_stop_drawdown": [0.05, 0.1]})
+    log_dir = str(tmp_path / "logs")
+    results = run_sweep(ohlcv, params, max_workers=2, log_dir=log_dir, symbol="AAA", registry_path=registry_path)
+
+    assert results["run_id"].notna().all() and results["run_id"].is_unique
+
+    # 실행 레지스트리: 조합마다 한 행 (파라미터/상태)
+    registry = RunRegistry(registry_path)
+    runs = registry.runs(symbol="AAA")
+    assert sorted(runs["run_id"]) == sorted(results["run_id"])
+    assert (runs["status"] == "ok").all()
+    for _, row in results.iterrows():
+        run = registry.get(row["run_id"])
+        assert run["params"]["buy_threshold"] == row["buy_threshold"]
+        assert run["params"]["trailing_stop_drawdown"] == row["trailing_stop_drawdown"]
+
+    # 워커별 로그 DB의 레코드도 run_id/symbol로 구분
+    logged = []
+    for path in glob.glob(os.path.join(log_dir, "sweep_*.sqlite")):
+        with sqlite3.connect(path) as conn:
+            logged.append(pd.read_sql("SELECT run_id, symbol, COUNT(*) AS n FROM score_log GROUP BY run_id, symbol", conn))
+    logged = pd.concat(logged)
+    assert sorted(logged["run_id"]) == sorted(results["run_id"])
+    assert (logged["symbol"] == "AAA").all()
+    assert (logged["n"] > 0).all()
@@ -0,0 +1,68 @@
+import os
+
+import pandas as pd
+
+from runner.universe import SUMMARY_COLUMNS, load_universe, run_universe
+from tests.conftest import make_ohlcv
+from utils.data_loader import LocalFileProvider, OHLCVCache
+
+
+def test_load_universe_from_file(tmp_path):
+    path = tmp_path / "universe.txt"
+    path.write_text("aapl\nMSFT  # 주석\n\nAAPL\n", encoding="utf-8")
+
+    assert load_universe(str(path)) == ["AAPL", "MSFT"]
+    assert load_universe(symbols="ORCL, nvda") == ["ORCL", "NVDA"]
+
+
+def test_run_universe_isolates_symbols_and_failures(tmp_path):
+    data_dir = tmp_path / "data"
+    data_dir.mkdir()
+    for seed, symbol in enumerate(["AAA", "BBB"]):
+        make_ohlcv(n=600, seed=seed, start="2019-01-01").to_csv(data_dir / f"{symbol}.csv")
+
+    cache = OHLCVCache(str(tmp_path / "cache"), provider=LocalFileProvider(str(data_dir)))
+    out_dir = str(tmp_path / "out")
+    progress = []
+
+    summary = run_universe(
+        ["AAA", "MISSING", "BBB"],
+        start="2019-06-01", end="2021-06-01", fetch_start="2019-01-01",
+        cash=10000, commission=.002, max_workers=2, out_dir=out_dir, cache=cache,
+        store_dir=str(tmp_path / "store"), registry_path=str(tmp_path / "runs.sqlite"),
+        progress=lambda done, total, row: progress.append((done, total, row["symbol"])),
+    )
+
+    assert list(summary["symbol"]) == ["AAA", "MISSING", "BBB"]
+    assert list(summary["status"]) == ["ok", "failed", "ok"]
+    assert sorted(done for done, _, _ in progress) == [1, 2, 3]
+
+    # 종목별 출력 분리 + 요약 파일
+    for symbol in ["AAA", "BBB"]:
+        assert os.path.exists(os.path.join(out_dir, symbol, "strategy_logs.sqlite"))
+    assert not os.path.exists(os.path.join(out_dir, "MISSING"))
+    stored = pd.read_parquet(os.path.join(out_dir, "summary.parquet"))
+    assert list(stored["symbol"]) == list(summary["symbol"])
+    assert stored["Return [%]"].equals(summary["Return [%]"])
+
+    # 종목별 로그/stats는 Parquet 결과 저장소에 누적
+    from utils.result_store import ParquetResultStore
+    store = ParquetResultStore(str(tmp_path / "store"))
+    assert sorted(store.query("stats", columns=["symbol"])["symbol"]) == ["AAA", "BBB"]
+
+    # 종목별 실행은 공유 레지스트리에 run_id로 기록
+    from utils.run_registry import RunRegistry
+    runs = RunRegistry(str(tmp_path / "runs.sqlite")).runs(status="ok")
+    assert sorted(runs["symbol"]) == ["AAA", "BBB"]
+    assert set(runs["run_id"]) == set(summary["run_id"].dropna())
+
+
+def test_run_universe_with_no_symbols(tmp_path):
+    out_dir = str(tmp_path / "out")
+    summary = run_universe(
+        [], out_dir=out_dir, cache=OHLCVCache(str(tmp_path / "cache"), provider=LocalFileProvider(str(tmp_path))),
+        store_dir=str(tmp_path / "store"), registry_path=str(tmp_path / "runs.sqlite"), progress=None,
+    )
+
+    assert summary.empty and list(summary.columns) == SUMMARY_COLUMNS
+    assert list(pd.read_parquet(os.path.join(out_dir, "summary.parquet")).columns) == SUMMARY_COLUMNS
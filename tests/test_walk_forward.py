@@ -0,0 +1,127 @@
+import numpy as np
+import pandas as pd
+import pytest
+from backtesting import Backtest
+
+import runner.walk_forward as walk_forward
+from runner.sweep import grid_params
+from runner.walk_forward import precompute_indicators, run_walk_forward, walk_forward_windows
+from strategies.smart_score import SmartScore
+from tests.conftest import make_ohlcv
+from utils.run_registry import RunRegistry
+from utils.stats import stats_to_row
+
+
+@pytest.fixture
+def data():
+    return make_ohlcv(n=900)
+
+
+@pytest.fixture
+def registry_path(tmp_path):
+    return str(tmp_path / "runs.sqlite")
+
+
+def test_rolling_and_anchored_windows():
+    assert walk_forward_windows(100, 10, 40, 20) == [(10, 50, 50, 70), (30, 70, 70, 90), (50, 90, 90, 100)]
+    assert walk_forward_windows(100, 10, 40, 30, anchored=True) == [(10, 50, 50, 80), (10, 80, 80, 100)]
+    assert walk_forward_windows(100, 10, 40, 20, step_bars=40) == [(10, 50, 50, 70), (50, 90, 90, 100)]
+    assert walk_forward_windows(50, 10, 40, 20) == []
+
+
+@pytest.mark.parametrize("params", [{}, {"regime_source": "evaluator"}, {"vectorized": False}])
+def test_precomputed_run_matches_regular_run(data, params):
+    expected = Backtest(data, SmartScore).run(log_enabled=False, **params)
+    precomputed = precompute_indicators(data, SmartScore, params)
+    result = Backtest(data, SmartScore).run(log_enabled=False, precomputed=precomputed, **params)
+
+    pd.testing.assert_series_equal(pd.Series(stats_to_row(result)), pd.Series(stats_to_row(expected)))
+
+
+def test_window_slices_start_after_warmup(data):
+    """ 전체 히스토리로 계산한 배열을 자르면 구간 첫 바부터 지표가 유효 (구간 내 워밍업 없음) """
+    lo, hi = 300, 500
+    precomputed = precompute_indicators(data, SmartScore)
+    window = data.iloc[lo:hi]
+
+    sliced = Backtest(window, SmartScore).run(
+        log_enabled=False, profile=True, precomputed={k: v[lo:hi] for k, v in precomputed.items()},
+    )
+    recomputed = Backtest(window, SmartScore).run(log_enabled=False, profile=True)
+
+    calls = lambda stats: stats._strategy.profiler.summary().set_index("phase").loc["next", "calls"]
+    assert calls(sliced) == hi - lo - 1
+    assert calls(recomputed) < calls(sliced)
+
+
+def test_precompute_once_per_indicator_params(data, monkeypatch, registry_path):
+    calls = []
+
+    def counting(*args):
+        calls.append(args[2])
+        return precompute_indicators(*args)
+
+    monkeypatch.setattr(walk_forward, "precompute_indicators", counting)
+    params = grid_params({"buy_threshold": [1.0, 2.0], "n1": [10, 12]})
+    result = run_walk_forward(
+        data, params, train_bars=300, test_bars=150, backtest_start=data.index[200], max_workers=2,
+        registry_path=registry_path,
+    )
+
+    assert len(calls) == 2
+    assert sorted(c["n1"] for c in calls) == [10, 12]
+    assert result.trials["error"].isna().all()
+
+
+def test_run_walk_forward(data, registry_path):
+    params = grid_params({"buy_threshold": [1.0, 1.5], "trailing_stop_drawdown": [0.05, 0.1]})
+    result = run_walk_forward(
+        data, params, train_bars=250, test_bars=150, backtest_start=data.index[200], metric="Return [%]", max_workers=2,
+        registry_path=registry_path,
+    )
+    windows = result.windows
+
+    assert len(windows) == 3
+    assert len(result.trials) == len(windows) * len(params)
+    assert windows["error"].isna().all()
+    assert (windows["oos_start"].iloc[1:].to_numpy() > windows["oos_end"].iloc[:-1].to_numpy()).all()
+
+    # 구간별 최적 파라미터는 IS에서 Return이 가장 높은 조합
+    for _, row in windows.iterrows():
+        trials = result.trials[result.trials["window"] == row["window"]]
+        assert row["is_Return [%]"] == trials["Return [%]"].max()
+        assert {"buy_threshold": row["buy_threshold"], "trailing_stop_drawdown": row["trailing_stop_drawdown"]} in params
+
+    # OOS 자산 곡선은 초기 자본에서 시작하여 구간별 수익률을 누적
+    equity = result.equity
+    assert equity.index.is_monotonic_increasing
+    assert equity.iloc[0] == pytest.approx(10000)
+    expected_final = 10000 * np.prod(1 + windows["oos_return"].to_numpy() / 100)
+    assert result.summary()["Equity Final [$]"] == pytest.approx(expected_final)
+
+
+def test_runs_are_registered_by_run_id(data, registry_path):
+    params = grid_params({"buy_threshold": [1.0, 1.5]})
+    result = run_walk_forward(
+        data, params, train_bars=300, test_bars=150, backtest_start=data.index[200], max_workers=2,
+        symbol="AAA", registry_path=registry_path,
+    )
+    registry = RunRegistry(registry_path)
+    runs = registry.runs(symbol="AAA")
+
+    # IS 실행 전부 + 구간별 OOS 실행
+    run_ids = list(result.trials["run_id"]) + list(result.windows["oos_run_id"])
+    assert sorted(runs["run_id"]) == sorted(run_ids)
+    assert (runs["status"] == "ok").all()
+
+    # OOS 실행은 구간 데이터와 선택된 파라미터로 기록 (사전 계산 배열은 지문으로)
+    window = result.windows.iloc[0]
+    oos = registry.get(window["oos_run_id"])
+    assert oos["params"]["buy_threshold"] == window["buy_threshold"]
+    assert oos["data_start"] == window["oos_start"].isoformat()
+    assert all(v.startswith("fingerprint:") for v in oos["params"]["precomputed"].values())
+
+
+def test_not_enough_bars(data):
+    with pytest.raises(ValueError):
+        run_walk_forward(data, [{}], train_bars=900, test_bars=10, max_workers=1)
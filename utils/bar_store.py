@@ -0,0 +1,231 @@
+import json
+import os
+import shutil
+from typing import Dict, Iterable, List, Mapping, Optional
+
+import numpy as np
+import pandas as pd
+
+from config.config import PathConfig
+from utils.data_loader import REQUIRED_COLUMNS, OHLCVCache, get_default_cache
+
+
+"""
+🗃️ bar_store
+
+유니버스 전 종목의 OHLCV를 공통 거래 캘린더에 맞춘 (시간 × 종목 × 필드) 행렬로 저장하는 메모리 맵 저장소입니다.
+
+디렉토리 구성:
+- meta.json      → 종목 목록(컬럼 순서), 필드, dtype, shape, interval
+- calendar.npy   → 공통 캘린더 (int64, UTC ns)
+- {field}.npy    → 필드별 (시간 × 종목) 행렬, Fortran 순서 (종목 하나의 시계열이 파일에서 연속)
+
+읽기(BarStore)는 np.load(mmap_mode="r")로 파일을 매핑만 하므로 여는 비용은 헤더/메타데이터 읽기뿐이고,
+실제로 접근한 페이지만 메모리에 올라옵니다. (OS 페이지 캐시를 모든 워커 프로세스가 공유)
+BarStore 객체는 경로만 pickle되므로 ProcessPoolExecutor 워커에 그대로 넘길 수 있습니다.
+
+캘린더는 모든 종목 거래일의 합집합이며, 종목에 바가 없는 날(상장 이전, 거래 정지 등)은 NaN입니다.
+"""
+
+META_FILE = "meta.json"
+CALENDAR_FILE = "calendar.npy"
+STORE_VERSION = 1
+
+
+def _field_file(field: str) -> str:
+    return f"{field}.npy"
+
+
+def _calendar_values(index: pd.DatetimeIndex) -> np.ndarray:
+    """ DatetimeIndex -> UTC 기준 int64(ns) """
+    if index.tz is not None:
+        index = index.tz_convert("UTC").tz_localize(None)
+    return index.as_unit("ns").asi8
+
+
+def build_bar_store(
+    path: str,
+    data: Mapping[str, pd.DataFrame],
+    fields: Iterable[str] = REQUIRED_COLUMNS,
+    dtype=np.float64,
+    interval: str = "1d",
+) -> "BarStore":
+    """
+    종목별 OHLCV({symbol: DataFrame})를 공통 캘린더의 메모리 맵 저장소로 기록합니다.
+    - 임시 디렉토리에 모두 쓴 뒤 교체하므로, 기존 저장소를 열어 둔 프로세스는 이전 파일을 계속 읽습니다.
+    - 빈 DataFrame인 종목은 제외합니다.
+    :param dtype: 저장 dtype (float64 또는 float32, float32는 디스크/페이지 캐시 사용량 절반)
+    """
+    dtype = np.dtype(dtype)
+    if dtype not in (np.dtype(np.float64), np.dtype(np.float32)):
+        raise ValueError(f"dtype은 float64 또는 float32여야 합니다: {dtype}")
+
+    fields = list(fields)
+    frames = {symbol: df for symbol, df in data.items() if df is not None and not df.empty}
+    symbols = list(frames)
+
+    calendar = pd.DatetimeIndex([])
+    for i, df in enumerate(frames.values()):
+        index = pd.DatetimeIndex(df.index)
+        calendar = index if i == 0 else calendar.union(index)
+    calendar = calendar.sort_values()
+    tz = str(calendar.tz) if calendar.tz is not None else None
+    positions = [calendar.get_indexer(frames[symbol].index) for symbol in symbols]
+
+    tmp_path = f"{path.rstrip(os.sep)}.{os.getpid()}.tmp"
+    shutil.rmtree(tmp_path, ignore_errors=True)
+    os.makedirs(tmp_path)
+
+    np.save(os.path.join(tmp_path, CALENDAR_FILE), _calendar_values(calendar))
+    shape = (len(calendar), len(symbols))
+    for field in fields:
+        matrix = np.lib.format.open_memmap(
+            os.path.join(tmp_path, _field_file(field)), mode="w+", dtype=dtype, shape=shape, fortran_order=True,
+        )
+        matrix[:] = np.nan
+        for j, symbol in enumerate(symbols):
+            matrix[positions[j], j] = frames[symbol][field].to_numpy(dtype=np.float64)
+        matrix.flush()
+        del matrix
+
+    meta = {
+        "version": STORE_VERSION,
+        "symbols": symbols,
+        "fields": fields,
+        "dtype": dtype.name,
+        "shape": list(shape),
+        "interval": interval,
+        "tz": tz,
+    }
+    with open(os.path.join(tmp_path, META_FILE), "w", encoding="utf-8") as f:
+        json.dump(meta, f, ensure_ascii=False)
+
+    # 기존 저장소 교체 (디렉토리는 덮어쓸 수 없으므로 이전 디렉토리를 치운 뒤 이름 변경)
+    if os.path.exists(path):
+        old_path = f"{tmp_path}.old"
+        os.replace(path, old_path)
+        os.replace(tmp_path, path)
+        shutil.rmtree(old_path, ignore_errors=True)
+    else:
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        os.replace(tmp_path, path)
+
+    return BarStore(path)
+
+
+def build_bar_store_from_cache(
+    path: Optional[str],
+    symbols: Iterable[str],
+    start: str,
+    end: str,
+    interval: str = "1d",
+    cache: Optional[OHLCVCache] = None,
+    **kwargs,
+) -> "BarStore":
+    """
+    OHLCV 캐시(get_many)로 종목들의 [start, end) 구간을 받아 저장소를 만듭니다.
+    다운로드에 실패했거나 데이터가 없는 종목은 제외합니다.
+    """
+    cache = cache or get_default_cache()
+    loaded = cache.get_many(list(symbols), start, end, interval, return_exceptions=True)
+    data = {symbol: df for symbol, df in loaded.items() if isinstance(df, pd.DataFrame)}
+    return build_bar_store(path or PathConfig.BAR_STORE_DIR, data, interval=interval, **kwargs)
+
+
+class BarStore:
+    """
+    메모리 맵 저장소 읽기 (read-only)
+
+    - store["Close"] / store.field("Close"): (시간 × 종목) 행렬 (복사 없는 memmap)
+    - store.column("Close", "AAPL"): 종목 하나의 시계열 (연속 메모리 뷰)
+    - store.frame("AAPL", start, end): 종목 하나의 OHLCV DataFrame (Backtest 입력용, 해당 구간만 복사)
+    - store.panel("Close", symbols, start, end): wide DataFrame (컬럼 = 종목, panel 지표 입력용)
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or PathConfig.BAR_STORE_DIR
+        with open(os.path.join(self.path, META_FILE), "r", encoding="utf-8") as f:
+            meta = json.load(f)
+        if meta.get("version") != STORE_VERSION:
+            raise ValueError(f"지원하지 않는 저장소 버전입니다: {meta.get('version')}")
+
+        self.symbols: List[str] = meta["symbols"]
+        self.fields: List[str] = meta["fields"]
+        self.dtype = np.dtype(meta["dtype"])
+        self.shape = tuple(meta["shape"])
+        self.interval: str = meta["interval"]
+        self.symbol_index: Dict[str, int] = {symbol: j for j, symbol in enumerate(self.symbols)}
+
+        calendar = np.load(os.path.join(self.path, CALENDAR_FILE), mmap_mode="r")
+        index = pd.DatetimeIndex(np.asarray(calendar).view("M8[ns]"), name="Date")
+        self.calendar = index.tz_localize("UTC").tz_convert(meta["tz"]) if meta["tz"] else index
+        self._fields: Dict[str, np.memmap] = {}
+
+
+    def __reduce__(self):
+        # 워커 프로세스에는 경로만 전달하고 워커에서 다시 매핑
+        return (BarStore, (self.path,))
+
+
+    def __len__(self):
+        return self.shape[0]
+
+
+    def __contains__(self, symbol):
+        return symbol in self.symbol_index
+
+
+    def __getitem__(self, field: str) -> np.ndarray:
+        return self.field(field)
+
+
+    def field(self, field: str) -> np.ndarray:
+        """ (시간 × 종목) 행렬 (첫 접근 시 매핑) """
+        if field not in self._fields:
+            if field not in self.fields:
+                raise KeyError(f"저장소에 없는 필드입니다: {field}")
+            self._fields[field] = np.load(os.path.join(self.path, _field_file(field)), mmap_mode="r")
+        return self._fields[field]
+
+
+    def column(self, field: str, symbol: str) -> np.ndarray:
+        """ 종목 하나의 시계열 (전체 캘린더 길이) """
+        return self.field(field)[:, self._symbol(symbol)]
+
+
+    def rows(self, start=None, end=None) -> slice:
+        """ 캘린더에서 [start, end) 구간의 행 범위 """
+        lo = 0 if start is None else self.calendar.searchsorted(pd.Timestamp(start), side="left")
+        hi = len(self.calendar) if end is None else self.calendar.searchsorted(pd.Timestamp(end), side="left")
+        return slice(int(lo), int(hi))
+
+
+    def frame(self, symbol: str, start=None, end=None, dropna: bool = True) -> pd.DataFrame:
+        """
+        종목 하나의 [start, end) 구간 OHLCV (float64 DataFrame)
+        - dropna=True이면 해당 종목에 바가 없는 날은 제외 (get_stock_data 결과와 같은 형태)
+        """
+        j, rows = self._symbol(symbol), self.rows(start, end)
+        data = pd.DataFrame(
+            {field: self.field(field)[rows, j] for field in self.fields},
+            index=self.calendar[rows], dtype=np.float64,
+        )
+        return data.dropna() if dropna else data
+
+
+    def panel(self, field: str, symbols: Optional[Iterable[str]] = None, start=None, end=None) -> pd.DataFrame:
+        """ (시간 × 종목) wide DataFrame (종목을 지정하지 않으면 전체, 가능하면 복사 없이) """
+        rows = self.rows(start, end)
+        if symbols is None:
+            values, columns = self.field(field)[rows], self.symbols
+        else:
+            columns = list(symbols)
+            values = self.field(field)[rows][:, [self._symbol(s) for s in columns]]
+        return pd.DataFrame(values, index=self.calendar[rows], columns=columns, copy=False)
+
+
+    def _symbol(self, symbol: str) -> int:
+        try:
+            return self.symbol_index[symbol]
+        except KeyError:
+            raise KeyError(f"저장소에 없는 종목입니다: {symbol}") from None
@@ -1,28 +1,341 @@
+import json
+import os
+import threading
+from dataclasses import dataclass, field
+from typing import Optional
+
 import pandas as pd
-import yfinance as yf
 
-def get_stock_data(symbol: str, start: str, end: str) -> pd.DataFrame:
+from config.config import PathConfig
+
+
+REQUIRED_COLUMNS = ["Open", "High", "Low", "Close", "Volume"]
+
+
+def normalize_ohlcv(data: pd.DataFrame) -> pd.DataFrame:
     """
-    yfinance 데이터를 다운로드하고 Backtesting.py에 맞게 변환합니다.
+    원본 데이터를 Backtesting.py에 맞는 OHLCV 형태로 변환합니다.
     """
-    data = yf.download(symbol, start=start, end=end, interval="1d", threads=False, progress=False)
-
     if isinstance(data.columns, pd.MultiIndex):
         data.columns = data.columns.get_level_values(0)
 
-    data.rename(columns={
-        "Open": "Open",
-        "High": "High",
-        "Low": "Low",
-        "Close": "Close",
-        "Volume": "Volume"
-    }, inplace=True)
-
-    required_columns = ["Open", "High", "Low", "Close", "Volume"]
-    data = data[required_columns]
+    # 다운로드 실패 등으로 빈 응답이면 컬럼만 갖춘 빈 DataFrame 반환
+    if data.empty and not set(REQUIRED_COLUMNS).issubset(data.columns):
+        return pd.DataFrame(columns=REQUIRED_COLUMNS, index=pd.DatetimeIndex([], name="Date"), dtype=float)
 
+    data = data[REQUIRED_COLUMNS].copy()
     data.index = pd.to_datetime(data.index)
-    
+    data.index.name = "Date"
+
     data.dropna(inplace=True)
-    
+
     return data
+
+
+def read_ohlcv_file(path: str) -> pd.DataFrame:
+    """
+    parquet/csv 파일 하나를 읽어 정규화된 OHLCV로 반환합니다. (csv는 첫 컬럼을 날짜 인덱스로 사용)
+    """
+    if path.endswith(".parquet"):
+        data = pd.read_parquet(path)
+    elif path.endswith(".csv"):
+        data = pd.read_csv(path, index_col=0, parse_dates=True)
+    else:
+        raise ValueError(f"지원하지 않는 파일 형식입니다 (parquet/csv): {path}")
+    return normalize_ohlcv(data)
+
+
+class DataProvider:
+    """
+    OHLCV 데이터 공급자 인터페이스
+    - fetch(symbol, start, end, interval) -> 정규화된 OHLCV DataFrame
+    - end는 yfinance와 동일하게 미포함(exclusive)
+    """
+
+    def fetch(self, symbol: str, start: str, end: str, interval: str = "1d") -> pd.DataFrame:
+        raise NotImplementedError
+
+    def fetch_many(self, symbols, start: str, end: str, interval: str = "1d") -> dict:
+        """
+        여러 종목을 한 번에 가져옵니다. {symbol: DataFrame}
+        기본 구현은 종목별 fetch 반복이며, 일괄 다운로드를 지원하는 공급자는 재정의합니다.
+        """
+        result = {}
+        for symbol in symbols:
+            try:
+                result[symbol] = self.fetch(symbol, start, end, interval)
+            except Exception:
+                continue    # 실패한 종목은 제외 (호출 측에서 종목별로 다시 처리)
+        return result
+
+
+class YFinanceProvider(DataProvider):
+    """ yfinance 다운로드 기반 공급자 """
+
+    def fetch(self, symbol: str, start: str, end: str, interval: str = "1d") -> pd.DataFrame:
+        """
+        종목 하나 다운로드 (yf.download가 내부에서 호출하는 Ticker.history를 직접 사용)
+        yf.download는 모듈 전역 상태를 공유하므로 여러 스레드에서 동시에 호출할 수 없음 (utils.prefetch)
+        """
+        import yfinance as yf
+
+        data = yf.Ticker(symbol).history(start=start, end=end, interval=interval, auto_adjust=True, actions=False)
+        # yf.download와 동일하게 일봉 이상은 타임존 제거
+        if interval[-1] not in ("m", "h") and getattr(data.index, "tz", None) is not None:
+            data.index = data.index.tz_localize(None)
+        return normalize_ohlcv(data)
+
+    def fetch_many(self, symbols, start: str, end: str, interval: str = "1d") -> dict:
+        """ yf.download 한 번으로 여러 종목을 일괄 다운로드 """
+        import yfinance as yf
+
+        symbols = list(symbols)
+        data = yf.download(symbols, start=start, end=end, interval=interval, group_by="ticker", threads=True, progress=False)
+
+        result = {}
+        for symbol in symbols:
+            if isinstance(data.columns, pd.MultiIndex) and symbol in data.columns.get_level_values(0):
+                result[symbol] = normalize_ohlcv(data[symbol].copy())
+            else:
+                result[symbol] = normalize_ohlcv(pd.DataFrame())
+        return result
+
+
+class LocalFileProvider(DataProvider):
+    """
+    로컬 파일 기반 공급자 (테스트/오프라인용)
+    - {root}/{symbol}.parquet 또는 {root}/{symbol}.csv 파일에서 기간을 잘라 반환
+    """
+
+    def __init__(self, root: str):
+        self.root = root
+
+    def fetch(self, symbol: str, start: str, end: str, interval: str = "1d") -> pd.DataFrame:
+        parquet_path = os.path.join(self.root, f"{symbol}.parquet")
+        csv_path = os.path.join(self.root, f"{symbol}.csv")
+
+        if os.path.exists(parquet_path):
+            data = read_ohlcv_file(parquet_path)
+        elif os.path.exists(csv_path):
+            data = read_ohlcv_file(csv_path)
+        else:
+            raise FileNotFoundError(f"{symbol} 데이터 파일이 없습니다: {self.root}")
+
+        return data[(data.index >= pd.Timestamp(start)) & (data.index < pd.Timestamp(end))]
+
+
+def _confirmed_end(data: pd.DataFrame, fetch_end: pd.Timestamp) -> pd.Timestamp:
+    """
+    [?, fetch_end) 요청의 (비어 있지 않은) 응답으로 보유가 확인된 구간의 끝 (fetch_end는 오늘 날짜로 제한된 요청 끝)
+    - 실제로 받은 마지막 바 다음 날까지만 확인 (남은 구간은 다음 요청 때 다시 조회)
+    """
+    return min(fetch_end, (data.index[-1] + pd.Timedelta(days=1)).normalize())
+
+
+@dataclass
+class CacheStats:
+    """ 캐시 적중/미스 통계 (utils.prefetch 등 여러 스레드에서 get()을 호출하므로 add()로 잠금 후 갱신) """
+    hits: int = 0               # 캐시만으로 응답
+    partial_hits: int = 0       # 캐시 + 누락 구간만 추가 다운로드
+    misses: int = 0             # 전체 구간 다운로드
+    fetches: int = 0            # 공급자 호출 횟수
+    fetched_rows: int = 0       # 공급자로부터 받은 행 수
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False, compare=False)
+
+    def add(self, **counts):
+        """ 항목별 증가분을 한 번에 반영 (예: add(fetches=1, fetched_rows=250)) """
+        with self._lock:
+            for name, n in counts.items():
+                setattr(self, name, getattr(self, name) + n)
+
+    @property
+    def requests(self) -> int:
+        return self.hits + self.partial_hits + self.misses
+
+    @property
+    def hit_rate(self) -> float:
+        return self.hits / self.requests if self.requests else 0.0
+
+    def __str__(self):
+        return (
+            f"📦 cache requests: {self.requests} | hit: {self.hits} | partial: {self.partial_hits} | "
+            f"miss: {self.misses} | fetches: {self.fetches} ({self.fetched_rows} rows) | "
+            f"hit rate: {self.hit_rate:.1%}"
+        )
+
+
+class OHLCVCache:
+    """
+    (symbol, interval, 기간) 단위 OHLCV 디스크 캐시
+    - 종목/주기별로 하나의 Parquet(또는 Feather) 파일과 보유 기간 메타데이터(json)를 저장
+    - 요청 기간이 보유 기간을 벗어나면 누락된 앞/뒤 구간만 공급자에서 받아 병합 (incremental top-up)
+    - 보유 기간의 끝은 오늘 날짜를 넘지 않도록 기록 (미래 구간은 다음 요청 때 다시 조회)
+    - 보유 기간은 실제로 받은 마지막 바까지만 기록 (_confirmed_end)
+      빈 응답은 일시적 실패/요청 제한일 수 있으므로(yfinance는 예외 대신 빈 DataFrame 반환) 보유 기간을 늘리지 않음
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None, provider: Optional[DataProvider] = None, fmt: str = "parquet"):
+        if fmt not in ("parquet", "feather"):
+            raise ValueError(f"지원하지 않는 캐시 포맷: {fmt}")
+
+        self.cache_dir = cache_dir or PathConfig.CACHE_DIR
+        self.provider = provider or YFinanceProvider()
+        self.fmt = fmt
+        self.stats = CacheStats()
+
+
+    def _paths(self, symbol: str, interval: str):
+        base = os.path.join(self.cache_dir, interval, symbol)
+        return f"{base}.{self.fmt}", f"{base}.json"
+
+
+    def _exists(self, symbol: str, interval: str) -> bool:
+        """ 데이터/메타 파일이 모두 있는지 확인 (파일은 읽지 않음) """
+        return all(os.path.exists(path) for path in self._paths(symbol, interval))
+
+
+    def _read(self, symbol: str, interval: str):
+        """ 캐시된 데이터와 보유 기간(start, end)을 반환. 없으면 (None, None) """
+        if not self._exists(symbol, interval):
+            return None, None
+
+        data_path, meta_path = self._paths(symbol, interval)
+
+        with open(meta_path, "r", encoding="utf-8") as f:
+            meta = json.load(f)
+
+        data = pd.read_parquet(data_path) if self.fmt == "parquet" else pd.read_feather(data_path).set_index("Date")
+        return data, (pd.Timestamp(meta["start"]), pd.Timestamp(meta["end"]))
+
+
+    def _write(self, symbol: str, interval: str, data: pd.DataFrame, start: pd.Timestamp, end: pd.Timestamp):
+        """ 임시 파일에 쓴 뒤 교체하여 동시 실행 시에도 깨진 파일이 남지 않도록 저장 """
+        data_path, meta_path = self._paths(symbol, interval)
+        os.makedirs(os.path.dirname(data_path), exist_ok=True)
+
+        tmp_data_path = f"{data_path}.{os.getpid()}.tmp"
+        if self.fmt == "parquet":
+            data.to_parquet(tmp_data_path)
+        else:
+            data.reset_index().to_feather(tmp_data_path)
+        os.replace(tmp_data_path, data_path)
+
+        tmp_meta_path = f"{meta_path}.{os.getpid()}.tmp"
+        with open(tmp_meta_path, "w", encoding="utf-8") as f:
+            json.dump({"symbol": symbol, "interval": interval, "start": start.isoformat(), "end": end.isoformat()}, f)
+        os.replace(tmp_meta_path, meta_path)
+
+
+    def _fetch(self, symbol: str, start: pd.Timestamp, end: pd.Timestamp, interval: str) -> pd.DataFrame:
+        data = normalize_ohlcv(self.provider.fetch(symbol, start.strftime("%Y-%m-%d"), end.strftime("%Y-%m-%d"), interval))
+        self.stats.add(fetches=1, fetched_rows=len(data))
+        return data
+
+
+    def get(self, symbol: str, start: str, end: str, interval: str = "1d") -> pd.DataFrame:
+        """
+        [start, end) 구간의 OHLCV를 반환합니다. 캐시에 없는 구간만 공급자에서 가져옵니다.
+        """
+        start, end = pd.Timestamp(start), pd.Timestamp(end)
+        # 아직 오지 않은 구간은 보유 기간으로 기록하지 않음
+        covered_end = min(end, pd.Timestamp.today().normalize())
+
+        cached, covered = self._read(symbol, interval)
+
+        if cached is None:
+            self.stats.add(misses=1)
+            data = self._fetch(symbol, start, end, interval)
+            # 빈 응답(다운로드 실패 등)은 캐시에 남기지 않음
+            if not data.empty:
+                self._write(symbol, interval, data, start, _confirmed_end(data, covered_end))
+
+        elif covered[0] <= start and end <= covered[1]:
+            self.stats.add(hits=1)
+            data = cached
+
+        else:
+            self.stats.add(partial_hits=1)
+            parts = [cached]
+            new_start, new_end = covered
+
+            # 보유 기간과 이어지도록 누락된 앞/뒤 구간만 다운로드
+            if start < covered[0]:
+                head = self._fetch(symbol, start, covered[0], interval)
+                if not head.empty:
+                    parts.append(head)
+                    new_start = start
+            if end > covered[1]:
+                tail = self._fetch(symbol, covered[1], end, interval)
+                if not tail.empty:
+                    parts.append(tail)
+                    new_end = max(covered[1], _confirmed_end(tail, covered_end))
+
+            data = pd.concat(parts)
+            data = data[~data.index.duplicated(keep="last")].sort_index()
+
+            if (new_start, new_end) != covered:
+                self._write(symbol, interval, data, new_start, new_end)
+
+        return data[(data.index >= start) & (data.index < end)]
+
+
+    def get_many(self, symbols, start: str, end: str, interval: str = "1d", return_exceptions: bool = False) -> dict:
+        """
+        여러 종목의 [start, end) 구간 OHLCV를 {symbol: DataFrame}으로 반환합니다.
+        캐시가 전혀 없는 종목들은 공급자의 fetch_many로 한 번에 받아오고,
+        나머지는 get()과 동일하게 캐시 적중/누락 구간 보충으로 처리합니다.
+        - 모든 종목을 받은 뒤 반환하는 일괄 로드 (utils.bar_store.build_bar_store_from_cache)
+          run_universe는 완료된 종목부터 백테스트를 시작하도록 utils.prefetch로 종목별 get()을 동시에 호출합니다.
+        - return_exceptions=True이면 실패한 종목은 예외 객체를 값으로 담아 반환합니다. (asyncio.gather와 동일한 방식)
+        """
+        ts_start, ts_end = pd.Timestamp(start), pd.Timestamp(end)
+        covered_end = min(ts_end, pd.Timestamp.today().normalize())
+
+        missing = [symbol for symbol in symbols if not self._exists(symbol, interval)]
+        fetched = {}
+        if missing:
+            fetched = self.provider.fetch_many(missing, ts_start.strftime("%Y-%m-%d"), ts_end.strftime("%Y-%m-%d"), interval)
+            self.stats.add(fetches=1)
+
+        result = {}
+        for symbol in symbols:
+            if symbol not in fetched:
+                try:
+                    result[symbol] = self.get(symbol, start, end, interval)
+                except Exception as e:
+                    if not return_exceptions:
+                        raise
+                    result[symbol] = e
+                continue
+
+            data = normalize_ohlcv(fetched[symbol])
+            self.stats.add(misses=1, fetched_rows=len(data))
+            if not data.empty:
+                self._write(symbol, interval, data, ts_start, _confirmed_end(data, covered_end))
+            result[symbol] = data
+        return result
+
+
+_default_cache: Optional[OHLCVCache] = None
+
+
+def get_default_cache() -> OHLCVCache:
+    """ 기본 캐시 인스턴스 (yfinance 공급자, PathConfig.CACHE_DIR) """
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = OHLCVCache()
+    return _default_cache
+
+
+def get_stock_data(symbol: str, start: str, end: str, interval: str = "1d", cache: Optional[OHLCVCache] = None, use_cache: bool = True) -> pd.DataFrame:
+    """
+    yfinance 데이터를 다운로드하고 Backtesting.py에 맞게 변환합니다.
+    - 기본적으로 로컬 디스크 캐시를 거치며, 캐시에 없는 구간만 다운로드합니다.
+    - cache: 사용할 캐시 (테스트에서는 LocalFileProvider를 주입한 캐시 사용)
+    - use_cache=False이면 캐시 없이 yfinance에서 바로 다운로드합니다.
+    """
+    if not use_cache:
+        return YFinanceProvider().fetch(symbol, start, end, interval)
+
+    cache = cache or get_default_cache()
+    return cache.get(symbol, start, end, interval)
@@ -0,0 +1,266 @@
+import atexit
+import contextvars
+import logging
+import os
+import queue
+import threading
+from contextlib import contextmanager
+from typing import Dict, Optional
+
+from config.config import PathConfig
+from utils.looger_sqlite import get_sqlite_logger, LOG_TABLES
+
+
+logger = logging.getLogger(__name__)
+
+BACKPRESSURE_POLICIES = ("block", "drop", "sample")
+
+# 내부 제어 메시지
+_TABLE = "table"
+_TEXT = "text"
+_FLUSH = "flush"
+_STOP = "stop"
+
+
+class AsyncLogWriter:
+    """
+    큐 기반 백그라운드 로그 기록기
+
+    전략 루프는 로그 레코드를 큐에 넣기만 하고, 실제 SQLite/텍스트 파일 I/O는 별도 스레드에서 수행합니다.
+    - insert(table, row): LOG_TABLES 테이블 레코드 (sink.insert로 전달)
+    - write(message, filename): 텍스트 로그 (RESULT_DIR 하위 파일, 파일 핸들은 flush 시까지 유지)
+
+    큐가 가득 찼을 때의 처리(backpressure policy)
+    - "block" : 자리가 날 때까지 대기 (유실 없음)
+    - "drop"  : 새 레코드를 버림 (기본, 전략 루프를 막지 않음. 버린 수는 dropped)
+    - "sample": sample_rate개 중 1개만 대기 후 기록하고 나머지는 버림
+    never_drop 테이블(매매/에러 로그)은 정책과 관계없이 항상 대기 후 기록합니다.
+
+    tags(dict)에 값을 넣어두면 모든 테이블 레코드 앞쪽에 해당 컬럼이 추가됩니다. (프로세스 전체 기본값)
+    실행별 sink/태그(run_id, symbol 등)는 redirect()로 지정하며, 실행 컨텍스트(스레드/asyncio 태스크)별로 적용됩니다.
+    """
+
+    def __init__(
+        self,
+        sink=None,
+        maxsize: int = 10000,
+        policy: str = "drop",
+        sample_rate: int = 10,
+        flush_interval: float = 1.0,
+        never_drop=(LOG_TABLES["trade"], LOG_TABLES["error"]),
+    ):
+        if policy not in BACKPRESSURE_POLICIES:
+            raise ValueError(f"policy는 {BACKPRESSURE_POLICIES} 중 하나여야 합니다: {policy}")
+
+        self._sink = sink           # None이면 첫 기록 시 기본 SQLiteLogger 사용
+        self.maxsize = maxsize
+        self.policy = policy
+        self.sample_rate = max(1, sample_rate)
+        self.flush_interval = flush_interval
+        self.never_drop = set(never_drop)
+        self.tags = {}              # 모든 테이블 레코드에 추가할 컬럼 {컬럼: 값}
+        # redirect()로 지정한 (sink, tags) - 스레드/태스크마다 별도 값 (insert 시점에 레코드에 기록)
+        self._context = contextvars.ContextVar(f"log_writer_context_{id(self)}", default=(None, {}))
+        self._pending_sinks = {}    # 마지막 flush 이후 레코드를 받은 redirect sink {id: sink} (기록 스레드 전용)
+
+        self.submitted = 0          # 큐에 들어간 레코드 수
+        self.dropped = 0            # backpressure로 버려진 레코드 수
+        self.failed = 0             # 기록 중 에러가 난 레코드 수
+
+        self._saturated = 0         # sample 정책용 카운터
+        self._files = {}            # 텍스트 로그 파일 핸들 {path: file}
+        self._lock = threading.Lock()
+        self._pid = None
+        self._queue = None
+        self._thread = None
+
+
+    @property
+    def sink(self):
+        """ 레코드를 전달할 sink (지정하지 않았으면 기본 SQLiteLogger를 첫 사용 시 생성) """
+        if self._sink is None:
+            return get_sqlite_logger()
+        return self._sink
+
+
+    @sink.setter
+    def sink(self, sink):
+        self._sink = sink
+
+
+    def _ensure_started(self):
+        """ 첫 사용 시(또는 fork된 자식 프로세스에서) 큐와 기록 스레드를 생성 """
+        if self._thread is not None and self._pid == os.getpid() and self._thread.is_alive():
+            return
+
+        with self._lock:
+            if self._thread is not None and self._pid == os.getpid() and self._thread.is_alive():
+                return
+            self._pid = os.getpid()
+            self._queue = queue.Queue(maxsize=self.maxsize)
+            self._files = {}
+            self._thread = threading.Thread(target=self._run, name="AsyncLogWriter", daemon=True)
+            self._thread.start()
+
+
+    def _put(self, item, droppable: bool):
+        self._ensure_started()
+
+        if not droppable or self.policy == "block":
+            self._queue.put(item)
+            self.submitted += 1
+            return
+
+        try:
+            self._queue.put_nowait(item)
+            self.submitted += 1
+            return
+        except queue.Full:
+            pass
+
+        # 큐 포화 상태
+        self._saturated += 1
+        if self.policy == "sample" and self._saturated % self.sample_rate == 0:
+            self._queue.put(item)
+            self.submitted += 1
+        else:
+            self.dropped += 1
+
+
+    def insert(self, table: str, data: Dict):
+        """
+        테이블 레코드를 기록 큐에 넣습니다. (SQLiteLogger.insert와 같은 시그니처)
+        """
+        sink, tags = self._context.get()
+        if self.tags or tags:
+            data = {**self.tags, **tags, **data}
+        self._put((_TABLE, table, data, sink), droppable=table not in self.never_drop)
+
+
+    def write(self, message: str, filename: str):
+        """
+        텍스트 로그 메시지를 기록 큐에 넣습니다. (logger_xl.write_log와 같은 시그니처)
+        """
+        self._put((_TEXT, message, filename, None), droppable=True)
+
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        지금까지 큐에 들어간 모든 레코드가 기록될 때까지 대기합니다.
+        :return: timeout 안에 완료되면 True
+        """
+        if self._thread is None or self._pid != os.getpid() or not self._thread.is_alive():
+            self._flush_sinks()
+            return True
+
+        done = threading.Event()
+        self._queue.put((_FLUSH, done, None, None))
+        return done.wait(timeout)
+
+
+    @contextmanager
+    def redirect(self, sink=None, tags: Optional[Dict] = None):
+        """
+        with 블록 동안 현재 스레드(asyncio 태스크)에서 넣는 레코드의 sink/tags를 교체합니다. (None이면 기존 값 유지)
+        sink/tags는 insert 시점에 레코드마다 함께 저장되므로 큐를 비우지 않고도 블록 안의 레코드만 교체된 sink로 전달되고,
+        다른 스레드에서 동시에 실행 중인 redirect와 섞이지 않습니다. (블록 종료 후 기록 완료가 필요하면 flush() 호출)
+        """
+        current_sink, current_tags = self._context.get()
+        token = self._context.set((current_sink if sink is None else sink, current_tags if tags is None else tags))
+        try:
+            yield self
+        finally:
+            self._context.reset(token)
+
+
+    def close(self):
+        """ 남은 레코드를 모두 기록하고 기록 스레드를 종료합니다. """
+        if self._thread is None or self._pid != os.getpid() or not self._thread.is_alive():
+            self._flush_sinks()
+            return
+
+        self._queue.put((_STOP, None, None, None))
+        self._thread.join()
+
+
+    def _run(self):
+        """ 기록 스레드 루프 """
+        while True:
+            try:
+                kind, a, b, sink = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                # 유휴 시간에는 버퍼를 비워 데이터가 오래 머물지 않도록 함
+                self._flush_sinks()
+                continue
+
+            if kind == _FLUSH:
+                self._flush_sinks()
+                a.set()
+            elif kind == _STOP:
+                self._flush_sinks()
+                return
+            else:
+                try:
+                    if kind == _TABLE and sink is not None:
+                        self._pending_sinks[id(sink)] = sink
+                        sink.insert(a, b)
+                    elif kind == _TABLE:
+                        self.sink.insert(a, b)
+                    else:
+                        self._write_text(a, b)
+                except Exception:
+                    self.failed += 1
+                    logger.exception("로그 기록 실패: %s", a if kind == _TABLE else b)
+
+
+    def _write_text(self, message: str, filename: str):
+        file_path = os.path.join(PathConfig.RESULT_DIR, filename)
+        f = self._files.get(file_path)
+        if f is None:
+            os.makedirs(PathConfig.RESULT_DIR, exist_ok=True)
+            f = self._files[file_path] = open(file_path, "a", encoding="utf-8")
+        f.write(message + "\n")
+
+
+    def _flush_sinks(self):
+        # 기본 sink가 아직 생성되지 않았으면 (기록한 레코드 없음) 생성하지 않음
+        sink = self._sink if self._sink is not None else get_sqlite_logger(create=False)
+        sinks = {id(sink): sink} if sink is not None else {}
+        sinks.update(self._pending_sinks)
+        self._pending_sinks = {}
+        for sink in sinks.values():
+            try:
+                sink.flush()
+            except Exception:
+                logger.exception("로그 sink flush 실패")
+
+        for f in self._files.values():
+            f.close()
+        self._files = {}
+
+
+class TeeSink:
+    """ 여러 sink에 같은 레코드를 전달하는 sink (예: SQLite + Parquet 결과 저장소) """
+
+    def __init__(self, *sinks):
+        self.sinks = sinks
+
+
+    def insert(self, table: str, data: Dict):
+        for sink in self.sinks:
+            sink.insert(table, data)
+
+
+    def flush(self):
+        for sink in self.sinks:
+            sink.flush()
+
+
+    def close(self):
+        for sink in self.sinks:
+            sink.close()
+
+
+# 전역 인스턴스 생성 (프로세스 종료 시 남은 레코드 기록)
+log_writer = AsyncLogWriter()
+atexit.register(log_writer.close)
@@ -5,6 +5,7 @@ import pandas as pd
 from config.config import PathConfig
 from openpyxl import Workbook
 from openpyxl.styles import Font, Alignment, PatternFill, Border, Side
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.utils import get_column_letter
 
 
@@ -32,13 +33,19 @@ def setup_logger(name: str, log_file: str, level=logging.INFO) -> logging.Logger
     return logger
 
 
+# 이미 생성 확인한 결과 디렉토리 (매 호출마다 os.makedirs 하지 않도록)
+_created_dirs = set()
+
+
 def write_log(message: str, filename: str):
     """
     로그 메시지를 텍스트 파일에 기록합니다.
     :param message: 로그 메시지
     :param filename: 로그 파일 이름
     """
-    os.makedirs(PathConfig.RESULT_DIR, exist_ok=True)
+    if PathConfig.RESULT_DIR not in _created_dirs:
+        os.makedirs(PathConfig.RESULT_DIR, exist_ok=True)
+        _created_dirs.add(PathConfig.RESULT_DIR)
 
     # ✅ log_dir과 filename을 합쳐서 경로 구성
     file_path = os.path.join(PathConfig.RESULT_DIR, filename)
@@ -68,43 +75,104 @@ def write_log_csv(row:dict, filename: str):
         writer.writerow(row)
 
 
-def write_log_xlsx(df: pd.DataFrame, filename: str, template: str = "default"):
+# 🔧 템플릿별 열 너비
+XLSX_COLUMN_WIDTHS = {
+    "score": [14, 12, 10, 10, 10, 12, 14, 15, 15, 17],
+    "trading": [14, 14, 10, 12, 10, 13, 10, 15, 17],
+}
+
+
+def _xlsx_header_style(cell):
+    """ 헤더 셀 스타일 (굵은 글씨, 회색 배경, 테두리) """
+    cell.font = Font(name="NanumGothic", size=9, bold=True)
+    cell.alignment = Alignment(horizontal="center", vertical="center")
+    cell.fill = PatternFill(start_color="DDDDDD", end_color="DDDDDD", fill_type="solid")
+    cell.border = Border(
+        left=Side(style="thin"),
+        right=Side(style="thin"),
+        top=Side(style="thin"),
+        bottom=Side(style="thin")
+    )
+
+
+def _xlsx_body_style(cell):
+    """ 본문 셀 스타일 """
+    cell.font = Font(name="NanumGothic", size=9)
+    cell.alignment = Alignment(horizontal="center", vertical="center")
+
+
+def write_log_xlsx(df: pd.DataFrame, filename: str, template: str = "default", fast: bool = True):
     """
     DataFrame 전체를 XLSX 파일에 저장합니다. 기존 파일은 덮어씌워집니다.
     :param df: 기록할 DataFrame
     :param filename: 로그 파일 이름 (xlsx 확장자 포함)
     :param template: "score", "trading" 등 포맷 유형에 따른 열 너비 지정
+    :param fast: True이면 write-only(스트리밍) 모드로 저장 (출력 서식은 동일, 행 수와 무관하게 메모리 사용량 일정)
     """
     os.makedirs(PathConfig.RESULT_DIR, exist_ok=True)
     file_path = os.path.join(PathConfig.RESULT_DIR, filename)
 
+    header = list(df.columns)
+    col_widths = XLSX_COLUMN_WIDTHS.get(template, [15] * len(header))
+
+    if fast:
+        _write_xlsx_streaming(df, file_path, header, col_widths)
+    else:
+        _write_xlsx(df, file_path, header, col_widths)
+
+
+def _write_xlsx_streaming(df: pd.DataFrame, file_path: str, header: list, col_widths: list):
+    """
+    write-only 모드 저장
+    - 열 너비/틀 고정/필터는 행 작성 전에 한 번만 지정
+    - 본문은 열마다 스타일을 지정한 셀 하나를 만들어 두고 값만 바꿔가며 기록 (셀마다 Font/Alignment 생성 X)
+    """
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet()
+
+    for i, width in enumerate(col_widths, 1):
+        ws.column_dimensions[get_column_letter(i)].width = width
+
+    # 🔍 필터 추가 및 틀 고정 (헤더 행 기준)
+    ws.auto_filter.ref = f"A1:{get_column_letter(max(len(header), 1))}1"
+    ws.freeze_panes = "A2"
+
+    # 🧾 헤더 작성
+    header_cells = []
+    for col_name in header:
+        cell = WriteOnlyCell(ws, value=col_name)
+        _xlsx_header_style(cell)
+        header_cells.append(cell)
+    ws.append(header_cells)
+
+    # ✏️ 본문 데이터 작성 (append 시점에 바로 파일로 기록되므로 셀 객체 재사용 가능)
+    body_cells = []
+    for _ in header:
+        cell = WriteOnlyCell(ws)
+        _xlsx_body_style(cell)
+        body_cells.append(cell)
+
+    for row_data in df.itertuples(index=False, name=None):
+        for cell, value in zip(body_cells, row_data):
+            cell.value = value
+        ws.append(body_cells)
+
+    # 💾 저장
+    wb.save(file_path)
+
+
+def _write_xlsx(df: pd.DataFrame, file_path: str, header: list, col_widths: list):
+    """ 일반 모드 저장 (셀 단위 서식 지정) """
     wb = Workbook()
     ws = wb.active
 
     # 🧾 헤더 작성
-    header = list(df.columns)
     ws.append(header)
 
     for col_num, col_name in enumerate(header, 1):
-        cell = ws.cell(row=1, column=col_num)
-        cell.font = Font(name="NanumGothic", size=9, bold=True)
-        cell.alignment = Alignment(horizontal="center", vertical="center")
-        cell.fill = PatternFill(start_color="DDDDDD", end_color="DDDDDD", fill_type="solid")
-        cell.border = Border(
-            left=Side(style="thin"),
-            right=Side(style="thin"),
-            top=Side(style="thin"),
-            bottom=Side(style="thin")
-        )
-
-    # 🔧 템플릿별 열 너비 설정
-    if template == "score":
-        col_widths = [14, 12, 10, 10, 10, 12, 14, 15, 15, 17]
-    elif template == "trading":
-        col_widths = [14, 14, 10, 12, 10, 13, 10, 15, 17]
-    else:
-        col_widths = [15] * len(header)
+        _xlsx_header_style(ws.cell(row=1, column=col_num))
 
+    # 🔧 열 너비 설정
     for i, width in enumerate(col_widths, 1):
         col_letter = get_column_letter(i)
         ws.column_dimensions[col_letter].width = width
@@ -114,12 +182,11 @@ def write_log_xlsx(df: pd.DataFrame, filename: str, template: str = "default"):
     ws.freeze_panes = "A2"
 
     # ✏️ 본문 데이터 작성
-    for row_data in df.itertuples(index=False, name=None):
+    # (ws.max_row는 호출마다 전체 셀을 훑으므로 행 번호를 직접 계산)
+    for row_num, row_data in enumerate(df.itertuples(index=False, name=None), 2):
         ws.append(row_data)
         for i, value in enumerate(row_data):
-            cell = ws.cell(row=ws.max_row, column=i + 1)
-            cell.font = Font(name="NanumGothic", size=9)
-            cell.alignment = Alignment(horizontal="center", vertical="center")
+            _xlsx_body_style(ws.cell(row=row_num, column=i + 1))
 
     # 💾 저장
     wb.save(file_path)
@@ -1,29 +1,162 @@
+import atexit
 import sqlite3
 import os
-from typing import Dict
+import time
+from itertools import groupby
+from typing import Dict, Optional
 from datetime import datetime
 from config.config import PathConfig
 
 
+SYNCHRONOUS_MODES = ("OFF", "NORMAL", "FULL", "EXTRA")
+
+
+# 테이블명 정의
+
+# 로그 테이블
+LOG_TABLES = {
+    "score": "score_log",
+    "trade": "trading_log",
+    "regime": "regime_log",
+    "error": "error_log",
+}
+
+# 📋 로그 테이블 스키마 (컬럼 타입 선언, 모든 테이블 공통으로 run_id/symbol 포함)
+# 선언되지 않은 키가 들어오면 기존처럼 TEXT 컬럼으로 추가됩니다.
+_RUN_COLUMNS = {"run_id": "TEXT", "symbol": "TEXT", "date": "TEXT"}
+
+LOG_SCHEMAS = {
+    LOG_TABLES["score"]: {
+        **_RUN_COLUMNS,
+        "EMA": "REAL",
+        "MACD": "REAL",
+        "RSI": "REAL",
+        "VOL": "REAL",
+        "TOTAL": "REAL",
+        "current price": "REAL",
+        "σ (std)": "REAL",
+        "z-score": "REAL",
+        "market_regime": "TEXT",
+    },
+    LOG_TABLES["trade"]: {
+        **_RUN_COLUMNS,
+        "action": "TEXT",
+        "score": "REAL",
+        "price": "REAL",
+        "size": "INTEGER",
+        "avg_price": "REAL",
+        "roi": "REAL",
+        "market_value": "REAL",
+        "market_regime": "TEXT",
+    },
+    LOG_TABLES["regime"]: {
+        **_RUN_COLUMNS,
+        "market_regime": "TEXT",
+        "std": "REAL",
+        "z_score": "REAL",
+    },
+    LOG_TABLES["error"]: {
+        **_RUN_COLUMNS,
+        "error": "TEXT",
+        "message": "TEXT",
+    },
+}
+
+# 실행별 조회 / 종목별 집계용 인덱스
+LOG_INDEXES = [("run_id", "date"), ("symbol", "date")]
+
+
 class SQLiteLogger:
-    def __init__(self, db_path=None):
+    """
+    전략 로그용 SQLite 로거
+
+    - buffered=True (기본, 백테스트용)
+        행을 메모리에 모아두었다가 buffer_size 또는 flush_interval(초)에 도달하거나
+        flush()/close()/with 블록 종료 시 하나의 트랜잭션에서 executemany로 일괄 기록합니다.
+    - buffered=False (라이브 트레이딩용)
+        insert 호출마다 즉시 커밋하여 행 단위 내구성을 보장합니다.
+    """
+
+    def __init__(
+        self,
+        db_path=None,
+        buffered: bool = True,
+        buffer_size: int = 1000,
+        flush_interval: float = 5.0,
+        synchronous: str = "NORMAL",
+        journal_mode: str = "WAL",
+        timeout: float = 30.0,
+    ):
         if db_path is None:
             db_path = os.path.join(PathConfig.RESULT_DIR, "strategy_logs.sqlite")
         os.makedirs(os.path.dirname(db_path), exist_ok=True)
 
-        self.conn = sqlite3.connect(db_path)
+        synchronous = synchronous.upper()
+        if synchronous not in SYNCHRONOUS_MODES:
+            raise ValueError(f"synchronous는 {SYNCHRONOUS_MODES} 중 하나여야 합니다: {synchronous}")
+
+        self.db_path = db_path
+        self.buffered = buffered
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+
+        # AsyncLogWriter의 기록 스레드에서도 사용할 수 있도록 스레드 검사 해제 (동시 사용은 하지 않음)
+        # 여러 프로세스가 같은 파일에 기록하는 경우 잠금이 풀릴 때까지 timeout(초)만큼 대기
+        self.conn = sqlite3.connect(db_path, check_same_thread=False, timeout=timeout)
         self.conn.row_factory = sqlite3.Row  # dict-like fetch
         self.cursor = self.conn.cursor()
+        self.cursor.execute(f"PRAGMA journal_mode={journal_mode}")
+        self.cursor.execute(f"PRAGMA synchronous={synchronous}")
+
+        self._columns = {}          # 테이블별 확인된 컬럼 캐시 {table: set(columns)}
+        self._buffer = []           # 대기 중인 행 [(table, columns, values)]
+        self._last_flush = time.monotonic()
 
 
     def _ensure_table(self, table: str, data: Dict):
         """
         테이블이 존재하는지 확인하고, 없으면 생성합니다.
+        - LOG_SCHEMAS에 선언된 테이블은 선언된 타입(REAL/INTEGER/TEXT) + 정수 PK + 인덱스로 생성
+          (이전 버전에서 만든 TEXT 전용 테이블이면 선언된 컬럼 중 없는 것만 추가)
+        - 그 외 테이블은 첫 행의 키로 TEXT 컬럼을 생성
+        이미 확인한 테이블은 캐시된 스키마를 사용하며, 새 키가 들어오면 컬럼을 추가합니다.
         """
-        cols = ', '.join([f'"{k}" TEXT' for k in data.keys()])
-        sql = f'CREATE TABLE IF NOT EXISTS "{table}" ({cols})'
-        self.cursor.execute(sql)
-        self.conn.commit()
+        known = self._columns.get(table)
+        if known is not None and known.issuperset(data.keys()):
+            return
+
+        if known is None:
+            schema = LOG_SCHEMAS.get(table)
+            if schema:
+                cols = ', '.join(['"id" INTEGER PRIMARY KEY'] + [f'"{k}" {t}' for k, t in schema.items()])
+            else:
+                cols = ', '.join([f'"{k}" TEXT' for k in data.keys()])
+            self.cursor.execute(f'CREATE TABLE IF NOT EXISTS "{table}" ({cols})')
+            known = {row["name"] for row in self.cursor.execute(f'PRAGMA table_info("{table}")')}
+
+            if schema:
+                for k, t in schema.items():
+                    if k not in known:
+                        self.cursor.execute(f'ALTER TABLE "{table}" ADD COLUMN "{k}" {t}')
+                        known.add(k)
+                for index_cols in LOG_INDEXES:
+                    name = f"idx_{table}_{'_'.join(index_cols)}"
+                    cols = ', '.join(f'"{k}"' for k in index_cols)
+                    self.cursor.execute(f'CREATE INDEX IF NOT EXISTS "{name}" ON "{table}" ({cols})')
+
+        # 처음 생성된 스키마에 없던 키 (예: market_regime이 없는 트레일링 스탑 로그가 먼저 기록된 경우)
+        for k in data.keys():
+            if k not in known:
+                self.cursor.execute(f'ALTER TABLE "{table}" ADD COLUMN "{k}" TEXT')
+                known.add(k)
+
+        self._columns[table] = known
+
+
+    def _insert_sql(self, table: str, columns) -> str:
+        cols = ', '.join([f'"{k}"' for k in columns])
+        placeholders = ', '.join(['?'] * len(columns))
+        return f'INSERT INTO "{table}" ({cols}) VALUES ({placeholders})'
 
 
     def insert(self, table: str, data: Dict):
@@ -32,32 +165,73 @@ class SQLiteLogger:
         :param table: 테이블 이름
         :param data: 데이터 (딕셔너리 형태)
         """
-        self._ensure_table(table, data)
-        columns = ', '.join([f'"{k}"' for k in data.keys()])
-        placeholders = ', '.join(['?'] * len(data))
-        sql = f'INSERT INTO "{table}" ({columns}) VALUES ({placeholders})'
-        self.cursor.execute(sql, list(data.values()))
-        self.conn.commit()
+        if not self.buffered:
+            self._ensure_table(table, data)
+            self.cursor.execute(self._insert_sql(table, data.keys()), list(data.values()))
+            self.conn.commit()
+            return
+
+        self._buffer.append((table, tuple(data.keys()), tuple(data.values())))
+
+        if len(self._buffer) >= self.buffer_size or time.monotonic() - self._last_flush >= self.flush_interval:
+            self.flush()
+
+
+    def flush(self):
+        """
+        버퍼에 쌓인 행을 하나의 트랜잭션으로 기록합니다.
+        같은 (테이블, 컬럼 구성)이 연속된 구간끼리 묶어 executemany로 Insert하므로 기록 순서가 유지됩니다.
+        """
+        self._last_flush = time.monotonic()
+        if not self._buffer:
+            return
+
+        rows, self._buffer = self._buffer, []
+        with self.conn:
+            for (table, columns), group in groupby(rows, key=lambda row: (row[0], row[1])):
+                self._ensure_table(table, dict.fromkeys(columns))
+                self.cursor.executemany(self._insert_sql(table, columns), [values for _, _, values in group])
 
 
-    
     def close(self):
         """
-        데이터베이스 연결을 닫습니다.
+        남은 버퍼를 기록하고 데이터베이스 연결을 닫습니다.
         """
+        if self.conn is None:
+            return
+        self.flush()
         self.conn.close()
+        self.conn = None
 
 
-# 전역 인스턴스 생성
-sqlite_logger = SQLiteLogger()
+    def __enter__(self):
+        return self
 
 
-# 테이블명 정의
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+# 기본 인스턴스 (첫 사용 시 생성 -> import만으로는 결과 디렉토리/DB를 만들지 않음)
+_default_logger: Optional[SQLiteLogger] = None
+
+
+def get_sqlite_logger(create: bool = True) -> Optional[SQLiteLogger]:
+    """
+    기본 SQLiteLogger (PathConfig.RESULT_DIR/strategy_logs.sqlite)
+    - 첫 호출 시 생성하고, 프로세스 종료 시 남은 버퍼를 기록하도록 등록합니다.
+    - create=False이면 아직 생성되지 않았을 때 None을 반환합니다.
+    """
+    global _default_logger
+    if _default_logger is None and create:
+        _default_logger = SQLiteLogger()
+        atexit.register(_default_logger.close)
+    return _default_logger
+
+
+def __getattr__(name):
+    # 기존 코드 호환: from utils.looger_sqlite import sqlite_logger
+    if name == "sqlite_logger":
+        return get_sqlite_logger()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-# 로그 테이블
-LOG_TABLES = {
-    "score": "score_log",
-    "trade": "trading_log",
-    "regime": "regime_log",
-    "error": "error_log",
-}
\ No newline at end of file
@@ -0,0 +1,206 @@
+import asyncio
+import queue
+import random
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import AsyncIterator, Iterable, Iterator, Optional, Tuple, Union
+
+import pandas as pd
+
+from utils.data_loader import DataProvider, OHLCVCache, get_default_cache
+
+
+"""
+📥 prefetch
+
+asyncio 기반 다종목 OHLCV 선행 로딩
+
+- 종목별 요청을 동시에 최대 max_concurrency개까지 실행 (asyncio.Semaphore)
+- 실패(예외/타임아웃)와 빈 응답은 지수 백오프(+지터)로 재시도
+- 완료되는 순서대로 (symbol, DataFrame)을 내보내므로, 먼저 받은 종목부터 백테스트를 시작할 수 있음
+
+공급자:
+- AsyncDataProvider(async fetch)를 구현한 공급자는 그대로 사용
+- 동기 DataProvider(YFinanceProvider, LocalFileProvider)와 OHLCVCache(get)는 스레드에서 실행 (blocking I/O)
+
+사용:
+- async 코드: `async for symbol, data in prefetch(symbols, start, end): ...`
+- 동기 코드: `for symbol, data in iter_prefetch(symbols, start, end): ...` (백그라운드 스레드의 이벤트 루프에서 로드)
+"""
+
+
+class AsyncDataProvider:
+    """
+    비동기 OHLCV 데이터 공급자 인터페이스
+    - async fetch(symbol, start, end, interval) -> 정규화된 OHLCV DataFrame (end는 미포함)
+    """
+
+    async def fetch(self, symbol: str, start: str, end: str, interval: str = "1d") -> pd.DataFrame:
+        raise NotImplementedError
+
+
+class ThreadedProvider(AsyncDataProvider):
+    """ 동기 공급자(DataProvider.fetch / OHLCVCache.get)를 이벤트 루프의 기본 스레드 풀에서 실행 """
+
+    def __init__(self, provider: Union[DataProvider, OHLCVCache]):
+        self.provider = provider
+        self._fetch = provider.get if isinstance(provider, OHLCVCache) else provider.fetch
+
+    async def fetch(self, symbol: str, start: str, end: str, interval: str = "1d") -> pd.DataFrame:
+        return await asyncio.to_thread(self._fetch, symbol, start, end, interval)
+
+
+def as_async_provider(provider=None) -> AsyncDataProvider:
+    """ 공급자를 AsyncDataProvider로 변환 (None이면 기본 캐시) """
+    provider = get_default_cache() if provider is None else provider
+    return provider if isinstance(provider, AsyncDataProvider) else ThreadedProvider(provider)
+
+
+@dataclass
+class RetryPolicy:
+    """
+    재시도 정책
+    - 재시도 대기: min(max_backoff, backoff * 2^시도) × (1 ± jitter)
+    - no_retry에 해당하는 예외(데이터 파일 없음 등)는 즉시 실패
+    - retry_empty=True이면 빈 응답도 재시도 (yfinance는 다운로드 실패 시 예외 대신 빈 DataFrame 반환)
+      마지막 시도까지 비어 있으면 빈 DataFrame을 그대로 반환
+    """
+    retries: int = 3
+    backoff: float = 0.5
+    max_backoff: float = 8.0
+    jitter: float = 0.1
+    retry_empty: bool = True
+    no_retry: Tuple[type, ...] = (FileNotFoundError, NotImplementedError)
+
+    def delay(self, attempt: int) -> float:
+        delay = min(self.max_backoff, self.backoff * 2 ** attempt)
+        return delay * (1 + random.uniform(-self.jitter, self.jitter)) if self.jitter else delay
+
+
+async def fetch_with_retry(
+    provider: AsyncDataProvider,
+    symbol: str,
+    start: str,
+    end: str,
+    interval: str = "1d",
+    retry: Optional[RetryPolicy] = None,
+    timeout: Optional[float] = None,
+    semaphore: Optional[asyncio.Semaphore] = None,
+) -> pd.DataFrame:
+    """
+    종목 하나를 재시도하며 가져옵니다. (semaphore는 시도마다 잡고, 백오프 대기 중에는 놓음)
+    :param timeout: 시도당 제한 시간(초), 초과 시 TimeoutError로 재시도
+    """
+    retry = retry or RetryPolicy()
+    for attempt in range(retry.retries + 1):
+        last = attempt == retry.retries
+        try:
+            if semaphore is None:
+                data = await asyncio.wait_for(provider.fetch(symbol, start, end, interval), timeout)
+            else:
+                async with semaphore:
+                    data = await asyncio.wait_for(provider.fetch(symbol, start, end, interval), timeout)
+        except retry.no_retry:
+            raise
+        except Exception:
+            if last:
+                raise
+        else:
+            if not (retry.retry_empty and data.empty) or last:
+                return data
+        await asyncio.sleep(retry.delay(attempt))
+
+
+async def prefetch(
+    symbols: Iterable[str],
+    start: str,
+    end: str,
+    interval: str = "1d",
+    provider=None,
+    max_concurrency: int = 8,
+    retry: Optional[RetryPolicy] = None,
+    timeout: Optional[float] = None,
+    return_exceptions: bool = True,
+) -> AsyncIterator[Tuple[str, Union[pd.DataFrame, Exception]]]:
+    """
+    여러 종목의 [start, end) OHLCV를 동시에 로드하고 완료되는 순서대로 (symbol, DataFrame)을 내보냅니다.
+    - 중복 종목은 한 번만 로드
+    - return_exceptions=True이면 실패한 종목은 예외 객체를 값으로 내보냄 (False이면 첫 실패에서 예외 발생)
+    - 순회를 중단하면 남은 요청은 취소
+    :param provider: AsyncDataProvider, DataProvider 또는 OHLCVCache (기본값: 기본 캐시)
+    """
+    provider = as_async_provider(provider)
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def load(symbol):
+        try:
+            return symbol, await fetch_with_retry(provider, symbol, start, end, interval, retry, timeout, semaphore)
+        except Exception as e:
+            if not return_exceptions:
+                raise
+            return symbol, e
+
+    tasks = [asyncio.ensure_future(load(symbol)) for symbol in dict.fromkeys(symbols)]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+_DONE = object()
+
+
+def iter_prefetch(
+    symbols: Iterable[str],
+    start: str,
+    end: str,
+    interval: str = "1d",
+    provider=None,
+    max_concurrency: int = 8,
+    **kwargs,
+) -> Iterator[Tuple[str, Union[pd.DataFrame, Exception]]]:
+    """
+    prefetch의 동기 버전 (이벤트 루프가 없는 호출 측용)
+    - 백그라운드 스레드의 이벤트 루프에서 로드하고, 완료된 종목부터 내보냄
+      (호출 측이 받은 종목을 처리하는 동안 나머지 종목은 계속 로드)
+    - 동기 공급자를 실행하는 스레드 풀 크기는 max_concurrency
+    """
+    items = queue.Queue()
+    started = threading.Event()
+    handle = {}
+
+    async def pump():
+        loop = asyncio.get_running_loop()
+        loop.set_default_executor(ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="prefetch"))
+        handle.update(loop=loop, task=asyncio.current_task())
+        started.set()
+        try:
+            async for item in prefetch(symbols, start, end, interval, provider, max_concurrency, **kwargs):
+                items.put(item)
+        except asyncio.CancelledError:
+            pass    # 호출 측이 순회를 중단하여 취소된 경우 (정상 종료)
+        except Exception as e:
+            items.put(e)
+        finally:
+            items.put(_DONE)
+
+    thread = threading.Thread(target=asyncio.run, args=(pump(),), name="prefetch-loop", daemon=True)
+    thread.start()
+    try:
+        while (item := items.get()) is not _DONE:
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        # 순회를 중단한 경우 남은 요청 취소 (실행 중인 스레드 요청은 끝날 때까지 대기)
+        started.wait()
+        if thread.is_alive():
+            try:
+                handle["loop"].call_soon_threadsafe(handle["task"].cancel)
+            except RuntimeError:
+                pass    # 이미 종료된 루프
+        thread.join()
@@ -0,0 +1,133 @@
+import functools
+import time
+from collections import defaultdict
+from typing import Dict, Iterable, Optional
+
+import pandas as pd
+
+
+"""
+⏲️ profiling
+
+전략 메서드 단위(phase) 실행 시간 측정
+- instrument(obj, methods)는 활성화한 경우에만 인스턴스 메서드를 측정용 래퍼로 교체합니다.
+  (비활성화 시에는 아무것도 교체하지 않으므로 추가 비용 없음)
+- 호출마다 perf_counter_ns 차이를 phase별 집계(PhaseStats)에 더하고, summary()에서 통계를 계산합니다.
+  (호출 수와 관계없이 phase당 메모리가 고정이므로 장시간 실행(replay)에도 사용할 수 있음)
+"""
+
+PROFILE_COLUMNS = ["phase", "calls", "total_ms", "mean_us", "p50_us", "p99_us"]
+
+# 로그 버킷 히스토그램: 32ns 미만은 1ns 단위, 이후 2의 거듭제곱 구간마다 16개 버킷 (상대 오차 3% 이내)
+_SUB_BITS = 4
+_EXACT = 2 << _SUB_BITS                 # 32
+_BUCKETS = (64 - _SUB_BITS) << _SUB_BITS
+
+
+def _bucket_value(index: int) -> float:
+    """ 버킷의 대표값(ns, 구간 중앙) """
+    if index < _EXACT:
+        return float(index)
+    shift = (index >> _SUB_BITS) - 1
+    low = (index - (shift << _SUB_BITS)) << shift
+    return low + ((1 << shift) - 1) / 2
+
+
+class PhaseStats:
+    """
+    phase 하나의 실행 시간(ns) 집계
+    - 호출 수/합계/최소/최대는 정확한 값, 분위수는 고정 크기 로그 버킷 히스토그램으로 근사 (최소~최대 범위로 제한)
+    """
+
+    __slots__ = ("count", "total", "min", "max", "buckets")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = None
+        self.buckets = [0] * _BUCKETS
+
+
+    def add(self, ns: int):
+        self.count += 1
+        self.total += ns
+        if self.min is None or ns < self.min:
+            self.min = ns
+        if self.max is None or ns > self.max:
+            self.max = ns
+        if ns < _EXACT:
+            self.buckets[ns] += 1
+        else:
+            shift = ns.bit_length() - _SUB_BITS - 1
+            self.buckets[(shift << _SUB_BITS) + (ns >> shift)] += 1
+
+
+    def percentile(self, q: float) -> float:
+        """ q(0~100) 분위수 근사값(ns) """
+        rank = q / 100 * (self.count - 1)
+        seen = 0
+        for index, n in enumerate(self.buckets):
+            seen += n
+            if seen > rank:
+                return min(max(_bucket_value(index), self.min), self.max)
+        return float(self.max)
+
+
+class PhaseProfiler:
+    """ phase별 실행 시간(ns) 수집기 """
+
+    def __init__(self):
+        self.phases = defaultdict(PhaseStats)   # {phase: PhaseStats}
+
+
+    def record(self, phase: str, ns: int):
+        """ phase의 실행 시간 하나를 기록 """
+        self.phases[phase].add(ns)
+
+
+    def wrap(self, phase: str, func):
+        """ func 호출 시간을 phase로 기록하는 래퍼 반환 """
+        record = self.phases[phase].add
+        clock = time.perf_counter_ns
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            started = clock()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                record(clock() - started)
+
+        return wrapper
+
+
+    def summary(self) -> pd.DataFrame:
+        """ phase별 호출 수, 합계(ms), 평균/p50/p99(µs) """
+        rows = []
+        for phase, stats in self.phases.items():
+            if not stats.count:
+                continue
+            rows.append({
+                "phase": phase,
+                "calls": stats.count,
+                "total_ms": stats.total / 1e6,
+                "mean_us": stats.total / stats.count / 1e3,
+                "p50_us": stats.percentile(50) / 1e3,
+                "p99_us": stats.percentile(99) / 1e3,
+            })
+        return pd.DataFrame(rows, columns=PROFILE_COLUMNS)
+
+
+def instrument(obj, methods: Iterable[str], profiler: Optional[PhaseProfiler] = None,
+               names: Optional[Dict[str, str]] = None) -> PhaseProfiler:
+    """
+    obj의 메서드를 측정용 래퍼로 교체 (인스턴스 속성으로 설정하므로 클래스와 다른 인스턴스에는 영향 없음)
+    :param methods: 측정할 메서드 이름
+    :param names: 메서드 이름 -> phase 이름 (기본값: 메서드 이름)
+    """
+    profiler = profiler or PhaseProfiler()
+    names = names or {}
+    for method in methods:
+        setattr(obj, method, profiler.wrap(names.get(method, method), getattr(obj, method)))
+    return profiler
@@ -0,0 +1,195 @@
+import os
+import uuid
+from collections import defaultdict
+from datetime import datetime
+from typing import Dict, List, Optional
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+from config.config import PathConfig
+from utils.looger_sqlite import LOG_TABLES
+from utils.stats import stats_to_row
+
+
+"""
+🗄️ result_store
+
+실행(run)별 스코어 로그, 매매 로그, stats를 타입이 지정된 Parquet 파일로 저장하는 컬럼 기반 결과 저장소입니다.
+
+디렉토리 구조 (hive 파티션)
+    {root}/{table}/symbol={symbol}/run_date={YYYY-MM-DD}/{run_id}.parquet
+    - table: score_log, trading_log, stats, profile(전략의 profile=True 실행에서 단계별 실행 시간)
+
+query()는 pyarrow dataset으로 읽으므로 symbol/run_date 조건은 파티션 단위로, 나머지 조건은 파일 통계(predicate pushdown)로 걸러지고,
+columns로 지정한 컬럼만 읽습니다. (수천 개 실행 결과를 TEXT 테이블 전체 스캔 없이 분석)
+"""
+
+STATS_TABLE = "stats"
+PROFILE_TABLE = "profile"
+
+# 📋 테이블별 컬럼 타입 (로그 dict의 문자열/"-" 값은 숫자/날짜로 변환, 변환 불가 값은 결측 처리)
+RESULT_SCHEMAS = {
+    LOG_TABLES["score"]: {
+        "date": "datetime64[ns]",
+        "EMA": "float64",
+        "MACD": "float64",
+        "RSI": "float64",
+        "VOL": "float64",
+        "TOTAL": "float64",
+        "current price": "float64",
+        "σ (std)": "float64",
+        "z-score": "float64",
+        "market_regime": "string",
+    },
+    LOG_TABLES["trade"]: {
+        "date": "datetime64[ns]",
+        "action": "string",
+        "score": "float64",
+        "price": "float64",
+        "size": "Int64",
+        "avg_price": "float64",
+        "roi": "float64",
+        "market_value": "float64",
+        "market_regime": "string",
+    },
+    # 기간/날짜 항목은 문자열 (거래가 없는 실행에서는 NaN이 되므로 타입을 고정)
+    STATS_TABLE: {
+        "Start": "string",
+        "End": "string",
+        "Duration": "string",
+        "Max. Drawdown Duration": "string",
+        "Avg. Drawdown Duration": "string",
+        "Max. Trade Duration": "string",
+        "Avg. Trade Duration": "string",
+    },
+    PROFILE_TABLE: {
+        "phase": "string",
+        "calls": "Int64",
+        "total_ms": "float64",
+        "mean_us": "float64",
+        "p50_us": "float64",
+        "p99_us": "float64",
+    },
+}
+
+PARTITIONING = ds.partitioning(pa.schema([("symbol", pa.string()), ("run_date", pa.string())]), flavor="hive")
+
+
+def new_run_id() -> str:
+    """ 실행 식별자 생성 (시각 + 임의 문자열) """
+    return f"{datetime.now().strftime('%Y%m%d%H%M%S')}_{uuid.uuid4().hex[:8]}"
+
+
+def apply_schema(df: pd.DataFrame, schema: Dict[str, str]) -> pd.DataFrame:
+    """
+    스키마에 정의된 컬럼을 지정한 타입으로 변환합니다.
+    - 없는 컬럼은 결측값으로 추가 (예: market_regime이 없는 트레일링 스탑 로그) -> 모든 파일의 스키마가 동일
+    - 스키마에 없는 컬럼은 그대로 유지
+    """
+    df = df.copy()
+    for col, dtype in schema.items():
+        values = df[col] if col in df else pd.Series(pd.NA, index=df.index, dtype="object")
+        if dtype.startswith("datetime"):
+            df[col] = pd.to_datetime(values, format="%Y.%m.%d", errors="coerce")
+        elif dtype in ("float64", "Int64"):
+            df[col] = pd.to_numeric(values, errors="coerce").astype(dtype)
+        else:
+            df[col] = values.astype(dtype)
+    return df
+
+
+class ParquetResultStore:
+    """
+    컬럼 기반(Parquet) 결과 저장소
+
+    - insert(table, data): 로그 sink 인터페이스 (SQLiteLogger.insert와 같은 시그니처, 메모리에 보관)
+    - write_run(symbol, stats): 보관 중인 이번 실행의 로그와 stats를 파티션 파일로 기록
+    - query(table, columns, filters): 저장된 결과를 DataFrame으로 조회
+    """
+
+    def __init__(self, root: Optional[str] = None):
+        self.root = root or PathConfig.RESULT_STORE_DIR
+        self._rows = defaultdict(list)      # 기록 대기 중인 로그 {table: [row, ...]}
+
+
+    # ---------------------------
+    # ✏️ 기록
+    # ---------------------------
+    def insert(self, table: str, data: Dict):
+        self._rows[table].append(dict(data))
+
+
+    def flush(self):
+        """ 로그 sink 인터페이스 호환용 (파일 기록은 write_run에서 실행 단위로 수행) """
+
+
+    def close(self):
+        """ 로그 sink 인터페이스 호환용 """
+
+
+    def discard(self):
+        """ 기록 대기 중인 로그를 버립니다. (실행 실패 시) """
+        self._rows.clear()
+
+
+    def write_run(self, symbol: str, stats=None, run_id: Optional[str] = None, run_date: Optional[str] = None) -> str:
+        """
+        이번 실행의 로그와 stats를 기록하고 run_id를 반환합니다.
+        :param symbol: 종목 코드 (파티션 키)
+        :param stats: Backtest.run() 결과 (None이면 stats 미기록, "_profile" 항목이 있으면 profile 테이블에도 기록)
+        :param run_id: 실행 식별자 (기본값: 시각 + 임의 문자열)
+        :param run_date: 실행 일자 YYYY-MM-DD (파티션 키, 기본값: 오늘)
+        """
+        run_id = run_id or new_run_id()
+        run_date = run_date or datetime.now().strftime("%Y-%m-%d")
+
+        rows, self._rows = self._rows, defaultdict(list)
+        for table, table_rows in rows.items():
+            df = apply_schema(pd.DataFrame(table_rows), RESULT_SCHEMAS.get(table, {}))
+            self._write(table, df, symbol, run_id, run_date)
+
+        if stats is not None:
+            df = apply_schema(pd.DataFrame([stats_to_row(stats)]), RESULT_SCHEMAS[STATS_TABLE])
+            self._write(STATS_TABLE, df, symbol, run_id, run_date)
+
+            profile = stats.get("_profile")
+            if profile is not None and not profile.empty:
+                self._write(PROFILE_TABLE, apply_schema(profile, RESULT_SCHEMAS[PROFILE_TABLE]), symbol, run_id, run_date)
+
+        return run_id
+
+
+    def _write(self, table: str, df: pd.DataFrame, symbol: str, run_id: str, run_date: str):
+        directory = os.path.join(self.root, table, f"symbol={symbol}", f"run_date={run_date}")
+        os.makedirs(directory, exist_ok=True)
+
+        # run_id는 파일 단위로 다시 지정, symbol은 파티션 컬럼이므로 데이터 컬럼에서 제외
+        df = df.drop(columns=["run_id", "symbol"], errors="ignore")
+        df.insert(0, "run_id", run_id)
+        path = os.path.join(directory, f"{run_id}.parquet")
+        tmp_path = os.path.join(directory, f".{run_id}.parquet.tmp")   # "."으로 시작하는 파일은 조회 시 무시됨
+        df.to_parquet(tmp_path, index=False)
+        os.replace(tmp_path, path)
+
+
+    # ---------------------------
+    # 🔍 조회
+    # ---------------------------
+    def query(self, table: str, columns: Optional[List[str]] = None, filters=None) -> pd.DataFrame:
+        """
+        저장된 결과를 조회합니다.
+        :param table: "score" / "trade" (LOG_TABLES 키), 테이블 이름 또는 "stats"
+        :param columns: 읽을 컬럼 (None이면 전체, symbol/run_date 파티션 컬럼도 지정 가능)
+        :param filters: pandas/pyarrow 형식 조건 (예: [("symbol", "=", "AAPL"), ("roi", "<", 0)])
+        """
+        table = LOG_TABLES.get(table, table)
+        path = os.path.join(self.root, table)
+        if not os.path.isdir(path):
+            return pd.DataFrame(columns=columns)
+
+        dataset = ds.dataset(path, format="parquet", partitioning=PARTITIONING)
+        expression = pq.filters_to_expression(filters) if filters else None
+        return dataset.to_table(columns=columns, filter=expression).to_pandas()
@@ -0,0 +1,174 @@
+import json
+import os
+import sqlite3
+from datetime import datetime
+from typing import Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+from config.config import PathConfig
+from indicators.cache import fingerprint
+
+
+"""
+🧾 run_registry
+
+백테스트 실행(run) 목록을 기록하는 SQLite 레지스트리입니다.
+- 실행마다 run_id, 종목, 전략, 파라미터(JSON), 데이터 지문(fingerprint), 기간, 소요 시간, 상태를 한 행으로 기록
+- 로그(SQLite/Parquet)의 run_id 컬럼과 조인하여 여러 실행 결과를 비교
+
+여러 프로세스가 같은 파일을 공유할 수 있도록 호출마다 짧은 연결을 열고 닫으며(WAL + busy timeout),
+각 실행은 자기 run_id 행만 Insert/Update 하므로 실행 간 충돌이 없습니다.
+"""
+
+RUN_TABLE = "runs"
+
+RUN_SCHEMA = {
+    "run_id": "TEXT PRIMARY KEY",
+    "symbol": "TEXT",
+    "strategy": "TEXT",
+    "params": "TEXT",               # JSON
+    "data_fingerprint": "TEXT",
+    "data_start": "TEXT",
+    "data_end": "TEXT",
+    "bars": "INTEGER",
+    "status": "TEXT",               # running / ok / failed
+    "error": "TEXT",
+    "started_at": "TEXT",
+    "finished_at": "TEXT",
+    "elapsed_sec": "REAL",
+    "pid": "INTEGER",
+}
+
+
+def strategy_params(strategy, overrides: Optional[Dict] = None) -> Dict:
+    """
+    전략 클래스의 파라미터(클래스 변수) 전체를 실행 시 지정값(overrides)으로 덮어써서 반환
+    - backtesting.Strategy 자체의 속성, 언더스코어로 시작하는 항목, 메서드/프로퍼티는 제외
+    """
+    params = {}
+    for cls in reversed(strategy.__mro__):
+        if cls is object or cls.__module__.startswith("backtesting"):
+            continue
+        for k, v in vars(cls).items():
+            if k.startswith("_") or callable(v) or isinstance(v, (property, staticmethod, classmethod)):
+                continue
+            params[k] = v
+    params.update(overrides or {})
+    return params
+
+
+def _json_value(value):
+    # 배열 값(사전 계산 지표 등)은 지문으로, Enum 등 JSON으로 표현할 수 없는 값은 문자열로 기록
+    if isinstance(value, np.ndarray) and value.dtype == object:
+        value = value.astype(str)     # 레짐(Enum) 배열 등
+    if isinstance(value, (np.ndarray, pd.Series, pd.DataFrame)):
+        return f"fingerprint:{fingerprint(value)}"
+    return getattr(value, "value", str(value))
+
+
+def _to_json(params: Dict) -> str:
+    return json.dumps(params, ensure_ascii=False, sort_keys=True, default=_json_value)
+
+
+def _timestamp(value) -> Optional[str]:
+    return value.isoformat() if hasattr(value, "isoformat") else (None if value is None else str(value))
+
+
+class RunRegistry:
+    """
+    실행 레지스트리
+
+    - start(run_id, ...): 실행 시작 기록 (status="running")
+    - finish(run_id, ...): 종료 시각/소요 시간/상태 기록
+    - get(run_id) / runs(...): 조회
+    """
+
+    def __init__(self, db_path: Optional[str] = None, timeout: float = 30.0):
+        self.db_path = db_path or PathConfig.RUN_REGISTRY_PATH
+        self.timeout = timeout
+        self._initialized = False
+
+
+    def _connect(self) -> sqlite3.Connection:
+        """ 호출마다 새 연결 (프로세스 간 공유, 다른 실행의 쓰기 중에는 timeout까지 대기) """
+        if not self._initialized:
+            os.makedirs(os.path.dirname(self.db_path) or ".", exist_ok=True)
+        conn = sqlite3.connect(self.db_path, timeout=self.timeout)
+        conn.row_factory = sqlite3.Row
+        if not self._initialized:
+            conn.execute("PRAGMA journal_mode=WAL")
+            cols = ', '.join(f'"{k}" {t}' for k, t in RUN_SCHEMA.items())
+            with conn:
+                conn.execute(f'CREATE TABLE IF NOT EXISTS "{RUN_TABLE}" ({cols})')
+                conn.execute(f'CREATE INDEX IF NOT EXISTS "idx_{RUN_TABLE}_symbol" ON "{RUN_TABLE}" ("symbol", "started_at")')
+            self._initialized = True
+        return conn
+
+
+    def start(self, run_id: str, symbol: Optional[str], strategy, params: Dict, data: pd.DataFrame):
+        """
+        실행 시작을 기록합니다.
+        :param strategy: 전략 클래스
+        :param params: 실행 파라미터 (strategy_params() 결과)
+        :param data: 백테스트 OHLCV (데이터 지문/기간 기록용)
+        """
+        row = {
+            "run_id": run_id,
+            "symbol": symbol,
+            "strategy": getattr(strategy, "__name__", str(strategy)),
+            "params": _to_json(params),
+            "data_fingerprint": fingerprint(data),
+            "data_start": _timestamp(data.index[0]) if len(data) else None,
+            "data_end": _timestamp(data.index[-1]) if len(data) else None,
+            "bars": len(data),
+            "status": "running",
+            "started_at": datetime.now().isoformat(timespec="milliseconds"),
+            "pid": os.getpid(),
+        }
+        cols = ', '.join(f'"{k}"' for k in row)
+        placeholders = ', '.join(['?'] * len(row))
+        with self._connect() as conn:
+            conn.execute(f'INSERT INTO "{RUN_TABLE}" ({cols}) VALUES ({placeholders})', list(row.values()))
+        conn.close()
+
+
+    def finish(self, run_id: str, elapsed_sec: float, status: str = "ok", error: Optional[str] = None):
+        """ 실행 종료를 기록합니다. """
+        with self._connect() as conn:
+            conn.execute(
+                f'UPDATE "{RUN_TABLE}" SET status = ?, error = ?, finished_at = ?, elapsed_sec = ? WHERE run_id = ?',
+                (status, error, datetime.now().isoformat(timespec="milliseconds"), elapsed_sec, run_id),
+            )
+        conn.close()
+
+
+    def get(self, run_id: str) -> Optional[Dict]:
+        """ 실행 하나를 조회합니다. (params는 dict로 변환, 없으면 None) """
+        conn = self._connect()
+        try:
+            row = conn.execute(f'SELECT * FROM "{RUN_TABLE}" WHERE run_id = ?', (run_id,)).fetchone()
+        finally:
+            conn.close()
+        if row is None:
+            return None
+        row = dict(row)
+        row["params"] = json.loads(row["params"]) if row["params"] else {}
+        return row
+
+
+    def runs(self, symbol: Optional[str] = None, status: Optional[str] = None) -> pd.DataFrame:
+        """ 실행 목록을 시작 순서대로 조회합니다. """
+        conditions, args = [], []
+        for col, value in (("symbol", symbol), ("status", status)):
+            if value is not None:
+                conditions.append(f'"{col}" = ?')
+                args.append(value)
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+
+        conn = self._connect()
+        try:
+            return pd.read_sql(f'SELECT * FROM "{RUN_TABLE}"{where} ORDER BY started_at, rowid', conn, params=args)
+        finally:
+            conn.close()
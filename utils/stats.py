@@ -0,0 +1,26 @@
+import numbers
+
+import pandas as pd
+
+
+def convert_stats_to_vertical_dict(stats_obj):
+    """ stats 객체를 {항목명: 값} 형태의 딕셔너리로 변환 """
+    series = pd.Series(stats_obj)
+    return {k: str(v) if not isinstance(v, (str, int, float)) else v for k, v in series.items()}
+
+
+def stats_to_row(stats_obj) -> dict:
+    """
+    stats 객체를 결과 테이블의 한 행(dict)으로 변환
+    - _strategy, _equity_curve, _trades 같은 내부 항목(언더스코어 시작)은 제외
+    - 숫자 항목은 숫자 그대로 유지 (정렬/랭킹용), 그 외(기간, 날짜 등)는 문자열로 변환
+    """
+    row = {}
+    for k, v in pd.Series(stats_obj).items():
+        if k.startswith("_"):
+            continue
+        if isinstance(v, numbers.Number):
+            row[k] = v.item() if hasattr(v, "item") else v
+        else:
+            row[k] = str(v)
+    return row